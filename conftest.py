@@ -10,6 +10,9 @@ _studio_setup_completed = False
 
 def pytest_configure(config):
     """Add metadata to report"""
+    # Fix the entity registry run id before any worker process starts
+    from utils.entity_registry import current_run_id
+    current_run_id()
     if hasattr(config, '_metadata'):
         config._metadata['Project'] = 'DIGIT Studio API Automation'
         config._metadata['Tenant'] = 'st'
@@ -90,6 +93,14 @@ def pytest_runtest_setup(item):
         _studio_setup_completed = False
 
 
+def pytest_sessionfinish(session, exitstatus):
+    """Return a leased pool service and let a background pool top-up finish"""
+    from utils.service_pool import SERVICE_POOL_ENABLED
+    if SERVICE_POOL_ENABLED:
+        from tests.test_service_pool import release_session_lease
+        release_session_lease()
+
+
 @pytest.hookimpl(optionalhook=True)
 def pytest_html_results_summary(prefix, summary, postfix):
     """Add summary with output file data"""
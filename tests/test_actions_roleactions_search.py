@@ -32,6 +32,7 @@ def test_actions_search():
         "MdmsCriteria": {
             "tenantId": tenantId,
             "schemaCode": "ACCESSCONTROL-ACTIONS-TEST.actions-test",
+            "isActive": True,
             "limit": 10000000
         }
     }
@@ -95,6 +96,7 @@ def test_roleactions_search():
         "MdmsCriteria": {
             "tenantId": tenantId,
             "schemaCode": "ACCESSCONTROL-ROLEACTIONS.roleactions",
+            "isActive": True,
             "limit": 10000000
         }
     }
@@ -4,6 +4,8 @@ from utils.data_loader import load_payload
 from utils.auth import get_auth_token
 from utils.request_info import get_request_info
 from utils.config import tenantId
+from utils.workflow_lag import probe_transition
+from utils.entity_registry import record_entity
 import time, json, os
 
 MDMS_FILE = "output/mdms_response.json"
@@ -24,28 +26,40 @@ def get_client():
     return token, client
 
 
-def test_application_create(request):
-    token, client = get_client()
-    mdms, svc = load_json(MDMS_FILE), load_json(SERVICE_FILE)
-    module, service, service_code = mdms["module"], mdms["service"], svc["service_code"]
-    
+def _create_application(token, client, module, service, service_code, action="APPLIED", mobile_number=None):
+    """Internal: Create one application for the service and return its details."""
     payload = load_payload("Application", "create_application.json")
     payload["RequestInfo"] = get_request_info(token)
     payload["Application"]["tenantId"] = tenantId
     payload["Application"]["module"] = module
     payload["Application"]["businessService"] = service
     payload["Application"]["serviceCode"] = service_code
+    payload["Application"]["Workflow"]["action"] = action
     payload["Application"]["Workflow"]["businessService"] = f"{module}.{service}"
     
     # Also update address tenantId
     if "address" in payload["Application"]:
         payload["Application"]["address"]["tenantId"] = tenantId
     
+    # Override applicant mobile (load tests need a distinct individual per application)
+    if mobile_number is not None:
+        payload["Application"]["applicants"][0]["mobileNumber"] = mobile_number
+    
     res = client.post(f"/public-service/v1/application/{service_code}", payload)
     assert res.status_code in [200, 201, 202], f"Failed: {res.text}"
+    completed_at = time.time()
     
     app = res.json().get("Application") or res.json().get("application")
     app = app[0] if isinstance(app, list) else app
+    
+    record_entity("Application", app.get("applicationNumber"), label="Application Number",
+                  module=module, service=service, service_code=service_code, application_id=app.get("id"))
+    
+    return {**_application_details(app, module, service, service_code), "last_transition_time": completed_at}
+
+
+def _application_details(app, module, service, service_code):
+    """Internal: The fields later workflow actions need, from a create or search response."""
     audit = app.get("auditDetails", {})
     
     # Extract applicant details including mobile number
@@ -62,7 +76,7 @@ def test_application_create(request):
     if mobile_number is not None:
         mobile_number = str(mobile_number)
     
-    result = {
+    return {
         "module": module, 
         "service": service, 
         "service_code": service_code,
@@ -79,27 +93,39 @@ def test_application_create(request):
         "created_time": audit.get("createdTime"), 
         "last_modified_time": audit.get("lastModifiedTime")
     }
+
+
+def test_application_create(request):
+    token, client = get_client()
+    mdms, svc = load_json(MDMS_FILE), load_json(SERVICE_FILE)
+    module, service, service_code = mdms["module"], mdms["service"], svc["service_code"]
+    
+    result = _create_application(token, client, module, service, service_code)
     save_json(result, APP_FILE)
     
+    # Wait (bounded) for the workflow to reflect the new application and record the lag
+    probe = None
+    if result["workflow_status"]:
+        probe = probe_transition(result["application_number"], f"{module}.{service}", "APPLIED",
+                                 result["workflow_status"], result["last_transition_time"])
+    
     # Store for HTML report
     if request:
         request.node._test_result = {
             "Module": module,
             "Service": service,
             "Service Code": service_code,
-            "Application Number": app.get("applicationNumber"),
-            "Mobile Number": mobile_number,
-            "Workflow Status": app.get("workflowStatus") or "PENDING_FOR_ASSIGNMENT"
+            "Application Number": result["application_number"],
+            "Mobile Number": result["mobile_number"],
+            "Workflow Status": result["workflow_status"] or "PENDING_FOR_ASSIGNMENT",
+            "Workflow Lag": f"{probe['lag']}s" if probe and probe["reached"] else "⚠️ Not observed"
         }
     
     return result
 
 
-def _update_application(action, request=None):
-    token, client = get_client()
-    mdms, app_data = load_json(MDMS_FILE), load_json(APP_FILE)
-    module, service = mdms["module"], mdms["service"]
-    
+def _put_application_action(token, client, module, service, app_data, action):
+    """Internal: Apply a workflow action to an application; updates app_data in place."""
     payload = load_payload("Application", "update_application.json")
     payload["RequestInfo"] = get_request_info(token)
     payload["Application"]["id"] = app_data["application_id"]
@@ -130,6 +156,7 @@ def _update_application(action, request=None):
     
     res = client.put(f"/public-service/v1/application/{app_data['service_code']}", payload)
     assert res.status_code in [200, 201, 202], f"Failed: {res.text}"
+    completed_at = time.time()
     
     app = res.json().get("Application") or res.json().get("application")
     app = app[0] if isinstance(app, list) else app
@@ -137,9 +164,32 @@ def _update_application(action, request=None):
     audit = app.get("auditDetails", {})
     app_data["last_modified_by"] = audit.get("lastModifiedBy")
     app_data["last_modified_time"] = audit.get("lastModifiedTime")
+    app_data["workflow_status"] = app.get("workflowStatus") or app_data.get("workflow_status")
+    app_data["last_transition_time"] = completed_at
+    return app
+
+
+def _update_application(action, request=None):
+    token, client = get_client()
+    mdms, app_data = load_json(MDMS_FILE), load_json(APP_FILE)
+    module, service = mdms["module"], mdms["service"]
+    
+    app = _put_application_action(token, client, module, service, app_data, action)
+    completed_at = app_data["last_transition_time"]
     save_json(app_data, APP_FILE)
     
-    result = {"application_number": app.get("applicationNumber"), "action": action, "status": app.get("workflowStatus")}
+    # Wait (bounded) for the process instance to reach the new state and record the lag
+    probe = None
+    if app.get("workflowStatus"):
+        probe = probe_transition(app_data["application_number"], f"{module}.{service}", action,
+                                 app.get("workflowStatus"), completed_at)
+    
+    result = {
+        "application_number": app.get("applicationNumber"),
+        "action": action,
+        "status": app.get("workflowStatus"),
+        "workflow_lag": probe["lag"] if probe and probe["reached"] else None
+    }
     
     # Store for HTML report
     if request:
@@ -148,7 +198,8 @@ def _update_application(action, request=None):
             "Action": action,
             "New Status": app.get("workflowStatus"),
             "Module": module,
-            "Service": service
+            "Service": service,
+            "Workflow Lag": f"{result['workflow_lag']}s" if result["workflow_lag"] is not None else "⚠️ Not observed"
         }
     
     return result
@@ -1,5 +1,6 @@
 from utils.api_client import APIClient
 from utils.auth import get_auth_token
+from utils.request_info import get_request_info
 from utils.config import tenantId, BASE_URL
 import json
 import requests
@@ -13,15 +14,11 @@ def get_token():
     return get_auth_token("user")
 
 
-def test_application_search():
-    """Search and validate application exists"""
-    token = get_token()
-    app_data = load_json(APP_FILE)
-    
-    service_code = app_data["service_code"]
-    application_number = app_data["application_number"]
-    
-    url = f"{BASE_URL}/public-service/v1/application/{service_code}?tenantId={tenantId}&applicationNumber={application_number}&limit=10&offset=0"
+def _get_applications(token, service_code, application_number=None, limit=10, offset=0):
+    """Helper: GET /public-service/v1/application/{service_code}; returns the application list"""
+    url = f"{BASE_URL}/public-service/v1/application/{service_code}?tenantId={tenantId}&limit={limit}&offset={offset}"
+    if application_number:
+        url += f"&applicationNumber={application_number}"
     
     # Use auth-token header (not Bearer)
     headers = {
@@ -35,7 +32,40 @@ def test_application_search():
     
     data = res.json()
     apps = data.get("Application") or data.get("application") or data.get("applications") or []
-    apps = apps if isinstance(apps, list) else [apps]
+    return apps if isinstance(apps, list) else [apps]
+
+
+def _post_search_applications(token, criteria):
+    """Helper: POST /public-service/application/v1/_search; returns the application list"""
+    url = f"{BASE_URL}/public-service/application/v1/_search"
+    
+    headers = {
+        "Content-Type": "application/json",
+        "auth-token": token,
+        "x-tenant-id": tenantId
+    }
+    
+    payload = {
+        "ApplicationSearchCriteria": {**criteria, "tenantId": tenantId},
+        "RequestInfo": get_request_info(token)
+    }
+    
+    res = requests.post(url, json=payload, headers=headers)
+    assert res.status_code == 200, f"Search failed: {res.text}"
+    
+    data = res.json()
+    return data.get("Applications") or data.get("applications") or []
+
+
+def test_application_search():
+    """Search and validate application exists"""
+    token = get_token()
+    app_data = load_json(APP_FILE)
+    
+    service_code = app_data["service_code"]
+    application_number = app_data["application_number"]
+    
+    apps = _get_applications(token, service_code, application_number)
     
     assert len(apps) > 0, f"Application not found: {application_number}"
     
@@ -59,20 +89,7 @@ def test_application_search_by_service_code():
     
     service_code = app_data["service_code"]
     
-    url = f"{BASE_URL}/public-service/v1/application/{service_code}?tenantId={tenantId}&limit=10&offset=0"
-    
-    headers = {
-        "Content-Type": "application/json",
-        "auth-token": token,
-        "x-tenant-id": tenantId
-    }
-    
-    res = requests.get(url, headers=headers)
-    assert res.status_code == 200, f"Search failed: {res.text}"
-    
-    data = res.json()
-    apps = data.get("Application") or data.get("application") or data.get("applications") or []
-    apps = apps if isinstance(apps, list) else [apps]
+    apps = _get_applications(token, service_code)
     
     assert len(apps) > 0, f"No applications found for service: {service_code}"
     
@@ -0,0 +1,102 @@
+"""
+Application Search Pagination Benchmark
+Walks application search by service code to deep offsets across page sizes and
+compares GET /public-service/v1/application/{code} with
+POST /public-service/application/v1/_search, to show whether offset pagination
+slows down as a service accumulates applications.
+
+Skipped unless PERF_TESTS=true. Tuning:
+    PAGINATION_PAGE_SIZES   comma-separated page sizes (default "10,50,100")
+    PAGINATION_OFFSETS      comma-separated offsets (default "0,100,500,1000,5000,10000")
+    PAGINATION_REPEATS      requests per point; the median is reported (default 3)
+"""
+import pytest
+import json
+import os
+from utils.auth import get_auth_token
+from utils.config import perf_enabled
+from utils.perf import percentile, timed
+from tests.test_application_search import _get_applications, _post_search_applications
+
+APP_FILE = "output/application_response.json"
+SERVICE_FILE = "output/public_service_response.json"
+PAGINATION_OUTPUT_FILE = "output/application_search_pagination_benchmark.json"
+
+PAGE_SIZES = [int(v) for v in os.getenv("PAGINATION_PAGE_SIZES", "10,50,100").split(",") if v.strip()]
+OFFSETS = [int(v) for v in os.getenv("PAGINATION_OFFSETS", "0,100,500,1000,5000,10000").split(",") if v.strip()]
+REPEATS = int(os.getenv("PAGINATION_REPEATS", "3"))
+
+
+def load_json(path):
+    try:
+        return json.load(open(path))
+    except FileNotFoundError:
+        return {}
+
+
+def save_json(data, path):
+    os.makedirs("output", exist_ok=True)
+    json.dump(data, open(path, "w"), indent=2)
+
+
+SEARCH_PATHS = {
+    "GET /public-service/v1/application/{code}":
+        lambda token, code, limit, offset: _get_applications(token, code, limit=limit, offset=offset),
+    "POST /public-service/application/v1/_search":
+        lambda token, code, limit, offset: _post_search_applications(
+            token, {"serviceCode": code, "limit": limit, "offset": offset}
+        )
+}
+
+
+def _measure(search, token, service_code, limit, offset):
+    """Median latency (s) and rows returned for one (page size, offset) point."""
+    latencies, rows = [], 0
+    for _ in range(REPEATS):
+        apps, elapsed = timed(search, token, service_code, limit, offset)
+        latencies.append(elapsed)
+        rows = len(apps)
+    return {"page_size": limit, "offset": offset, "rows": rows, "latency": round(percentile(latencies, 50), 4)}
+
+
+def _print_chart(path, points):
+    """Latency table: one row per offset, one column per page size, plus a bar for the largest page."""
+    by_point = {(p["offset"], p["page_size"]): p for p in points}
+    slowest = max((p["latency"] for p in points), default=0) or 1
+
+    print(f"\n📈 {path}")
+    print("   offset   " + "".join(f"{f'limit={s}':>14}" for s in PAGE_SIZES))
+    for offset in OFFSETS:
+        cells = "".join(f"{by_point[(offset, s)]['latency']:>13.3f}s" for s in PAGE_SIZES)
+        bar = "█" * int(30 * by_point[(offset, PAGE_SIZES[-1])]["latency"] / slowest)
+        print(f"   {offset:>7}  {cells}  {bar}")
+
+
+def test_application_search_pagination_benchmark(request):
+    """Chart application search latency against offset and page size for both search paths."""
+    if not perf_enabled:
+        pytest.skip("Perf tests disabled - set PERF_TESTS=true")
+
+    service_code = load_json(APP_FILE).get("service_code") or load_json(SERVICE_FILE).get("service_code")
+    if not service_code:
+        pytest.skip("No service_code - run service setup first")
+
+    token = get_auth_token("user")
+    report = {"service_code": service_code, "repeats": REPEATS, "paths": {}}
+
+    for path, search in SEARCH_PATHS.items():
+        points = [_measure(search, token, service_code, size, offset) for offset in OFFSETS for size in PAGE_SIZES]
+        report["paths"][path] = points
+        _print_chart(path, points)
+
+    save_json(report, PAGINATION_OUTPUT_FILE)
+
+    if request:
+        result = {"Service Code": service_code}
+        for path, points in report["paths"].items():
+            first = next(p for p in points if p["offset"] == OFFSETS[0] and p["page_size"] == PAGE_SIZES[0])
+            deepest = next(p for p in points if p["offset"] == OFFSETS[-1] and p["page_size"] == PAGE_SIZES[0])
+            result[path] = f"{first['latency']}s @ offset {OFFSETS[0]} → {deepest['latency']}s @ offset {OFFSETS[-1]}"
+        request.node._test_result = result
+
+    return report
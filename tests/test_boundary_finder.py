@@ -0,0 +1,269 @@
+"""
+Boundary Finder
+Binary-searches the exact limits the APIs enforce instead of probing fixed
+sizes:
+    - field lengths: MDMS draft module/service, applicant name, checklist text answer
+    - array counts: draft workflow states, draft form fields, checklist definition attributes
+Each limit takes O(log n) requests (see utils/boundary_search.find_limit).
+Large probes use {{REPEAT_A_<n>}} so multi-megabyte values are streamed.
+Every accepted probe creates a real record (draft, application, checklist or
+checklist definition); each is recorded in the entity registry so teardown
+can find it.
+
+Skipped unless PERF_TESTS=true. Tuning:
+    BOUNDARY_MAX_LENGTH   largest field length probed (default 10485760)
+    BOUNDARY_MAX_ITEMS    largest array size probed (default 10000)
+    BOUNDARY_TARGETS      comma-separated subset of target names (default all)
+"""
+import pytest
+import copy
+import json
+import os
+import uuid
+import requests
+from utils.auth import get_auth_token
+from utils.config import tenantId, perf_enabled, perf_concurrency
+from utils.data_loader import load_payload
+from utils.entity_registry import record_response
+from utils.perf import run_concurrently
+from utils.boundary_search import find_limit
+from utils.request_info import get_request_info
+from tests.test_data_driven import (
+    api_request, send, get_headers, mdms_request,
+    build_mdms_draft_request, build_application_request, build_checklist_request
+)
+from tests.test_checklist_create import get_checklists_from_payload, search_checklist_definition, build_attributes_from_definition
+
+MDMS_FILE = "output/mdms_response.json"
+BOUNDARY_OUTPUT_FILE = "output/boundary_limits.json"
+
+BOUNDARY_MAX_LENGTH = int(os.getenv("BOUNDARY_MAX_LENGTH", str(10 * 1024 * 1024)))
+BOUNDARY_MAX_ITEMS = int(os.getenv("BOUNDARY_MAX_ITEMS", "10000"))
+BOUNDARY_TARGETS = [t.strip() for t in os.getenv("BOUNDARY_TARGETS", "").split(",") if t.strip()]
+
+CHECKLIST_DEF_CREATE_PATH = "/health-service-request/service/definition/v1/_create"
+APP_FILE = "output/application_response.json"
+
+# What an accepted probe creates: (entity type, label, response keys, id field)
+DRAFT_ENTITY = ("Service Draft", None, ("Mdms", "mdms"), "id")
+APPLICATION_ENTITY = ("Application", "Application Number", ("Application", "application"), "applicationNumber")
+CHECKLIST_ENTITY = ("Checklist", None, ("Services", "services", "Service", "service"), "id")
+DEFINITION_ENTITY = ("Checklist Definition", None,
+                     ("ServiceDefinition", "serviceDefinition", "ServiceDefinitions", "serviceDefinitions"), "code")
+
+
+def load_json(path):
+    try:
+        return json.load(open(path))
+    except FileNotFoundError:
+        return {}
+
+
+def save_json(data, path):
+    os.makedirs("output", exist_ok=True)
+    json.dump(data, open(path, "w"), indent=2)
+
+
+def repeat(n):
+    """Placeholder for an n-character value; streamed when large."""
+    return f"{{{{REPEAT_A_{n}}}}}"
+
+
+def unique_id(prefix):
+    return f"{prefix}-{uuid.uuid4().hex[:12]}"
+
+
+def accepted(req, entity, **details):
+    """
+    True when the API accepted the probe; the created entity is recorded.
+    A dropped connection or reset on an oversize body is the server rejecting it.
+    """
+    try:
+        res = send(req)
+    except requests.RequestException:
+        return False
+    if not 200 <= res.status_code < 300:
+        return False
+    entity_type, label, keys, id_field = entity
+    record_response(entity_type, res, keys, id_field, label, source="boundary_finder", **details)
+    return True
+
+
+def _e2e_owner():
+    mdms = load_json(MDMS_FILE)
+    return {"module": mdms.get("module"), "service": mdms.get("service")}
+
+
+# =============================================================================
+# Field-length probes: accepts(n, token) -> bool
+# =============================================================================
+def _draft_field(field):
+    def probe(n, token):
+        data = {"module": "BoundaryModule", "service": "BoundaryService", "unique_id": unique_id("boundary-draft")}
+        data[field] = repeat(n)
+        return accepted(build_mdms_draft_request({"name": "boundary", "data": data}, token), DRAFT_ENTITY,
+                        unique_id=data["unique_id"])
+    return probe
+
+
+def _applicant_name(n, token):
+    return accepted(build_application_request({"name": "boundary", "data": {"name": repeat(n)}}, token),
+                    APPLICATION_ENTITY, service_code=load_json(APP_FILE).get("service_code"), **_e2e_owner())
+
+
+def _checklist_text_answer(n, token):
+    definition = _text_checklist_definition(token)
+    attributes = build_attributes_from_definition(definition)
+    for attr in attributes:
+        if attr["dataType"] == "text":
+            attr["value"] = repeat(n)
+            break
+    scenario = {"name": "boundary", "service_def_id": definition["id"], "account_id": unique_id("boundary-account"),
+                "attributes": attributes}
+    return accepted(build_checklist_request(scenario, token), CHECKLIST_ENTITY, **_e2e_owner())
+
+
+# =============================================================================
+# Array-size probes
+# =============================================================================
+def _draft_workflow_states(n, token):
+    data = {
+        "module": "BoundaryModule",
+        "service": "BoundaryService",
+        "unique_id": unique_id("boundary-draft"),
+        "workflow": [{"state": f"STATE_{i}", "actions": ["APPLY"]} for i in range(n)]
+    }
+    return accepted(build_mdms_draft_request({"name": "boundary", "data": data}, token), DRAFT_ENTITY,
+                    module="BoundaryModule", service="BoundaryService", unique_id=data["unique_id"])
+
+
+def _draft_fields(n, token):
+    template = load_payload("mdms/templates/fields", "simple_text.json")
+    field = template["properties"][0]
+    properties = [{**field, "name": f"field{i}", "label": f"Field {i}", "orderNumber": i + 1} for i in range(n)]
+    fields = [{**template, "properties": properties}]
+    draft_id = unique_id("boundary-draft")
+    req = mdms_request(token, draft_id, {"module": "BoundaryModule", "service": "BoundaryService", "fields": fields})
+    return accepted(req, DRAFT_ENTITY, module="BoundaryModule", service="BoundaryService", unique_id=draft_id)
+
+
+def _checklist_definition_attributes(n, token):
+    attributes = [
+        {"code": f"BOUNDARY_Q{i}", "dataType": "Text", "values": None, "required": False, "isActive": True, "order": i + 1}
+        for i in range(n)
+    ]
+    payload = {
+        "ServiceDefinition": {
+            "tenantId": tenantId,
+            "code": unique_id("BOUNDARY.CHECKLIST"),
+            "isActive": True,
+            "attributes": attributes
+        },
+        "RequestInfo": get_request_info(token)
+    }
+    return accepted(api_request("POST", CHECKLIST_DEF_CREATE_PATH, payload, get_headers(token)), DEFINITION_ENTITY,
+                    code=payload["ServiceDefinition"]["code"])
+
+
+# Cached checklist definition with a free-text attribute, shared by probes
+_text_definition = {}
+
+
+def _text_checklist_definition(token):
+    if "definition" not in _text_definition:
+        service = load_json(MDMS_FILE).get("service")
+        for checklist in get_checklists_from_payload():
+            code = f"{service}.{checklist.get('state')}.{checklist.get('name')}"
+            definition = search_checklist_definition(code, token)
+            if definition and any(a["dataType"] == "text" for a in build_attributes_from_definition(definition)):
+                _text_definition["definition"] = definition
+                break
+        else:
+            return None
+    return copy.deepcopy(_text_definition["definition"])
+
+
+# name -> (probe, kind)
+BOUNDARY_PROBES = {
+    "mdms_draft.module": (_draft_field("module"), "length"),
+    "mdms_draft.service": (_draft_field("service"), "length"),
+    "application.applicant_name": (_applicant_name, "length"),
+    "checklist.text_answer": (_checklist_text_answer, "length"),
+    "mdms_draft.workflow_states": (_draft_workflow_states, "items"),
+    "mdms_draft.fields": (_draft_fields, "items"),
+    "checklist_definition.attributes": (_checklist_definition_attributes, "items")
+}
+
+
+def _unavailable(name, token):
+    """
+    Why a target cannot run yet, or None. Checked before the worker pool starts:
+    pytest.skip raised inside a worker thread would escape the pool.
+    """
+    mdms, app = load_json(MDMS_FILE), load_json(APP_FILE)
+    if name.startswith(("application.", "checklist.")) and (not mdms.get("module") or not mdms.get("service")):
+        return "No MDMS data - run service setup first"
+    if name == "application.applicant_name" and not app.get("service_code"):
+        return "No application data - run application creation first"
+    if name == "checklist.text_answer":
+        if not app.get("application_id"):
+            return "No application - run application tests first"
+        if _text_checklist_definition(token) is None:
+            return "No checklist definition with a text attribute - run service setup first"
+    return None
+
+
+def _find(name, token):
+    probe, kind = BOUNDARY_PROBES[name]
+    cap = BOUNDARY_MAX_LENGTH if kind == "length" else BOUNDARY_MAX_ITEMS
+    result = find_limit(lambda n: probe(n, token), low=1, cap=cap)
+    return {"target": name, "kind": kind, "cap": cap, "requests": len(result["probes"]), **result}
+
+
+def test_boundary_limits(request):
+    """Report the exact accepted maximum for each field length and array size."""
+    if not perf_enabled:
+        pytest.skip("Perf tests disabled - set PERF_TESTS=true")
+
+    token = get_auth_token("user")
+    targets = BOUNDARY_TARGETS or list(BOUNDARY_PROBES)
+
+    print(f"\n{'='*60}")
+    print(f"📏 BOUNDARY FINDER ({len(targets)} targets)")
+    print(f"{'='*60}")
+
+    limits = {}
+    for name in targets:
+        reason = _unavailable(name, token)
+        if reason:
+            print(f"   ⏭️ {name}: {reason}")
+            limits[name] = {"target": name, "skipped": reason}
+    runnable = [name for name in targets if name not in limits]
+
+    # Each search is sequential; independent targets run side by side
+    results, wall = run_concurrently(lambda name: _find(name, token), runnable, perf_concurrency)
+
+    for name, r in zip(runnable, results):
+        if r.get("success") is False:
+            print(f"   ❌ {name}: {r['error']}")
+            limits[name] = r
+            continue
+        if r["max_accepted"] is None:
+            summary = "rejected even at size 1"
+        elif r["min_rejected"] is None:
+            summary = f"accepted up to cap {r['cap']}"
+        else:
+            summary = f"max {r['max_accepted']}"
+        print(f"   📏 {name}: {summary} ({r['requests']} requests)")
+        limits[name] = r
+
+    save_json({"duration": round(wall, 2), "limits": limits}, BOUNDARY_OUTPUT_FILE)
+
+    if request:
+        request.node._test_result = {
+            name: (f"{r['max_accepted']} ({r['requests']} requests)" if r.get("requests")
+                   else r.get("error") or f"Skipped: {r.get('skipped')}")
+            for name, r in limits.items()
+        }
+
+    return limits
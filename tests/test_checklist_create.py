@@ -264,7 +264,8 @@ def create_and_submit_checklist_for_state(state, token, service, account_id, use
             "code": code,
             "service_id": service_id,
             "service_def_id": service_def_id,
-            "created": False
+            "created": False,
+            "elapsed": res.elapsed.total_seconds()
         }
     
     # Create new with SUBMIT action directly (like UI does)
@@ -292,7 +293,8 @@ def create_and_submit_checklist_for_state(state, token, service, account_id, use
         "code": code,
         "service_id": service_id,
         "service_def_id": service_def_id,
-        "created": True
+        "created": True,
+        "elapsed": res.elapsed.total_seconds()
     }
 
 
@@ -0,0 +1,192 @@
+"""
+Checklist Response Stress Mode
+Creates and submits checklist responses for N applications (accountIds) x M
+checklist definitions with configurable concurrency, then reports create/update
+throughput, p95/p99 latency and how service/v1/_search by accountId degrades as
+the number of stored responses grows.
+
+Skipped unless PERF_TESTS=true. Tuning:
+    CHECKLIST_STRESS_ACCOUNTS     number of applications to create (default 20)
+    CHECKLIST_STRESS_DEFINITIONS  number of checklist definitions to use (default 0 = all)
+    CHECKLIST_STRESS_STEPS        volume steps for the search degradation curve (default 4)
+    PERF_CONCURRENCY              worker threads (default 8)
+"""
+import pytest
+import json
+import os
+import random
+from utils.api_client import APIClient
+from utils.auth import get_auth_token
+from utils.request_info import get_request_info
+from utils.config import tenantId, perf_enabled, perf_concurrency
+from utils.perf import summarize_latencies, run_concurrently, throughput, timed
+from tests.test_application import _create_application
+from tests.test_checklist_create import (
+    get_checklists_from_payload,
+    create_and_submit_checklist_for_state,
+    search_checklist_service
+)
+
+MDMS_FILE = "output/mdms_response.json"
+SERVICE_FILE = "output/public_service_response.json"
+STRESS_OUTPUT_FILE = "output/checklist_stress_response.json"
+
+STRESS_ACCOUNTS = int(os.getenv("CHECKLIST_STRESS_ACCOUNTS", "20"))
+STRESS_DEFINITIONS = int(os.getenv("CHECKLIST_STRESS_DEFINITIONS", "0"))
+STRESS_STEPS = int(os.getenv("CHECKLIST_STRESS_STEPS", "4"))
+SEARCH_SAMPLES = 20
+
+
+def load_json(path):
+    return json.load(open(path))
+
+
+def save_json(data, path):
+    os.makedirs("output", exist_ok=True)
+    json.dump(data, open(path, "w"), indent=2)
+
+
+def get_client():
+    token = get_auth_token("user")
+    client = APIClient(token=token)
+    client.headers["x-tenant-id"] = tenantId
+    return token, client
+
+
+def _create_accounts(count, concurrency):
+    """Create `count` applications and return their ids (checklist accountIds)."""
+    token, client = get_client()
+    mdms, svc = load_json(MDMS_FILE), load_json(SERVICE_FILE)
+
+    def create(_):
+        return _create_application(token, client, mdms["module"], mdms["service"], svc["service_code"])
+
+    apps, wall = run_concurrently(create, range(count), concurrency)
+    account_ids = [a["application_id"] for a in apps if a.get("application_id")]
+    print(f"   ✅ Created {len(account_ids)}/{count} applications in {wall:.2f}s")
+    return account_ids
+
+
+def _submit_round(pairs, token, service, user_uuid, concurrency):
+    """Run create_and_submit_checklist_for_state for every (account_id, state) pair."""
+    def submit(pair):
+        account_id, state = pair
+        return create_and_submit_checklist_for_state(state, token, service, account_id, user_uuid)
+
+    return run_concurrently(submit, pairs, concurrency)
+
+
+def _search_latencies(account_ids, service_def_ids, token, concurrency):
+    """Time service/v1/_search by accountId for a random sample of accounts."""
+    sample = random.sample(account_ids, min(SEARCH_SAMPLES, len(account_ids)))
+    lookups = [(a, d) for a in sample for d in service_def_ids]
+
+    def search(lookup):
+        account_id, service_def_id = lookup
+        _, elapsed = timed(search_checklist_service, service_def_id, account_id, token)
+        return elapsed
+
+    latencies, _ = run_concurrently(search, lookups, concurrency)
+    return [l for l in latencies if isinstance(l, float)]
+
+
+def _checklist_stress(accounts, definitions, concurrency):
+    """Internal: Run the checklist stress mode and return the report."""
+    token = get_auth_token("user")
+    mdms = load_json(MDMS_FILE)
+    service = mdms["service"]
+    user_uuid = get_request_info(token).get("userInfo", {}).get("uuid", "")
+
+    states = [c["state"] for c in get_checklists_from_payload() if c.get("name") and c.get("state")]
+    if definitions:
+        states = states[:definitions]
+
+    print(f"\n{'='*60}")
+    print(f"🏋️ CHECKLIST STRESS: {accounts} accounts x {len(states)} definitions @ {concurrency} workers")
+    print(f"{'='*60}")
+
+    account_ids = _create_accounts(accounts, concurrency)
+    assert account_ids, "No applications created for stress run"
+    step_size = max(1, -(-len(account_ids) // max(1, STRESS_STEPS)))
+
+    create_latencies, create_wall, create_ok = [], 0.0, 0
+    service_def_ids = set()
+    search_curve = []
+    failures = []
+
+    # Phase 1: create in volume steps, measuring search after every step
+    for start in range(0, len(account_ids), step_size):
+        batch = account_ids[start:start + step_size]
+        pairs = [(a, s) for a in batch for s in states]
+        results, wall = _submit_round(pairs, token, service, user_uuid, concurrency)
+        create_wall += wall
+
+        for r in results:
+            if r.get("success"):
+                create_ok += 1
+                create_latencies.append(r["elapsed"])
+                service_def_ids.add(r["service_def_id"])
+            else:
+                failures.append(r.get("error"))
+
+        stored = create_ok
+        search_stats = summarize_latencies(
+            _search_latencies(account_ids[:start + len(batch)], sorted(service_def_ids), token, concurrency)
+        )
+        search_curve.append({"responses_stored": stored, **search_stats})
+        print(f"   📈 {stored} responses stored → search p95 {search_stats['p95']}s")
+
+    # Phase 2: submit again, taking the update path for existing responses
+    pairs = [(a, s) for a in account_ids for s in states]
+    results, update_wall = _submit_round(pairs, token, service, user_uuid, concurrency)
+    update_latencies = [r["elapsed"] for r in results if r.get("success")]
+    failures.extend(r.get("error") for r in results if not r.get("success"))
+
+    report = {
+        "module": mdms["module"],
+        "service": service,
+        "accounts": len(account_ids),
+        "definitions": len(states),
+        "concurrency": concurrency,
+        "create": {
+            "throughput_per_sec": throughput(len(create_latencies), create_wall),
+            **summarize_latencies(create_latencies)
+        },
+        "update": {
+            "throughput_per_sec": throughput(len(update_latencies), update_wall),
+            **summarize_latencies(update_latencies)
+        },
+        "search_by_account_curve": search_curve,
+        "failures": len(failures),
+        "sample_errors": failures[:5]
+    }
+    save_json(report, STRESS_OUTPUT_FILE)
+
+    print(f"\n📊 Create: {report['create']['throughput_per_sec']}/s p95={report['create']['p95']}s p99={report['create']['p99']}s")
+    print(f"📊 Update: {report['update']['throughput_per_sec']}/s p95={report['update']['p95']}s p99={report['update']['p99']}s")
+    print(f"📊 Failures: {len(failures)}")
+    return report
+
+
+def test_checklist_stress(request):
+    """Stress checklist create/submit across many accounts and definitions."""
+    if not perf_enabled:
+        pytest.skip("Perf tests disabled - set PERF_TESTS=true")
+
+    report = _checklist_stress(STRESS_ACCOUNTS, STRESS_DEFINITIONS, perf_concurrency)
+
+    if request:
+        first, last = report["search_by_account_curve"][0], report["search_by_account_curve"][-1]
+        request.node._test_result = {
+            "Accounts x Definitions": f"{report['accounts']} x {report['definitions']}",
+            "Concurrency": report["concurrency"],
+            "Create Throughput": f"{report['create']['throughput_per_sec']}/s",
+            "Create p95 / p99": f"{report['create']['p95']}s / {report['create']['p99']}s",
+            "Update Throughput": f"{report['update']['throughput_per_sec']}/s",
+            "Update p95 / p99": f"{report['update']['p95']}s / {report['update']['p99']}s",
+            "Search p95 (first → last step)": f"{first['p95']}s → {last['p95']}s",
+            "Failures": report["failures"]
+        }
+
+    assert report["create"]["count"] > 0, f"No checklist responses created: {report['sample_errors']}"
+    return report
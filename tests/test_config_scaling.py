@@ -0,0 +1,149 @@
+"""
+Service Configuration Scaling Benchmark
+Publishes generated service configurations of increasing size (see
+utils/service_config_generator.py) and measures how public-service-init
+provisioning time and public-service application create latency grow with
+the number of fields, checklists, workflow states and localization entries.
+
+Every size provisions a fresh module/service and waits until its roles,
+actions, idgen, workflow, checklists and localization are visible before
+creating applications; the time to readiness is reported next to init time.
+A size where too many application creates fail is reported invalid and fails
+the test. output/mdms_response.json and output/public_service_response.json
+are left untouched.
+
+Skipped unless PERF_TESTS=true. Tuning:
+    CONFIG_SCALE_SIZES         comma-separated fields:checklists:states:messages
+                               (default "10:3:5:10,100:10:10:100,500:30:25:1000")
+    CONFIG_SCALE_APP_SAMPLES   applications created per size (default 10)
+    CONFIG_SCALE_MAX_FAILURE_RATIO  failed application creates tolerated per size (default 0.2)
+    PERF_CONCURRENCY           worker threads for the application samples (default 8)
+    PROVISION_READY_TIMEOUT    seconds to wait for a service's artifacts (default 300)
+    PROVISION_POLL_INTERVAL    seconds between visibility checks (default 2)
+"""
+import pytest
+import json
+import os
+import time
+from utils.auth import get_auth_token
+from utils.config import tenantId, perf_enabled, perf_concurrency, provision_ready_timeout, provision_poll_interval
+from utils.perf import summarize_latencies, run_concurrently, timed
+from utils.service_config_generator import generate_service_config, config_size, fragment_cache_info
+from utils.service_readiness import expected_artifacts, wait_until_ready
+from tests.test_studio_services import _mdms_service_create, _public_service_init, random_name, replace_placeholders
+from tests.test_application import _create_application, get_client
+
+SCALING_OUTPUT_FILE = "output/config_scaling_benchmark.json"
+
+SIZE_KEYS = ("fields", "checklists", "states", "messages")
+SCALE_SIZES = [
+    dict(zip(SIZE_KEYS, map(int, size.split(":"))))
+    for size in os.getenv("CONFIG_SCALE_SIZES", "10:3:5:10,100:10:10:100,500:30:25:1000").split(",") if size.strip()
+]
+APP_SAMPLES = int(os.getenv("CONFIG_SCALE_APP_SAMPLES", "10"))
+MAX_FAILURE_RATIO = float(os.getenv("CONFIG_SCALE_MAX_FAILURE_RATIO", "0.2"))
+
+
+def save_json(data, path):
+    os.makedirs("output", exist_ok=True)
+    json.dump(data, open(path, "w"), indent=2)
+
+
+def _application_latencies(mdms, svc, samples, concurrency):
+    """Create `samples` applications against the service and return per-request latencies."""
+    token, client = get_client()
+
+    def create(_):
+        _, elapsed = timed(_create_application, token, client, mdms["module"], mdms["service"], svc["service_code"])
+        return elapsed
+
+    latencies, _ = run_concurrently(create, range(samples), concurrency)
+    return [l for l in latencies if isinstance(l, float)]
+
+
+def _measure(size):
+    """Provision one generated configuration and time init plus application creation."""
+    payload, generate_seconds = timed(generate_service_config, **size)
+    module, service = random_name("Module"), random_name("Service")
+
+    mdms, publish_seconds = timed(_mdms_service_create, module, service, payload=payload, save=False)
+    svc, init_seconds = timed(_public_service_init, mdms, save=False)
+    init_returned = time.time()
+
+    # Applications are only meaningful once the service is provisioned downstream
+    published = replace_placeholders(payload, {
+        "{{tenantId}}": tenantId,
+        "{{module}}": module,
+        "{{service}}": service,
+        "{{businessService}}": f"{module}.{service}"
+    })
+    ready = wait_until_ready(get_auth_token("user"), module, service, expected_artifacts(published, module, service),
+                             init_returned, provision_ready_timeout, provision_poll_interval)
+    not_ready = [a for a, v in ready.items() if v is None]
+
+    latencies = [] if not_ready else _application_latencies(mdms, svc, APP_SAMPLES, perf_concurrency)
+    failures = APP_SAMPLES - len(latencies)
+    invalid = None
+    if not_ready:
+        invalid = f"not ready after {provision_ready_timeout}s: {', '.join(not_ready)}"
+    elif failures > APP_SAMPLES * MAX_FAILURE_RATIO:
+        invalid = f"{failures}/{APP_SAMPLES} application creates failed"
+    return {
+        "size": config_size(payload),
+        "module": module,
+        "service": service,
+        "service_code": svc.get("service_code"),
+        "generate_seconds": round(generate_seconds, 4),
+        "publish_seconds": round(publish_seconds, 3),
+        "init_seconds": round(init_seconds, 3),
+        "ready_seconds": None if not_ready else max(ready.values()),
+        "ready": ready,
+        "application_create": summarize_latencies(latencies),
+        "application_failures": failures,
+        "invalid": invalid
+    }
+
+
+def _print_table(points):
+    print(f"\n   {'fields':>7} {'chkl':>5} {'states':>6} {'msgs':>6} {'KB':>7} {'publish':>8} {'init':>8} {'ready':>8} {'app p50':>8} {'app p95':>8}")
+    for p in points:
+        s, app = p["size"], p["application_create"]
+        ready = f"{p['ready_seconds']:>7.2f}s" if p["ready_seconds"] is not None else f"{'-':>8}"
+        print(f"   {s['fields']:>7} {s['checklists']:>5} {s['states']:>6} {s['messages']:>6} {s['bytes'] / 1024:>7.1f} "
+              f"{p['publish_seconds']:>7.2f}s {p['init_seconds']:>7.2f}s {ready} {app['p50']:>7.3f}s {app['p95']:>7.3f}s"
+              + (f"  ❌ {p['invalid']}" if p["invalid"] else ""))
+
+
+def test_config_scaling_benchmark(request):
+    """Chart provisioning time and application latency against service configuration size."""
+    if not perf_enabled:
+        pytest.skip("Perf tests disabled - set PERF_TESTS=true")
+
+    print(f"\n{'='*60}")
+    print(f"📐 CONFIG SCALING: {len(SCALE_SIZES)} sizes, {APP_SAMPLES} applications each (tenant {tenantId})")
+    print(f"{'='*60}")
+
+    points = []
+    for size in SCALE_SIZES:
+        print(f"\n   🏗️  Provisioning {size}")
+        points.append(_measure(size))
+
+    _print_table(points)
+    report = {"app_samples": APP_SAMPLES, "max_failure_ratio": MAX_FAILURE_RATIO, "points": points,
+              "fragment_cache": fragment_cache_info()}
+    save_json(report, SCALING_OUTPUT_FILE)
+
+    if request:
+        result = {}
+        for p in points:
+            s = p["size"]
+            label = f"{s['fields']}f/{s['checklists']}c/{s['states']}s/{s['messages']}m"
+            result[label] = (f"init {p['init_seconds']}s, ready {p['ready_seconds']}s, "
+                             f"app p95 {p['application_create']['p95']}s"
+                             + (f", {p['application_failures']} failed" if p["application_failures"] else "")
+                             + (f" ❌ invalid: {p['invalid']}" if p["invalid"] else ""))
+        request.node._test_result = result
+
+    invalid = {f"{p['module']}.{p['service']}": p["invalid"] for p in points if p["invalid"]}
+    assert not invalid, f"Invalid sizes: {invalid}"
+    return report
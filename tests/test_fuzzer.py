@@ -0,0 +1,275 @@
+"""
+Mutation Fuzzer
+Seeds from the payload files (application create, MDMS service config,
+public service init, checklist create) and sends structurally mutated copies:
+type swaps, nulls, dropped keys, deep nesting, hostile unicode and oversize
+values (see utils/fuzzer.py). A case that gets a 5xx or times out is a crash;
+crashes are minimized to the fewest/smallest mutations that still crash and
+written to the crash corpus.
+
+Public service init is fuzzed against a throwaway module/service whose
+configuration is published for the run, never the provisioned E2E service.
+Checklist mutants start from a real checklist definition of the E2E service
+(its id and attributes), so they reach validation instead of stopping at an
+unknown serviceDefId. When a seed cannot be built that way (no definition
+found), the restriction is listed under "seed_notes" in the report.
+Application and checklist mutants that the API accepts create real records;
+each one is recorded in the entity registry (utils/entity_registry.py) so it
+can be found and torn down.
+
+Cases are deterministic per (FUZZ_SEED, target, index), so any case from a
+nightly run can be regenerated.
+
+Skipped unless PERF_TESTS=true. Tuning:
+    FUZZ_ITERATIONS    cases per target (default 200)
+    FUZZ_TARGETS       comma-separated subset of targets (default all)
+    FUZZ_SEED          run seed (default random, printed)
+    FUZZ_TIMEOUT       seconds before a request counts as a hang (default 30)
+    FUZZ_RATE_LIMIT    max requests/sec per target, 0 for no cap (default 20)
+"""
+import pytest
+import hashlib
+import json
+import os
+import random
+import requests
+from utils.auth import get_auth_token
+from utils.config import tenantId, perf_enabled, perf_concurrency
+from utils.data_loader import load_payload
+from utils.entity_registry import record_response
+from utils.fuzzer import generate_mutations, apply_mutations, case_rng, minimize, crash_signature
+from utils.payload_stream import has_large_values, stream_json
+from utils.perf import RateLimiter, run_concurrently, throughput
+from utils.request_info import get_request_info
+from tests.test_data_driven import api_request, get_headers, get_mdms_headers, MDMS_CREATE_PATH
+from tests.test_studio_services import replace_placeholders, random_name, _mdms_draft_create, _mdms_service_create
+from tests.test_checklist_create import get_checklists_from_payload, search_checklist_definition, build_attributes_from_definition
+
+MDMS_FILE = "output/mdms_response.json"
+APP_FILE = "output/application_response.json"
+FUZZ_OUTPUT_FILE = "output/fuzz_report.json"
+CRASH_CORPUS_DIR = "output/fuzz_corpus"
+
+FUZZ_ITERATIONS = int(os.getenv("FUZZ_ITERATIONS", "200"))
+FUZZ_TARGETS = [t.strip() for t in os.getenv("FUZZ_TARGETS", "").split(",") if t.strip()]
+FUZZ_SEED = os.getenv("FUZZ_SEED") or str(random.randrange(10 ** 9))
+FUZZ_TIMEOUT = float(os.getenv("FUZZ_TIMEOUT", "30"))
+FUZZ_RATE_LIMIT = float(os.getenv("FUZZ_RATE_LIMIT", "20"))
+
+
+def load_json(path):
+    try:
+        return json.load(open(path))
+    except FileNotFoundError:
+        return {}
+
+
+def save_json(data, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    json.dump(data, open(path, "w"), indent=2)
+
+
+# =============================================================================
+# Seeds: target -> (method, path, seed payload, headers, owner)
+# =============================================================================
+# What an accepted mutant of each target creates: (entity type, label, response keys, id field)
+FUZZ_ENTITIES = {
+    "application": ("Application", "Application Number", ("Application", "application"), "applicationNumber"),
+    "mdms_service_config": ("Service Draft", None, ("Mdms", "mdms"), "id"),
+    "public_service_init": ("Public Service", "Service Code", ("Services", "services", "Service", "service"), "serviceCode"),
+    "checklist": ("Checklist", None, ("Services", "services", "Service", "service"), "id")
+}
+
+
+def _replacements(token, module, service):
+    app = load_json(APP_FILE)
+    return {
+        "{{tenantId}}": tenantId,
+        "{{module}}": module,
+        "{{service}}": service,
+        "{{businessService}}": f"{module}.{service}",
+        "{{serviceCode}}": app.get("service_code", "fuzz-service-code"),
+        "{{note}}": "fuzz",
+        "{{userUuid}}": get_request_info(token).get("userInfo", {}).get("uuid", ""),
+        "{{serviceDefId}}": "fuzz-def-id",
+        "{{accountId}}": app.get("application_id", "fuzz-account")
+    }
+
+
+def _checklist_definition(token, service):
+    """First checklist definition the E2E service published, or None."""
+    for checklist in get_checklists_from_payload():
+        definition = search_checklist_definition(f"{service}.{checklist.get('state')}.{checklist.get('name')}", token)
+        if definition and definition.get("id"):
+            return definition
+    return None
+
+
+def build_seeds(token, targets=None):
+    """
+    Returns:
+        tuple: ({target: (method, path, seed payload, headers, owner)},
+                {target: restriction of its seed})
+    """
+    notes = {}
+    mdms = load_json(MDMS_FILE)
+    e2e = {"module": mdms.get("module") or random_name("Module"), "service": mdms.get("service") or random_name("Service")}
+    repl = _replacements(token, e2e["module"], e2e["service"])
+    request_info = {"RequestInfo": get_request_info(token)}
+
+    application = replace_placeholders(load_payload("Application", "create_application.json"), repl)
+    checklist = replace_placeholders(load_payload("checklist", "create_checklist.json"), repl)
+    if targets is None or "checklist" in targets:
+        definition = _checklist_definition(token, e2e["service"])
+        if definition:
+            checklist["Service"]["serviceDefId"] = definition["id"]
+            checklist["Service"]["attributes"] = build_attributes_from_definition(definition)
+        else:
+            notes["checklist"] = (f"no checklist definition found for {e2e['service']}: serviceDefId is a placeholder, "
+                                  "so mutants only reach the definition lookup")
+
+    # Service configuration goes to the draft schema, so its accepted mutants are drafts, not services
+    draft = {"module": random_name("Module"), "service": random_name("Service")}
+    service_config = replace_placeholders(load_payload("mdms", "mdms_service_create.json"),
+                                          _replacements(token, draft["module"], draft["service"]))
+    service_config["Mdms"]["schemaCode"] = "Studio.ServiceConfigurationDrafts"
+    service_config["Mdms"]["uniqueIdentifier"] = random_name("fuzz")
+
+    seeds = {
+        "application": ("POST", f"/public-service/v1/application/{repl['{{serviceCode}}']}",
+                        {**application, **request_info}, get_headers(token),
+                        {**e2e, "service_code": repl["{{serviceCode}}"]}),
+        "mdms_service_config": ("POST", MDMS_CREATE_PATH, {**service_config, **request_info},
+                                get_mdms_headers(token), draft),
+        "checklist": ("POST", "/health-service-request/service/v1/_create", {**checklist, **request_info},
+                      get_headers(token), e2e)
+    }
+
+    if targets is None or "public_service_init" in targets:
+        # Init runs against a throwaway module/service with a published configuration, never the E2E one
+        throwaway = _mdms_draft_create(save=False)
+        _mdms_service_create(throwaway["module"], throwaway["service"], save=False)
+        owner = {"module": throwaway["module"], "service": throwaway["service"]}
+        init = replace_placeholders(load_payload("public_service", "public_service_init.json"),
+                                    _replacements(token, owner["module"], owner["service"]))
+        seeds["public_service_init"] = ("POST", "/public-service-init/v1/service", {**init, **request_info},
+                                        get_headers(token), owner)
+    return seeds, notes
+
+
+def record_accepted(target, res, owner):
+    """Record what an accepted mutant created so teardown can find it."""
+    entity_type, label, keys, id_field = FUZZ_ENTITIES[target]
+    record_response(entity_type, res, keys, id_field, label, source="fuzzer", **owner)
+
+
+# =============================================================================
+# Execution
+# =============================================================================
+def send_case(method, path, headers, payload, on_accepted=None):
+    """Send one mutant; returns (crashed, status or error). on_accepted(res) is called for 2xx responses."""
+    req = api_request(method, path, payload, headers)
+    body = {"data": stream_json(payload)} if has_large_values(payload) else {"json": payload}
+    try:
+        res = requests.request(req["method"], req["url"], headers=req["headers"], timeout=FUZZ_TIMEOUT, **body)
+    except requests.exceptions.Timeout:
+        return True, "timeout"
+    except requests.exceptions.ConnectionError as e:
+        # Dropped connections on oversize bodies are the server enforcing a limit
+        return False, f"connection closed: {type(e).__name__}"
+    if on_accepted and 200 <= res.status_code < 300:
+        on_accepted(res)
+    return res.status_code >= 500, res.status_code
+
+
+def fuzz_target(target, seed_request, iterations):
+    method, path, seed, headers, owner = seed_request
+    limiter = RateLimiter(FUZZ_RATE_LIMIT)
+
+    def on_accepted(res):
+        record_accepted(target, res, owner)
+
+    def run_case(idx):
+        mutations = generate_mutations(seed, case_rng(FUZZ_SEED, target, idx))
+        limiter.wait()
+        crashed, outcome = send_case(method, path, headers, apply_mutations(seed, mutations), on_accepted)
+        return {"idx": idx, "mutations": mutations, "crashed": crashed, "outcome": outcome}
+
+    cases, wall = run_concurrently(run_case, range(iterations), perf_concurrency)
+    crashes = [c for c in cases if c.get("crashed")]
+    statuses = {}
+    for c in cases:
+        key = str(c.get("outcome", "error"))
+        statuses[key] = statuses.get(key, 0) + 1
+
+    # Minimize each crash and keep one entry per distinct minimized signature
+    corpus = {}
+    for crash in crashes:
+        def still_crashes(mutations):
+            return send_case(method, path, headers, apply_mutations(seed, mutations), on_accepted)[0]
+
+        minimal, spent = minimize(seed, crash["mutations"], still_crashes)
+        signature = crash_signature(target, minimal)
+        if signature in corpus:
+            continue
+        entry = {
+            "target": target,
+            "endpoint": f"{method} {path}",
+            "run_seed": FUZZ_SEED,
+            "case": crash["idx"],
+            "outcome": crash["outcome"],
+            "mutations": minimal,
+            "minimize_requests": spent
+        }
+        digest = hashlib.sha1(signature.encode()).hexdigest()[:12]
+        save_json(entry, os.path.join(CRASH_CORPUS_DIR, f"{target}-{digest}.json"))
+        corpus[signature] = entry
+
+    return {
+        "target": target,
+        "cases": iterations,
+        "duration": round(wall, 2),
+        "throughput": throughput(iterations, wall),
+        "outcomes": statuses,
+        "crashes": len(crashes),
+        "unique_crashes": list(corpus.values())
+    }
+
+
+def test_fuzz_payloads(request):
+    """Fuzz every seed payload and minimize crashing inputs into the crash corpus."""
+    if not perf_enabled:
+        pytest.skip("Perf tests disabled - set PERF_TESTS=true")
+
+    token = get_auth_token("user")
+    seeds, seed_notes = build_seeds(token, FUZZ_TARGETS or None)
+    targets = FUZZ_TARGETS or list(seeds)
+
+    print(f"\n{'='*60}")
+    print(f"🧨 FUZZER: seed {FUZZ_SEED}, {FUZZ_ITERATIONS} cases x {len(targets)} targets")
+    print(f"{'='*60}")
+    for target, note in seed_notes.items():
+        print(f"   ⚠️ {target}: {note}")
+
+    reports = []
+    for target in targets:
+        report = fuzz_target(target, seeds[target], FUZZ_ITERATIONS)
+        reports.append(report)
+        print(f"\n🎯 {target}: {report['cases']} cases in {report['duration']}s ({report['throughput']} req/s)")
+        print(f"   outcomes: {report['outcomes']}")
+        for crash in report["unique_crashes"]:
+            ops = ", ".join(f"{'/'.join(map(str, m['path']))}:{m['op']}" for m in crash["mutations"])
+            print(f"   💥 {crash['outcome']} <- {ops}")
+
+    save_json({"run_seed": FUZZ_SEED, "seed_notes": seed_notes, "targets": reports}, FUZZ_OUTPUT_FILE)
+    unique = sum(len(r["unique_crashes"]) for r in reports)
+
+    if request:
+        result = {"Run Seed": FUZZ_SEED}
+        for r in reports:
+            result[r["target"]] = (f"{r['cases']} cases, {r['crashes']} crashes ({len(r['unique_crashes'])} unique)"
+                                   + (f" ⚠️ {seed_notes[r['target']]}" if r["target"] in seed_notes else ""))
+        result["Status"] = "✅ No crashes" if not unique else f"❌ {unique} unique crashes in {CRASH_CORPUS_DIR}"
+        request.node._test_result = result
+
+    assert not unique, f"{unique} unique crashing inputs written to {CRASH_CORPUS_DIR}"
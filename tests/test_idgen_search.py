@@ -38,6 +38,7 @@ def test_idgen_search():
         "MdmsCriteria": {
             "tenantId": tenantId,
             "schemaCode": "common-masters.IdFormat",
+            "isActive": True,
             "limit": 10000000
         }
     }
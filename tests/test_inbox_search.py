@@ -1,12 +1,19 @@
 from utils.auth import get_auth_token
 from utils.request_info import get_request_info
 from utils.config import tenantId, BASE_URL
+from utils.perf import run_concurrently
 import json
+import os
 import requests
 
 MDMS_FILE = "output/mdms_response.json"
 APP_FILE = "output/application_response.json"
 
+# Inbox scan: pages of INBOX_PAGE_SIZE fetched INBOX_SCAN_WINDOW at a time
+INBOX_PAGE_SIZE = int(os.getenv("INBOX_PAGE_SIZE", "10"))
+INBOX_SCAN_WINDOW = int(os.getenv("INBOX_SCAN_WINDOW", "4"))
+INBOX_MAX_PAGES = int(os.getenv("INBOX_MAX_PAGES", "100"))
+
 def load_json(path):
     return json.load(open(path))
 
@@ -14,16 +21,8 @@ def get_token():
     return get_auth_token("user")
 
 
-def test_inbox_search():
-    """Search inbox for application"""
-    token = get_token()
-    mdms = load_json(MDMS_FILE)
-    app_data = load_json(APP_FILE)
-    
-    module = mdms["module"]
-    service = mdms["service"]
-    application_number = app_data["application_number"]
-    
+def _inbox_page(token, module, service, offset, limit):
+    """Helper: Fetch one inbox page; returns (items, total_count, response_bytes)"""
     url = f"{BASE_URL}/inbox/v2/_search"
     
     headers = {
@@ -34,8 +33,8 @@ def test_inbox_search():
     
     payload = {
         "inbox": {
-            "limit": 10,
-            "offset": 0,
+            "limit": limit,
+            "offset": offset,
             "tenantId": tenantId,
             "processSearchCriteria": {
                 "businessService": [f"{module}.{service}"],
@@ -56,17 +55,84 @@ def test_inbox_search():
     
     data = res.json()
     items = data.get("items") or data.get("inbox") or []
+    return items, data.get("totalCount"), len(res.content)
+
+
+def scan_inbox(token, module, service, application_number, page_size=INBOX_PAGE_SIZE,
+               window=INBOX_SCAN_WINDOW, max_pages=INBOX_MAX_PAGES):
+    """
+    Scan inbox pages concurrently, `window` pages at a time, and stop at the
+    first window containing `application_number`, a short page, or totalCount.
     
-    # Check if our application is in inbox
+    Returns:
+        dict: found flag, items scanned, items on the first page, pages and bytes downloaded
+    """
+    pages, total_bytes, items_scanned, first_page_items = 0, 0, 0, 0
+    total_count = None
     found = False
-    for item in items:
-        business_object = item.get("businessObject") or {}
-        if business_object.get("applicationNumber") == application_number:
-            found = True
+    
+    next_page = 0
+    while not found and next_page < max_pages:
+        offsets = [(next_page + i) * page_size for i in range(window) if next_page + i < max_pages]
+        if total_count is not None:
+            offsets = [o for o in offsets if o < total_count]
+        if not offsets:
             break
+        
+        results, _ = run_concurrently(
+            lambda offset: _inbox_page(token, module, service, offset, page_size), offsets, window
+        )
+        
+        exhausted = False
+        for offset, result in zip(offsets, results):
+            if isinstance(result, dict):
+                raise AssertionError(result.get("error"))
+            items, count, size = result
+            if offset == 0:
+                first_page_items = len(items)
+            pages += 1
+            total_bytes += size
+            items_scanned += len(items)
+            if count is not None:
+                total_count = count
+            if any((item.get("businessObject") or {}).get("applicationNumber") == application_number for item in items):
+                found = True
+            if len(items) < page_size:
+                exhausted = True
+        
+        if exhausted:
+            break
+        next_page += len(offsets)
+    
+    return {
+        "found": found,
+        "items_scanned": items_scanned,
+        "first_page_items": first_page_items,
+        "total_count": total_count,
+        "pages": pages,
+        "bytes": total_bytes
+    }
+
+
+def test_inbox_search():
+    """Search inbox for application"""
+    token = get_token()
+    mdms = load_json(MDMS_FILE)
+    app_data = load_json(APP_FILE)
+    
+    module = mdms["module"]
+    service = mdms["service"]
+    application_number = app_data["application_number"]
+    
+    scan = scan_inbox(token, module, service, application_number)
+    
+    print(f"\n📥 Inbox scan: found={scan['found']} after {scan['pages']} page(s), {scan['bytes']} bytes")
     
     return {
         "application_number": application_number,
-        "total_inbox_items": len(items),
-        "application_in_inbox": found
-    }
\ No newline at end of file
+        "total_inbox_items": scan["first_page_items"],
+        "items_scanned": scan["items_scanned"],
+        "application_in_inbox": scan["found"],
+        "pages_fetched": scan["pages"],
+        "bytes_downloaded": scan["bytes"]
+    }
@@ -1,13 +1,19 @@
 import pytest
 from utils.auth import get_auth_token
 from utils.request_info import get_request_info
-from utils.config import tenantId, BASE_URL
+from utils.config import tenantId, BASE_URL, perf_concurrency
+from utils.perf import run_concurrently
 import json
+import os
 import requests
 
 APP_FILE = "output/application_response.json"
 MDMS_FILE = "output/mdms_response.json"
 
+# Small pages: the first match is usually on page one
+INDIVIDUAL_PAGE_SIZE = int(os.getenv("INDIVIDUAL_PAGE_SIZE", "10"))
+INDIVIDUAL_BATCH_SIZE = int(os.getenv("INDIVIDUAL_BATCH_SIZE", "50"))
+
 def load_json(path):
     return json.load(open(path))
 
@@ -15,42 +21,17 @@ def get_token():
     return get_auth_token("user")
 
 
-def test_individual_search(request):
-    """Search individual by mobile number from application details"""
-    token = get_token()
-    
-    # Load application and mdms data
-    app_data = load_json(APP_FILE)
-    mdms = load_json(MDMS_FILE)
-    
-    module = mdms["module"]
-    service = mdms["service"]
-    application_number = app_data.get("application_number")
-    
-    # Get mobile number from application
-    mobile_number = app_data.get("mobile_number")
-    
-    if not mobile_number:
-        result = {
-            "module": module,
-            "service": service,
-            "application_number": application_number,
-            "message": "Mobile number not found in application",
-            "individual_found": False
-        }
-        
-        if request:
-            request.node._test_result = {
-                "Module": module,
-                "Service": service,
-                "Application Number": application_number,
-                "Status": "⚠️ Mobile number not found"
-            }
-        
-        return result
+def _search_individuals(token, mobile_numbers, limit=1000, offset=0):
+    """Helper: Search health-individual by one or more mobile numbers; returns the individuals list"""
+    return _individual_page(token, mobile_numbers, limit, offset)[0]
+
+
+def _individual_page(token, mobile_numbers, limit, offset):
+    """Helper: One health-individual search page; returns (individuals, TotalCount or None)"""
+    if not isinstance(mobile_numbers, (list, tuple, set)):
+        mobile_numbers = [mobile_numbers]
     
-    # Search individual by mobile number
-    url = f"{BASE_URL}/health-individual/v1/_search?limit=1000&offset=0&tenantId={tenantId}"
+    url = f"{BASE_URL}/health-individual/v1/_search?limit={limit}&offset={offset}&tenantId={tenantId}"
     
     headers = {
         "Content-Type": "application/json"
@@ -83,7 +64,7 @@ def test_individual_search(request):
         },
         "Individual": {
             "tenantId": tenantId,
-            "mobileNumber": [int(mobile_number) if str(mobile_number).isdigit() else mobile_number]
+            "mobileNumber": [int(m) if str(m).isdigit() else m for m in mobile_numbers]
         }
     }
     
@@ -92,9 +73,139 @@ def test_individual_search(request):
     
     data = res.json()
     individuals = data.get("Individual") or data.get("individual") or []
-    individuals = individuals if isinstance(individuals, list) else [individuals]
+    total = data.get("TotalCount", data.get("totalCount"))
+    return (individuals if isinstance(individuals, list) else [individuals]), total
+
+
+def iter_individual_pages(token, mobile_numbers, page_size=INDIVIDUAL_PAGE_SIZE):
+    """
+    Yield (individuals, TotalCount or None) for each page of the mobile-number search.
+    
+    Pages are only requested as the caller consumes them, so breaking out of
+    the loop stops the search.
+    """
+    offset = 0
+    while True:
+        page, total = _individual_page(token, mobile_numbers, page_size, offset)
+        yield page, total
+        if len(page) < page_size:
+            return
+        offset += page_size
+
+
+def iter_individuals(token, mobile_numbers, page_size=INDIVIDUAL_PAGE_SIZE):
+    """Yield individuals matching the mobile numbers one page at a time."""
+    for page, _ in iter_individual_pages(token, mobile_numbers, page_size):
+        yield from page
+
+
+def _mobile_digits(mobile_number):
+    """Trailing 10 digits, so "+91 98765 43210", "919876543210" and 9876543210 compare equal."""
+    return "".join(c for c in str(mobile_number or "") if c.isdigit())[-10:]
+
+
+def _same_mobile(individual, mobile_number):
+    return _mobile_digits(individual.get("mobileNumber")) == _mobile_digits(mobile_number)
+
+
+def find_individual(token, mobile_number, page_size=INDIVIDUAL_PAGE_SIZE, count_all=False):
+    """
+    Return (first individual with this mobile number or None, individuals scanned,
+    individuals the search matched).
+    
+    The match count is the search's TotalCount from the first page. When the
+    service omits it, it is None unless `count_all`, which keeps paging (small
+    pages) after the match to count the rest.
+    """
+    found, scanned, total = None, 0, None
+    pages = iter_individual_pages(token, [mobile_number], page_size)
+    for page, page_total in pages:
+        total = page_total if total is None else total
+        for individual in page:
+            scanned += 1
+            if _same_mobile(individual, mobile_number):
+                found = individual
+                break
+        if found:
+            break
+    if total is None and count_all:
+        total = scanned + (len(page) - page.index(found) - 1 if found else 0) \
+            + sum(len(rest) for rest, _ in pages)
+    return found, scanned, total
+
+
+def find_individuals(token, mobile_numbers, batch_size=INDIVIDUAL_BATCH_SIZE,
+                     page_size=INDIVIDUAL_PAGE_SIZE, concurrency=perf_concurrency):
+    """
+    Batched lookup of many mobile numbers.
+    
+    Each batch is one paged search for up to `batch_size` numbers that stops as
+    soon as every number in the batch has matched; batches run concurrently.
+    
+    Returns:
+        dict: {mobile_number (str): individual} for the numbers that were found
+    """
+    numbers = [str(m) for m in dict.fromkeys(mobile_numbers)]
+    batches = [numbers[i:i + batch_size] for i in range(0, len(numbers), batch_size)]
+    
+    def lookup(batch):
+        wanted = set(batch)
+        found = {}
+        for individual in iter_individuals(token, batch, page_size):
+            mobile = str(individual.get("mobileNumber"))
+            if mobile in wanted and mobile not in found:
+                found[mobile] = individual
+                if len(found) == len(wanted):
+                    break
+        return found
+    
+    results, _ = run_concurrently(lookup, batches, concurrency)
+    
+    matches = {}
+    for r in results:
+        assert r.get("success") is not False, f"Individual batch search failed: {r.get('error')}"
+        matches.update(r)
+    return matches
+
+
+def test_individual_search(request):
+    """Search individual by mobile number from application details"""
+    token = get_token()
+    
+    # Load application and mdms data
+    app_data = load_json(APP_FILE)
+    mdms = load_json(MDMS_FILE)
+    
+    module = mdms["module"]
+    service = mdms["service"]
+    application_number = app_data.get("application_number")
+    
+    # Get mobile number from application
+    mobile_number = app_data.get("mobile_number")
+    
+    if not mobile_number:
+        result = {
+            "module": module,
+            "service": service,
+            "application_number": application_number,
+            "message": "Mobile number not found in application",
+            "individual_found": False
+        }
+        
+        if request:
+            request.node._test_result = {
+                "Module": module,
+                "Service": service,
+                "Application Number": application_number,
+                "Status": "⚠️ Mobile number not found"
+            }
+        
+        return result
+    
+    # Search individual by mobile number (small pages, stop at first match)
+    ind, scanned, total = find_individual(token, mobile_number, count_all=True)
     
-    individual_found = len(individuals) > 0
+    individual_found = ind is not None
     
     result = {
         "module": module,
@@ -102,11 +213,11 @@ def test_individual_search(request):
         "application_number": application_number,
         "mobile_number": mobile_number,
         "individual_found": individual_found,
-        "total_individuals": len(individuals)
+        "total_individuals": total,
+        "individuals_scanned": scanned
     }
     
     if individual_found:
-        ind = individuals[0]
         result["individual_id"] = ind.get("id")
         result["individual_uuid"] = ind.get("individualId")
         result["name"] = ind.get("name", {}).get("givenName") if isinstance(ind.get("name"), dict) else ind.get("name")
@@ -119,7 +230,8 @@ def test_individual_search(request):
             "Application Number": application_number,
             "Mobile Number": mobile_number,
             "Individual Found": "✅ Yes" if individual_found else "❌ No",
-            "Total Individuals": len(individuals)
+            "Total Individuals": total,
+            "Individuals Scanned": scanned
         }
         
         if individual_found:
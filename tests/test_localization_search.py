@@ -1,12 +1,21 @@
 import pytest
 from utils.auth import get_auth_token
 from utils.request_info import get_request_info
-from utils.config import tenantId, BASE_URL
+from utils.data_loader import load_payload
+from utils.config import tenantId, BASE_URL, perf_concurrency
+from utils.perf import run_concurrently
 import json
+import os
 import requests
 
 MDMS_FILE = "output/mdms_response.json"
 
+# Locales to verify when the service payload does not list any
+DEFAULT_LOCALES = [l.strip() for l in os.getenv("LOCALIZATION_LOCALES", "en_IN").split(",") if l.strip()]
+
+# Run-level cache of localization responses: (locale, module) -> messages
+_messages_cache = {}
+
 def load_json(path):
     return json.load(open(path))
 
@@ -14,18 +23,13 @@ def get_token():
     return get_auth_token("user")
 
 
-def test_localization_search(request):
-    """Search localization messages by module"""
-    token = get_token()
-    mdms = load_json(MDMS_FILE)
+def fetch_messages(token, locale, loc_module):
+    """Fetch localization messages for a locale/module; cached for the run."""
+    key = (locale, loc_module)
+    if key in _messages_cache:
+        return _messages_cache[key]
     
-    module = mdms["module"]
-    service = mdms["service"]
-    
-    # Localization module pattern (lowercase)
-    loc_module = f"rainmaker-studio-{module.lower()}"
-    
-    url = f"{BASE_URL}/localization/messages/v1/_search?locale=en_IN&tenantId={tenantId}&module={loc_module}"
+    url = f"{BASE_URL}/localization/messages/v1/_search?locale={locale}&tenantId={tenantId}&module={loc_module}"
     
     headers = {
         "Content-Type": "application/json"
@@ -38,8 +42,59 @@ def test_localization_search(request):
     res = requests.post(url, json=payload, headers=headers)
     assert res.status_code == 200, f"Localization search failed: {res.text}"
     
-    data = res.json()
-    messages = data.get("messages") or []
+    messages = res.json().get("messages") or []
+    _messages_cache[key] = messages
+    return messages
+
+
+def get_localization_config():
+    """
+    Read expected locales, message codes and localization modules from the
+    `localization` section of mdms_service_create.json.
+    
+    Accepts either a list of {"code", "message", "locale"?} entries or an object
+    with optional "locales", "messages"/"codes" and "modules" keys.
+    
+    Returns:
+        tuple: (locales, expected_codes, modules) - expected_codes is empty when
+               the payload does not list any; modules are the extra localization
+               modules the service uses
+    """
+    try:
+        payload = load_payload("mdms", "mdms_service_create.json")
+    except FileNotFoundError:
+        return DEFAULT_LOCALES, set(), []
+    
+    section = payload.get("Mdms", {}).get("data", {}).get("localization") or {}
+    entries = section if isinstance(section, list) else (section.get("messages") or section.get("codes") or [])
+    modules = [] if isinstance(section, list) else [m for m in section.get("modules") or [] if m]
+    
+    codes = set()
+    locales = [] if isinstance(section, list) else list(section.get("locales") or [])
+    for entry in entries:
+        if isinstance(entry, dict):
+            if entry.get("code"):
+                codes.add(entry["code"])
+            if entry.get("locale") and entry["locale"] not in locales:
+                locales.append(entry["locale"])
+        elif entry:
+            codes.add(entry)
+    
+    return locales or DEFAULT_LOCALES, codes, modules
+
+
+def test_localization_search(request):
+    """Search localization messages by module"""
+    token = get_token()
+    mdms = load_json(MDMS_FILE)
+    
+    module = mdms["module"]
+    service = mdms["service"]
+    
+    # Localization module pattern (lowercase)
+    loc_module = f"rainmaker-studio-{module.lower()}"
+    
+    messages = fetch_messages(token, "en_IN", loc_module)
     
     result = {
         "module": module,
@@ -59,4 +114,67 @@ def test_localization_search(request):
             "Status": "✅ Found" if len(messages) > 0 else "⚠️ Not Found"
         }
     
-    return result
\ No newline at end of file
+    return result
+
+
+def test_localization_coverage(request):
+    """Verify every expected message code exists in every configured locale"""
+    token = get_token()
+    mdms = load_json(MDMS_FILE)
+    
+    module = mdms["module"]
+    loc_module = f"rainmaker-studio-{module.lower()}"
+    
+    locales, expected, modules = get_localization_config()
+    if not expected and len(locales) < 2:
+        pytest.skip("No message codes in the payload's localization section and only one locale to compare - "
+                    "set LOCALIZATION_LOCALES=en_IN,hi_IN (or list locales/codes in mdms_service_create.json)")
+    loc_modules = [loc_module] + [m for m in modules if m != loc_module]
+    
+    # Fetch every locale/module concurrently (served from the run cache on repeat checks)
+    pairs = [(locale, m) for locale in locales for m in loc_modules]
+    responses, _ = run_concurrently(lambda pair: fetch_messages(token, *pair), pairs, perf_concurrency)
+    codes_by_locale = {locale: {} for locale in locales}
+    for (locale, m), messages in zip(pairs, responses):
+        assert isinstance(messages, list), f"Localization search failed for {locale}/{m}: {messages.get('error')}"
+        codes_by_locale[locale][m] = {msg.get("code") for msg in messages}
+    
+    if expected:
+        # Payload codes may live in any of the service's localization modules
+        reference = "payload"
+        missing = {locale: sorted(expected - set().union(*by_module.values()))
+                   for locale, by_module in codes_by_locale.items()}
+    else:
+        # Without codes in the payload, the first locale is the reference set, module by module
+        reference = locales[0]
+        baseline = codes_by_locale[reference]
+        expected = {(m, c) for m, codes in baseline.items() for c in codes}
+        missing = {locale: sorted(f"{m}:{c}" for m, c in expected if c not in by_module[m])
+                   for locale, by_module in codes_by_locale.items()}
+    
+    for locale, codes in missing.items():
+        status = "✅" if not codes else f"❌ {len(codes)} missing"
+        print(f"   {locale}: {status}")
+    
+    result = {
+        "module": module,
+        "localization_module": loc_module,
+        "reference": reference,
+        "expected_codes": len(expected),
+        "locales": locales,
+        "localization_modules": loc_modules,
+        "missing_by_locale": missing
+    }
+    
+    if request:
+        report = {
+            "Localization Modules": ", ".join(loc_modules),
+            "Expected Codes": f"{len(expected)} (from {reference})"
+        }
+        for locale, codes in missing.items():
+            report[locale] = "✅ Complete" if not codes else f"❌ Missing {len(codes)}: {', '.join(codes[:5])}"
+        request.node._test_result = report
+    
+    assert expected, f"No localization messages found for {', '.join(loc_modules)}"
+    assert not any(missing.values()), f"Missing localization codes: { {l: c for l, c in missing.items() if c} }"
+    return result
@@ -0,0 +1,189 @@
+"""
+Concurrent Multi-Service Provisioning
+Provisions K services at once through draft -> publish -> init (the studio
+flow of test_studio_services.py). As soon as a service's init returns, a
+separate pool starts polling its roles, actions, idgen, workflow, checklists
+and localization until they are visible, so ready times measure backend lag
+rather than queueing behind the other services' provisioning.
+
+Reports provisioning throughput, failures per stage under contention and
+collisions between the services:
+    - duplicate module/service names or service codes
+    - idgen formats registered more than once for one service
+    - the same role code registered more than once
+Output files of the E2E flow are left untouched.
+
+Skipped unless PERF_TESTS=true. Tuning:
+    MULTI_PROVISION_SERVICES      services to provision (default 10)
+    MULTI_PROVISION_CONCURRENCY   services provisioned at once (default PERF_CONCURRENCY)
+    PROVISION_READY_TIMEOUT       seconds to wait for artifacts (default 300)
+    PROVISION_POLL_INTERVAL       seconds between visibility checks (default 2)
+"""
+import pytest
+import json
+import os
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from utils.auth import get_auth_token
+from utils.config import tenantId, perf_enabled, perf_concurrency, provision_ready_timeout, provision_poll_interval
+from utils.perf import summarize_latencies, run_concurrently, throughput, timed
+from utils.service_config_generator import generate_service_config
+from utils.service_readiness import ARTIFACTS, expected_artifacts, wait_until_ready, mdms_search
+from tests.test_studio_services import _mdms_draft_create, _mdms_service_create, _public_service_init, replace_placeholders
+
+MULTI_OUTPUT_FILE = "output/multi_provisioning.json"
+
+MULTI_SERVICES = int(os.getenv("MULTI_PROVISION_SERVICES", "10"))
+MULTI_CONCURRENCY = int(os.getenv("MULTI_PROVISION_CONCURRENCY", str(perf_concurrency)))
+STAGES = ("draft", "publish", "init")
+
+
+def save_json(data, path):
+    os.makedirs("output", exist_ok=True)
+    json.dump(data, open(path, "w"), indent=2)
+
+
+def _provision_one(_, on_init=None):
+    """
+    draft -> publish -> init for one service; stops at the first failing stage.
+    on_init(result) is called as soon as init returns.
+    """
+    result = {"timings": {}, "failed_stage": None, "error": None}
+    try:
+        draft, result["timings"]["draft"] = timed(_mdms_draft_create, save=False)
+        result.update(module=draft["module"], service=draft["service"])
+
+        payload = generate_service_config()
+        mdms, result["timings"]["publish"] = timed(_mdms_service_create, draft["module"], draft["service"],
+                                                   payload=payload, save=False)
+        svc, result["timings"]["init"] = timed(_public_service_init, mdms, save=False)
+        result["service_code"] = svc.get("service_code")
+        result["init_returned"] = time.time()
+    except AssertionError as e:
+        result["failed_stage"] = STAGES[len(result["timings"])]
+        result["error"] = str(e)[:300]
+        return result
+    if on_init:
+        on_init(result)
+    return result
+
+
+def _wait_ready(service, token):
+    published = replace_placeholders(generate_service_config(), {
+        "{{tenantId}}": tenantId,
+        "{{module}}": service["module"],
+        "{{service}}": service["service"],
+        "{{businessService}}": f"{service['module']}.{service['service']}"
+    })
+    expected = expected_artifacts(published, service["module"], service["service"])
+    # How long the service waited for a polling thread after its init returned
+    service["poll_delay"] = round(time.time() - service["init_returned"], 3)
+    return wait_until_ready(token, service["module"], service["service"], expected, service["init_returned"],
+                            provision_ready_timeout, provision_poll_interval)
+
+
+def _collisions(services, token):
+    """Names, service codes, idgen formats and role codes that were registered more than once."""
+    names = Counter(f"{s['module']}.{s['service']}" for s in services)
+    codes = Counter(s["service_code"] for s in services if s.get("service_code"))
+
+    idnames = Counter(i.get("idname") or i.get("idName") for i in mdms_search(token, "common-masters.IdFormat"))
+    roles = Counter(r.get("code") or r.get("rolecode") for r in mdms_search(token, "ACCESSCONTROL-ROLES.roles"))
+    ours = [(s["module"].upper(), s["service"].upper()) for s in services]
+
+    def belongs(code):
+        return bool(code) and any(m in code.upper() and sv in code.upper() for m, sv in ours)
+
+    return {
+        "service_names": sorted(n for n, c in names.items() if c > 1),
+        "service_codes": sorted(n for n, c in codes.items() if c > 1),
+        "idgen": sorted(n for n, c in idnames.items() if c > 1 and belongs(n)),
+        "roles": sorted(n for n, c in roles.items() if c > 1 and belongs(n))
+    }
+
+
+def test_multi_service_provisioning(request):
+    """Provision K services concurrently and report throughput, failures and collisions."""
+    if not perf_enabled:
+        pytest.skip("Perf tests disabled - set PERF_TESTS=true")
+
+    token = get_auth_token("user")
+
+    print(f"\n{'='*60}")
+    print(f"🏭 MULTI-SERVICE PROVISIONING: {MULTI_SERVICES} services, concurrency {MULTI_CONCURRENCY}")
+    print(f"{'='*60}")
+
+    # One polling thread per service, so polling never waits for a free slot
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=MULTI_SERVICES) as ready_pool:
+        polls = {}
+
+        def start_polling(service):
+            polls[id(service)] = ready_pool.submit(_wait_ready, service, token)
+
+        results, provision_wall = run_concurrently(lambda i: _provision_one(i, start_polling),
+                                                   range(MULTI_SERVICES), MULTI_CONCURRENCY)
+        for r in results:
+            if r.get("success") is False:
+                r.update(timings={}, failed_stage="unknown")
+        provisioned = [r for r in results if not r.get("failed_stage")]
+        for service in provisioned:
+            try:
+                ready = polls[id(service)].result()
+            except Exception as e:
+                ready = {"success": False, "error": str(e)[:300]}
+            service["ready"] = ready if ready.get("success") is not False else {a: None for a in ARTIFACTS}
+            seen = [v for v in service["ready"].values() if v is not None]
+            service["all_ready"] = max(seen) if len(seen) == len(ARTIFACTS) else None
+    total_wall = time.time() - start
+
+    failures = Counter(r["failed_stage"] for r in results if r.get("failed_stage"))
+    print(f"\n   ✅ Provisioned {len(provisioned)}/{MULTI_SERVICES} in {provision_wall:.2f}s "
+          f"({throughput(len(provisioned), provision_wall)} services/s)")
+    for stage, count in failures.items():
+        print(f"   ❌ {count} failed at {stage}")
+
+    ready_services = [s for s in provisioned if s["all_ready"] is not None]
+    print(f"   ⏱️ {len(ready_services)}/{len(provisioned)} fully ready after {total_wall:.2f}s "
+          f"({throughput(len(ready_services), total_wall)} ready services/s)")
+
+    collisions = _collisions(provisioned, token)
+    for kind, values in collisions.items():
+        if values:
+            print(f"   💥 {kind} collisions: {values}")
+
+    report = {
+        "services": MULTI_SERVICES,
+        "concurrency": MULTI_CONCURRENCY,
+        "provision_seconds": round(provision_wall, 2),
+        "provision_throughput": throughput(len(provisioned), provision_wall),
+        "ready_seconds": round(total_wall, 2),
+        "ready_throughput": throughput(len(ready_services), total_wall),
+        "stages": {stage: summarize_latencies([r["timings"][stage] for r in results if stage in r["timings"]])
+                   for stage in STAGES},
+        "ready": {a: summarize_latencies([s["ready"][a] for s in provisioned if s["ready"].get(a) is not None])
+                  for a in ARTIFACTS},
+        "poll_delay": summarize_latencies([s["poll_delay"] for s in provisioned if "poll_delay" in s]),
+        "failures": dict(failures),
+        "errors": [{"stage": r["failed_stage"], "error": r.get("error")} for r in results if r.get("failed_stage")],
+        "not_ready": [{"module": s["module"], "service": s["service"], "missing": [a for a, v in s["ready"].items() if v is None]}
+                      for s in provisioned if s["all_ready"] is None],
+        "collisions": collisions,
+        "results": results
+    }
+    save_json(report, MULTI_OUTPUT_FILE)
+
+    if request:
+        request.node._test_result = {
+            "Provisioned": f"{len(provisioned)}/{MULTI_SERVICES} in {report['provision_seconds']}s ({report['provision_throughput']}/s)",
+            "Ready": f"{len(ready_services)}/{len(provisioned)} in {report['ready_seconds']}s",
+            "Poll Delay p95": f"{report['poll_delay'].get('p95')}s",
+            "Failures": dict(failures) or "None",
+            "Collisions": {k: len(v) for k, v in collisions.items() if v} or "None"
+        }
+
+    assert not failures, f"Provisioning failed under contention: {dict(failures)}"
+    assert not report["not_ready"], f"{len(report['not_ready'])} services not ready within {provision_ready_timeout}s"
+    assert not any(collisions.values()), f"Collisions between concurrently provisioned services: {collisions}"
+    return report
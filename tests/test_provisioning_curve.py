@@ -0,0 +1,152 @@
+"""
+Provisioning Scaling Curve
+Provisions services of increasing configuration size through the studio flow
+(_mdms_draft_create -> _mdms_service_create -> _public_service_init) and
+records, per size:
+    - the duration of each of the three calls
+    - time from init returning until roles, actions, idgen, workflow,
+      checklists and localization are visible (utils/service_readiness.py)
+The local growth exponent between consecutive sizes shows where provisioning
+stops scaling linearly.
+
+Size k is the unit size scaled by k (generated by utils/service_config_generator.py).
+Output files of the E2E flow are left untouched.
+
+Skipped unless PERF_TESTS=true. Tuning:
+    PROVISION_CURVE_STEPS     comma-separated scale factors (default "1,2,4,8,16")
+    PROVISION_CURVE_UNIT      fields:checklists:stages:messages at scale 1 (default "10:2:2:20")
+    PROVISION_READY_TIMEOUT   seconds to wait for artifacts per size (default 300)
+    PROVISION_POLL_INTERVAL   seconds between visibility checks (default 2)
+"""
+import pytest
+import json
+import os
+import time
+from utils.auth import get_auth_token
+from utils.config import tenantId, perf_enabled, provision_ready_timeout, provision_poll_interval
+from utils.perf import timed, growth_exponents, nonlinear_from
+from utils.service_config_generator import generate_service_config, config_size
+from utils.service_readiness import ARTIFACTS, expected_artifacts, wait_until_ready
+from tests.test_studio_services import _mdms_draft_create, _mdms_service_create, _public_service_init, replace_placeholders
+
+CURVE_OUTPUT_FILE = "output/provisioning_curve.json"
+
+CURVE_STEPS = [int(v) for v in os.getenv("PROVISION_CURVE_STEPS", "1,2,4,8,16").split(",") if v.strip()]
+UNIT_FIELDS, UNIT_CHECKLISTS, UNIT_STAGES, UNIT_MESSAGES = (
+    int(v) for v in os.getenv("PROVISION_CURVE_UNIT", "10:2:2:20").split(":")
+)
+CALLS = ("draft", "publish", "init")
+
+
+def save_json(data, path):
+    os.makedirs("output", exist_ok=True)
+    json.dump(data, open(path, "w"), indent=2)
+
+
+def config_for(scale):
+    """Generator arguments for scale factor `scale` (3 fixed states plus the scaled stages)."""
+    return {
+        "fields": UNIT_FIELDS * scale,
+        "checklists": UNIT_CHECKLISTS * scale,
+        "states": 3 + max(1, UNIT_STAGES * scale),
+        "messages": UNIT_MESSAGES * scale
+    }
+
+
+def _provision(scale, token):
+    """Run the three studio calls for one size and wait for its artifacts."""
+    size = config_for(scale)
+    draft, draft_seconds = timed(_mdms_draft_create, payload=generate_service_config(draft=True, **size), save=False)
+    module, service = draft["module"], draft["service"]
+
+    payload = generate_service_config(**size)
+    mdms, publish_seconds = timed(_mdms_service_create, module, service, payload=payload, save=False)
+    svc, init_seconds = timed(_public_service_init, mdms, save=False)
+    init_returned = time.time()
+
+    published = replace_placeholders(payload, {
+        "{{tenantId}}": tenantId,
+        "{{module}}": module,
+        "{{service}}": service,
+        "{{businessService}}": f"{module}.{service}"
+    })
+    ready = wait_until_ready(token, module, service, expected_artifacts(published, module, service),
+                             init_returned, provision_ready_timeout, provision_poll_interval)
+
+    all_ready = max(ready.values()) if all(v is not None for v in ready.values()) else None
+    return {
+        "scale": scale,
+        "size": config_size(payload),
+        "module": module,
+        "service": service,
+        "service_code": svc.get("service_code"),
+        "calls": {
+            "draft": round(draft_seconds, 3),
+            "publish": round(publish_seconds, 3),
+            "init": round(init_seconds, 3)
+        },
+        "ready": ready,
+        "all_ready": all_ready,
+        "time_to_ready": round(draft_seconds + publish_seconds + init_seconds + all_ready, 3) if all_ready is not None else None
+    }
+
+
+def _curves(points):
+    """Per metric: values by scale, local growth exponents and where growth turns non-linear."""
+    scales = [p["scale"] for p in points]
+    metrics = {f"call.{c}": [p["calls"][c] for p in points] for c in CALLS}
+    metrics.update({f"ready.{a}": [p["ready"][a] for p in points] for a in ARTIFACTS})
+    metrics["time_to_ready"] = [p["time_to_ready"] for p in points]
+    return {
+        name: {"values": values, "exponents": growth_exponents(scales, values), "nonlinear_from": nonlinear_from(scales, values)}
+        for name, values in metrics.items()
+    }
+
+
+def _print_curve(points, curves):
+    print(f"\n   {'scale':>5} {'KB':>7} {'draft':>7} {'publish':>8} {'init':>7} {'ready':>8} {'slowest artifact':>18}")
+    for p in points:
+        seen = {a: s for a, s in p["ready"].items() if s is not None}
+        slowest = max(seen, key=seen.get) if seen else "-"
+        ready = f"{p['all_ready']:.1f}s" if p["all_ready"] is not None else "timeout"
+        print(f"   {p['scale']:>5} {p['size']['bytes'] / 1024:>7.1f} {p['calls']['draft']:>6.2f}s "
+              f"{p['calls']['publish']:>7.2f}s {p['calls']['init']:>6.2f}s {ready:>8} {slowest:>18}")
+
+    print("\n   Growth exponents (1 = linear):")
+    for name, curve in curves.items():
+        marker = f"  ⚠️ non-linear after scale {curve['nonlinear_from']}" if curve["nonlinear_from"] else ""
+        print(f"   {name:<20} {curve['exponents']}{marker}")
+
+
+def test_provisioning_curve(request):
+    """Chart per-call provisioning time and time-to-ready against configuration size."""
+    if not perf_enabled:
+        pytest.skip("Perf tests disabled - set PERF_TESTS=true")
+
+    token = get_auth_token("user")
+
+    print(f"\n{'='*60}")
+    print(f"📈 PROVISIONING CURVE: scales {CURVE_STEPS}")
+    print(f"{'='*60}")
+
+    points = []
+    for scale in CURVE_STEPS:
+        print(f"\n   🏗️  Scale {scale}: {config_for(scale)}")
+        points.append(_provision(scale, token))
+
+    curves = _curves(points)
+    _print_curve(points, curves)
+    report = {"steps": CURVE_STEPS, "ready_timeout": provision_ready_timeout, "points": points, "curves": curves}
+    save_json(report, CURVE_OUTPUT_FILE)
+
+    if request:
+        result = {f"Scale {p['scale']}": (f"calls {sum(p['calls'].values()):.2f}s, ready "
+                                          + (f"{p['all_ready']}s" if p["all_ready"] is not None else "timeout"))
+                  for p in points}
+        nonlinear = {name: c["nonlinear_from"] for name, c in curves.items() if c["nonlinear_from"]}
+        result["Non-linear"] = ", ".join(f"{n} after {s}" for n, s in nonlinear.items()) or "None"
+        request.node._test_result = result
+
+    timed_out = [p["scale"] for p in points if p["all_ready"] is None]
+    assert not timed_out, f"Artifacts not visible within {provision_ready_timeout}s at scales {timed_out}"
+    return report
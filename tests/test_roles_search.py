@@ -32,6 +32,7 @@ def test_roles_search():
         "MdmsCriteria": {
             "tenantId": tenantId,
             "schemaCode": "ACCESSCONTROL-ROLES.roles",
+            "isActive": True,
             "limit": 10000000
         }
     }
@@ -0,0 +1,174 @@
+"""
+Warm Service Pool
+Routine application-flow runs lease a pre-provisioned, health-checked service
+instead of provisioning one and waiting for it (see utils/service_pool.py).
+
+    test_service_pool_top_up      health-check warming services and provision
+                                  up to SERVICE_POOL_SIZE (run ahead of time, e.g. nightly)
+    test_lease_pooled_service     lease a healthy service, write it to the output
+                                  files the application tests read, and top the
+                                  pool up in the background
+
+The lease is returned at the end of the session (conftest.py). When no pooled
+service is healthy, a fresh one is provisioned and waited for as usual.
+
+Skipped unless SERVICE_POOL=true. Tuning:
+    SERVICE_POOL_SIZE            services kept in the pool (default 3)
+    SERVICE_POOL_LEASE_MINUTES   lease length before it expires (default 60)
+    SERVICE_POOL_MAX_USES        leases before a service is retired (default 20)
+    SERVICE_POOL_CHECK_MINUTES   abandon a health check after this long (default 10)
+    SERVICE_POOL_WARM_HOURS      drop warming services not healthy after this long (default 2)
+"""
+import pytest
+import time
+from utils.auth import get_auth_token
+from utils.config import tenantId, provision_ready_timeout, provision_poll_interval
+from utils.service_config_generator import generate_service_config
+from utils.service_pool import ServicePool, SERVICE_POOL_ENABLED, SERVICE_POOL_FILE
+from utils.service_readiness import expected_artifacts, check_artifacts, wait_until_ready
+from tests.test_studio_services import (
+    _mdms_draft_create, _mdms_service_create, _public_service_init, replace_placeholders, save_json,
+    MDMS_DRAFT_FILE, MDMS_FILE, SERVICE_FILE
+)
+
+_pool = {}
+_session_lease = {}
+
+
+def _expected(module, service):
+    published = replace_placeholders(generate_service_config(), {
+        "{{tenantId}}": tenantId,
+        "{{module}}": module,
+        "{{service}}": service,
+        "{{businessService}}": f"{module}.{service}"
+    })
+    return expected_artifacts(published, module, service)
+
+
+def provision_service():
+    """draft -> publish -> init without touching the E2E output files."""
+    draft = _mdms_draft_create(save=False)
+    mdms = _mdms_service_create(draft["module"], draft["service"], save=False)
+    svc = _public_service_init(mdms, save=False)
+    return {
+        "module": draft["module"],
+        "service": draft["service"],
+        "service_code": svc["service_code"],
+        "draft_id": draft["draft_id"],
+        "mdms_id": mdms["id"],
+        "service_id": svc["id"],
+        "service_status": svc["status"]
+    }
+
+
+def is_healthy(entry):
+    """Every downstream artifact of the service is visible."""
+    token = get_auth_token("user")
+    return all(check_artifacts(token, entry["module"], entry["service"], _expected(entry["module"], entry["service"])).values())
+
+
+def get_pool():
+    if "pool" not in _pool:
+        _pool["pool"] = ServicePool(provision_service, is_healthy)
+    return _pool["pool"]
+
+
+def release_session_lease():
+    """Return this session's lease and let a running top-up finish (called from conftest.py)."""
+    pool = _pool.get("pool")
+    if not pool:
+        return
+    if "entry" in _session_lease:
+        pool.release(_session_lease.pop("entry"))
+    pool.wait_for_top_up()
+
+
+def _write_output_files(entry):
+    """Record the service where the application-flow tests look for it."""
+    base = {"module": entry["module"], "service": entry["service"]}
+    save_json({**base, "draft_id": entry.get("draft_id"), "schemaCode": "Studio.ServiceConfigurationDrafts",
+               "status": "DRAFT"}, MDMS_DRAFT_FILE)
+    save_json({**base, "id": entry.get("mdms_id"), "schemaCode": "Studio.ServiceConfiguration",
+               "status": "PUBLISHED"}, MDMS_FILE)
+    save_json({**base, "service_code": entry["service_code"], "id": entry.get("service_id"),
+               "status": entry.get("service_status")}, SERVICE_FILE)
+
+
+def _status_counts(entries):
+    counts = {}
+    for e in entries:
+        counts[e["status"]] = counts.get(e["status"], 0) + 1
+    return counts
+
+
+def test_service_pool_top_up(request):
+    """Promote healthy warming services and provision the pool back to size."""
+    if not SERVICE_POOL_ENABLED:
+        pytest.skip("Service pool disabled - set SERVICE_POOL=true")
+
+    pool = get_pool()
+    print(f"\n{'='*60}")
+    print(f"🏊 SERVICE POOL TOP-UP (size {pool.size}, store {SERVICE_POOL_FILE})")
+    print(f"{'='*60}")
+
+    before = _status_counts(pool.refresh())
+    provisioned = pool.top_up(background=False)
+    after = _status_counts(pool.entries())
+    print(f"   Before: {before}")
+    print(f"   Provisioned: {provisioned}")
+    print(f"   After: {after}")
+
+    if request:
+        request.node._test_result = {
+            "Pool Size": pool.size,
+            "Before": before or "empty",
+            "Provisioned": provisioned,
+            "After": after
+        }
+
+    assert sum(after.values()) >= pool.size, f"Pool has {sum(after.values())}/{pool.size} services after top-up"
+    return after
+
+
+def test_lease_pooled_service(request):
+    """Lease a healthy pooled service (or provision one) for the application-flow tests."""
+    if not SERVICE_POOL_ENABLED:
+        pytest.skip("Service pool disabled - set SERVICE_POOL=true")
+
+    pool = get_pool()
+    start = time.time()
+    entry = pool.lease()
+
+    if entry:
+        _session_lease["entry"] = entry
+        source = "pool"
+        print(f"\n   🏊 Leased {entry['module']}.{entry['service']} ({entry['service_code']}), use #{entry['uses']}")
+    else:
+        # Cold pool: provision as a normal run would and wait for the service to come up
+        print("\n   ❄️ No healthy pooled service - provisioning a fresh one")
+        entry = provision_service()
+        source = "fresh"
+        ready = wait_until_ready(get_auth_token("user"), entry["module"], entry["service"],
+                                 _expected(entry["module"], entry["service"]), time.time(),
+                                 provision_ready_timeout, provision_poll_interval)
+        missing = [a for a, seconds in ready.items() if seconds is None]
+        if missing:
+            print(f"   ⚠️ Not visible after {provision_ready_timeout}s: {missing}")
+
+    _write_output_files(entry)
+    topping_up = pool.top_up(background=True)
+    if topping_up:
+        print(f"   🔄 Provisioning {topping_up} service(s) in the background")
+
+    if request:
+        request.node._test_result = {
+            "Module": entry["module"],
+            "Service": entry["service"],
+            "Service Code": entry["service_code"],
+            "Source": source,
+            "Lease Time": f"{time.time() - start:.2f}s",
+            "Background Top-Up": topping_up,
+            "Status": "✅ Leased" if source == "pool" else "⚠️ Pool empty - provisioned"
+        }
+
+    return entry
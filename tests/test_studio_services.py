@@ -4,6 +4,7 @@ from utils.data_loader import load_payload
 from utils.auth import get_auth_token
 from utils.request_info import get_request_info
 from utils.config import tenantId
+from utils.entity_registry import record_entity
 import random, string, json, os
 
 # Output file paths
@@ -46,12 +47,12 @@ def get_client():
 # =============================================================================
 # Helper Functions (used internally by tests)
 # =============================================================================
-def _mdms_draft_create():
-    """Internal: Create MDMS draft."""
+def _mdms_draft_create(payload=None, save=True):
+    """Internal: Create MDMS draft (from mdms_draft_create.json unless a payload is given)."""
     token, client = get_client()
     module, service = random_name("Module"), random_name("Service")
     
-    payload = load_payload("mdms", "mdms_draft_create.json")
+    payload = payload or load_payload("mdms", "mdms_draft_create.json")
     payload = replace_placeholders(payload, {
         "{{tenantId}}": tenantId,
         "{{module}}": module,
@@ -79,15 +80,17 @@ def _mdms_draft_create():
         "schemaCode": "Studio.ServiceConfigurationDrafts",
         "status": "DRAFT"
     }
-    save_json(result, MDMS_DRAFT_FILE)
+    record_entity("Service Draft", result["draft_id"], module=module, service=service)
+    if save:
+        save_json(result, MDMS_DRAFT_FILE)
     return result
 
 
-def _mdms_service_create(module, service):
-    """Internal: Publish MDMS service configuration."""
+def _mdms_service_create(module, service, payload=None, save=True):
+    """Internal: Publish MDMS service configuration (from mdms_service_create.json unless a payload is given)."""
     token, client = get_client()
     
-    payload = load_payload("mdms", "mdms_service_create.json")
+    payload = payload or load_payload("mdms", "mdms_service_create.json")
     payload = replace_placeholders(payload, {
         "{{tenantId}}": tenantId,
         "{{module}}": module,
@@ -115,11 +118,13 @@ def _mdms_service_create(module, service):
         "schemaCode": "Studio.ServiceConfiguration",
         "status": "PUBLISHED"
     }
-    save_json(result, MDMS_FILE)
+    record_entity("Service Configuration", result["id"], module=module, service=service)
+    if save:
+        save_json(result, MDMS_FILE)
     return result
 
 
-def _public_service_init(mdms):
+def _public_service_init(mdms, save=True):
     """Internal: Initialize public service."""
     token, client = get_client()
     module, service = mdms["module"], mdms["service"]
@@ -150,7 +155,9 @@ def _public_service_init(mdms):
         "id": svc.get("id"),
         "status": svc.get("status")
     }
-    save_json(result, SERVICE_FILE)
+    record_entity("Public Service", result["service_code"], label="Service Code", module=module, service=service)
+    if save:
+        save_json(result, SERVICE_FILE)
     return result
 
 
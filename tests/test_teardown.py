@@ -0,0 +1,211 @@
+"""
+Bulk Teardown
+Deactivates what test runs leave behind so the full-schema downloads of the
+verifiers (roles, actions, roleactions, idgen) stop growing:
+    - MDMS records: service configuration drafts and configurations, roles,
+      roleactions, actions and idgen formats (isActive=false)
+    - checklist definitions of those services (isActive=false)
+    - localization messages of those services in every LOCALIZATION_LOCALES
+      locale (deleted)
+    - open applications, rejected: the E2E application plus every application
+      in the entity registry (output/entities.jsonl) of the stress, benchmark,
+      fuzzer and boundary runs
+All tasks run concurrently through utils/teardown.py.
+
+Modes (TEARDOWN_MODE):
+    recorded   services recorded in output/ by E2E, benchmark and stress runs,
+               plus services retired from the warm pool (claimed from the
+               pool only once all their tasks succeeded)
+    sweep      recorded services plus every Module??????/Service?????? orphan
+               older than TEARDOWN_SWEEP_MIN_AGE_HOURS
+Services currently in the warm pool are never touched.
+
+Skipped unless TEARDOWN_MODE is set. Tuning:
+    TEARDOWN_DRY_RUN                list tasks without running them (default false)
+    TEARDOWN_CONCURRENCY            worker threads (default PERF_CONCURRENCY)
+    TEARDOWN_RATE_LIMIT             max task starts/sec, 0 for no cap (default 10)
+    TEARDOWN_SWEEP_MIN_AGE_HOURS    sweep only records older than this (default 24)
+    LOCALIZATION_LOCALES            locales whose messages are deleted (default en_IN)
+"""
+import pytest
+import json
+import os
+from utils.auth import get_auth_token
+from utils.config import perf_concurrency
+from utils.entity_registry import get_registry
+from utils.service_pool import ServicePool
+from utils.teardown import plan_teardown, execute_teardown, default_handlers
+from tests.test_application import _put_application_action, _application_details, get_client
+from tests.test_application_search import _get_applications
+
+TEARDOWN_OUTPUT_FILE = "output/teardown_report.json"
+
+TEARDOWN_MODE = os.getenv("TEARDOWN_MODE", "").lower()
+TEARDOWN_DRY_RUN = os.getenv("TEARDOWN_DRY_RUN", "false").lower() == "true"
+TEARDOWN_CONCURRENCY = int(os.getenv("TEARDOWN_CONCURRENCY", str(perf_concurrency)))
+TEARDOWN_RATE_LIMIT = float(os.getenv("TEARDOWN_RATE_LIMIT", "10"))
+TEARDOWN_SWEEP_MIN_AGE_HOURS = float(os.getenv("TEARDOWN_SWEEP_MIN_AGE_HOURS", "24"))
+
+APP_FILE = "output/application_response.json"
+
+# Output files that record provisioned services: path -> key holding a list (None for a single record)
+RECORDED_FILES = {
+    "output/mdms_draft_response.json": None,
+    "output/mdms_response.json": None,
+    "output/public_service_response.json": None,
+    "output/config_scaling_benchmark.json": "points",
+    "output/provisioning_curve.json": "points",
+    "output/multi_provisioning.json": "results"
+}
+
+TERMINAL_APPLICATION_STATES = {"REJECTED", "RESOLVED"}
+
+
+def load_json(path):
+    try:
+        return json.load(open(path))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_json(data, path):
+    os.makedirs("output", exist_ok=True)
+    json.dump(data, open(path, "w"), indent=2)
+
+
+SERVICE_RECORD_TYPES = ("Service Draft", "Service Configuration", "Public Service")
+
+
+def recorded_services(retired):
+    """Unique (module, service) pairs from the output files, the entity registry and the pool's retired services."""
+    records = []
+    for path, key in RECORDED_FILES.items():
+        data = load_json(path)
+        records.extend(data.get(key) or [] if key else [data])
+    # Throwaway services (fuzzer, boundary finder) are only in the registry
+    records.extend(r for r in get_registry().records() if r["type"] in SERVICE_RECORD_TYPES)
+    records.extend(retired)
+
+    services = {}
+    for r in records:
+        if r.get("module") and r.get("service"):
+            services[(r["module"], r["service"])] = {"module": r["module"], "service": r["service"]}
+    return list(services.values())
+
+
+def _application_tasks(keep):
+    """One task per application still to reject: registry applications plus the E2E one, outside the pool."""
+    tasks = {}
+    for r in get_registry().records():
+        if r["type"] == "Application" and r.get("service_code") and r.get("module") and r.get("service") \
+                and not str(r["id"]).startswith("unknown-"):
+            tasks[r["id"]] = {"kind": "application", "module": r["module"], "service": r["service"],
+                              "service_code": r["service_code"], "application_number": r["id"]}
+
+    # The E2E application file has the full details and its current status
+    app = load_json(APP_FILE)
+    if app.get("application_id"):
+        tasks.pop(app.get("application_number"), None)
+        if app.get("workflow_status") not in TERMINAL_APPLICATION_STATES:
+            tasks[app.get("application_number")] = {"kind": "application", "module": app["module"],
+                                                    "service": app["service"], "application": app}
+
+    kept = {(m.upper(), s.upper()) for m, s in keep}
+    return [t for t in tasks.values() if (t["module"].upper(), t["service"].upper()) not in kept]
+
+
+def _find_application(token, task):
+    """Current details of a registry application, or None when the search does not return it."""
+    apps = _get_applications(token, task["service_code"], task["application_number"])
+    app = next((a for a in apps if a.get("applicationNumber") == task["application_number"]), None)
+    return _application_details(app, task["module"], task["service"], task["service_code"]) if app else None
+
+
+def _reject_application(task):
+    token, client = get_client()
+    try:
+        app_data = task.get("application") or _find_application(token, task)
+        if not app_data:
+            return True, "not found"
+        if app_data.get("workflow_status") in TERMINAL_APPLICATION_STATES:
+            return True, app_data["workflow_status"]
+        app = _put_application_action(token, client, task["module"], task["service"], dict(app_data), "REJECT")
+    except AssertionError as e:
+        return False, str(e)[:200]
+    return True, app.get("workflowStatus")
+
+
+def test_teardown(request):
+    """Deactivate recorded (and in sweep mode, orphaned) test services concurrently."""
+    if TEARDOWN_MODE not in ("recorded", "sweep"):
+        pytest.skip("Teardown disabled - set TEARDOWN_MODE=recorded or TEARDOWN_MODE=sweep")
+
+    token = get_auth_token("user")
+    pool = ServicePool(None, None)
+    keep = [(e["module"], e["service"]) for e in pool.entries()]
+    # Retired pool services stay in the store until their teardown succeeded
+    retired = pool.retired(claim=False)
+    services = recorded_services(retired)
+
+    print(f"\n{'='*60}")
+    print(f"🧹 TEARDOWN ({TEARDOWN_MODE}{', dry run' if TEARDOWN_DRY_RUN else ''}): "
+          f"{len(services)} recorded services, {len(keep)} pooled services kept")
+    print(f"{'='*60}")
+
+    tasks, unmatched = plan_teardown(token, services, sweep=TEARDOWN_MODE == "sweep",
+                                     min_age_hours=TEARDOWN_SWEEP_MIN_AGE_HOURS, keep=keep)
+    for schema in unmatched:
+        print(f"   ⚠️ {schema}: no record matched any recorded service")
+    tasks += _application_tasks(keep)
+
+    planned = {}
+    for t in tasks:
+        kind = t.get("schema_code") or t["kind"]
+        planned[kind] = planned.get(kind, 0) + 1
+    owners = {(t.get("module"), t.get("service")) for t in tasks}
+    for kind, count in planned.items():
+        print(f"   📋 {kind}: {count}")
+    print(f"   🎯 {len(tasks)} tasks across {len(owners)} services")
+
+    if TEARDOWN_DRY_RUN:
+        results, wall = [], 0.0
+    else:
+        handlers = {**default_handlers(token), "application": _reject_application}
+        results, wall = execute_teardown(tasks, handlers, TEARDOWN_CONCURRENCY, TEARDOWN_RATE_LIMIT)
+        print(f"   ✅ {sum(r['ok'] for r in results)}/{len(results)} tasks succeeded in {wall:.2f}s")
+
+    failures = [r for r in results if not r["ok"]]
+    for f in failures[:20]:
+        print(f"   ❌ {f['kind']} {f['module']}.{f['service']}: {f['detail']}")
+
+    if not TEARDOWN_DRY_RUN:
+        failed = {(str(f["module"]).upper(), str(f["service"]).upper()) for f in failures}
+        cleaned = [e for e in retired if (e["module"].upper(), e["service"].upper()) not in failed]
+        pool.claim(cleaned)
+        if len(cleaned) < len(retired):
+            print(f"   ↩️ {len(retired) - len(cleaned)} retired pool services kept for the next teardown")
+
+    report = {
+        "mode": TEARDOWN_MODE,
+        "dry_run": TEARDOWN_DRY_RUN,
+        "services": len(owners),
+        "planned": planned,
+        "unmatched_schemas": unmatched,
+        "duration": round(wall, 2),
+        "failures": failures,
+        "results": results
+    }
+    save_json(report, TEARDOWN_OUTPUT_FILE)
+
+    if request:
+        request.node._test_result = {
+            "Mode": TEARDOWN_MODE + (" (dry run)" if TEARDOWN_DRY_RUN else ""),
+            "Services": len(owners),
+            "Planned": planned or "Nothing to tear down",
+            "Unmatched Schemas": ", ".join(unmatched) or "None",
+            "Duration": f"{wall:.2f}s",
+            "Status": "✅ Clean" if not failures else f"❌ {len(failures)} tasks failed"
+        }
+
+    assert not failures, f"{len(failures)} teardown tasks failed - see {TEARDOWN_OUTPUT_FILE}"
+    return report
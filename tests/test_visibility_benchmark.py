@@ -0,0 +1,192 @@
+"""
+Search-Index Visibility Lag Benchmark
+Creates applications at controlled write rates and polls each read path until
+the new record shows up:
+    - application GET  /public-service/v1/application/{service_code}?applicationNumber=
+    - inbox            /inbox/v2/_search
+    - individual       /health-individual/v1/_search by mobile number
+Creates are submitted to a pool on schedule, so a slow POST does not hold back
+the next one; each read path is polled on its own thread so a slow inbox scan
+does not add to the lag measured on the other paths. Reports a visibility-lag
+histogram per read path, the achieved write rate and failed writes, and how
+lag grows with the write rate.
+
+Skipped unless PERF_TESTS=true. Tuning:
+    VISIBILITY_RATES           comma-separated write rates in applications/sec (default "0.5,1,2")
+    VISIBILITY_APPS_PER_RATE   applications created per rate (default 10)
+    VISIBILITY_TIMEOUT         seconds to wait for a record on each read path (default 120)
+    VISIBILITY_POLL_INTERVAL   seconds between polls (default 1)
+"""
+import pytest
+import json
+import os
+import random
+import string
+import time
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from utils.api_client import APIClient
+from utils.auth import get_auth_token
+from utils.config import tenantId, perf_enabled
+from utils.perf import summarize_latencies, histogram, throughput
+from tests.test_application import _create_application
+from tests.test_application_search import _get_applications
+from tests.test_inbox_search import scan_inbox
+from tests.test_individual_search import find_individual
+
+MDMS_FILE = "output/mdms_response.json"
+SERVICE_FILE = "output/public_service_response.json"
+VISIBILITY_OUTPUT_FILE = "output/visibility_lag_benchmark.json"
+
+VISIBILITY_RATES = [float(r) for r in os.getenv("VISIBILITY_RATES", "0.5,1,2").split(",") if r.strip()]
+VISIBILITY_APPS_PER_RATE = int(os.getenv("VISIBILITY_APPS_PER_RATE", "10"))
+VISIBILITY_TIMEOUT = float(os.getenv("VISIBILITY_TIMEOUT", "120"))
+VISIBILITY_POLL_INTERVAL = float(os.getenv("VISIBILITY_POLL_INTERVAL", "1"))
+LAG_BUCKETS = [0.5, 1, 2, 5, 10, 30, 60]
+
+
+def load_json(path):
+    return json.load(open(path))
+
+
+def save_json(data, path):
+    os.makedirs("output", exist_ok=True)
+    json.dump(data, open(path, "w"), indent=2)
+
+
+def get_client():
+    token = get_auth_token("user")
+    client = APIClient(token=token)
+    client.headers["x-tenant-id"] = tenantId
+    return token, client
+
+
+def random_mobile():
+    """Random 10-digit mobile so every application gets its own individual."""
+    return int("9" + "".join(random.choices(string.digits, k=9)))
+
+
+# =============================================================================
+# Read paths: each returns True once the application is visible
+# =============================================================================
+def _visible_in_application_search(token, app):
+    apps = _get_applications(token, app["service_code"], app["application_number"])
+    return any(a.get("applicationNumber") == app["application_number"] for a in apps)
+
+
+def _visible_in_inbox(token, app):
+    return scan_inbox(token, app["module"], app["service"], app["application_number"])["found"]
+
+
+def _visible_in_individual_search(token, app):
+    return find_individual(token, app["mobile_number"])[0] is not None
+
+
+READ_PATHS = {
+    "application_search": _visible_in_application_search,
+    "inbox": _visible_in_inbox,
+    "individual_search": _visible_in_individual_search
+}
+
+
+def _poll_path(token, app, check):
+    """Poll one read path until the application appears; returns the lag or None."""
+    created_at = app["last_transition_time"]
+    deadline = created_at + VISIBILITY_TIMEOUT
+    while time.time() < deadline:
+        try:
+            visible = check(token, app)
+        except (AssertionError, requests.RequestException):
+            visible = False
+        if visible:
+            return time.time() - created_at
+        time.sleep(VISIBILITY_POLL_INTERVAL)
+    return None
+
+
+def _write(token, client, mdms, svc, poll_pool):
+    """Create one application and start polling every read path; a failed create is reported, not raised."""
+    try:
+        app = _create_application(token, client, mdms["module"], mdms["service"], svc["service_code"],
+                                  mobile_number=random_mobile())
+    except (AssertionError, requests.RequestException) as e:
+        return {"error": str(e)[:300]}
+    return {
+        "written_at": time.time(),
+        "polls": {name: poll_pool.submit(_poll_path, token, app, check) for name, check in READ_PATHS.items()}
+    }
+
+
+def _run_rate(token, client, mdms, svc, rate, count):
+    """Create `count` applications at `rate`/sec, polling visibility in the background."""
+    interval = 1 / rate
+    started = time.time()
+
+    with ThreadPoolExecutor(max_workers=max(1, count)) as write_pool, \
+            ThreadPoolExecutor(max_workers=max(1, count * len(READ_PATHS))) as poll_pool:
+        next_at = time.monotonic()
+        writes = []
+        for _ in range(count):
+            time.sleep(max(0, next_at - time.monotonic()))
+            next_at += interval
+            writes.append(write_pool.submit(_write, token, client, mdms, svc, poll_pool))
+        writes = [w.result() for w in writes]
+        ok = [w for w in writes if "polls" in w]
+        samples = [{name: f.result() for name, f in w["polls"].items()} for w in ok]
+
+    errors = [w["error"] for w in writes if "error" in w]
+    # Writes that completed per second, measured up to the last successful create
+    achieved = throughput(len(ok), max((w["written_at"] for w in ok), default=started) - started)
+
+    per_path = {}
+    for name in READ_PATHS:
+        lags = [s[name] for s in samples if s[name] is not None]
+        per_path[name] = {
+            "not_visible": sum(1 for s in samples if s[name] is None),
+            "histogram": histogram(lags, LAG_BUCKETS),
+            **summarize_latencies(lags)
+        }
+    return {"achieved_write_rate": achieved, "failed_writes": len(errors), "errors": errors[:10],
+            "read_paths": per_path}
+
+
+def test_visibility_lag_benchmark(request):
+    """Measure how long new applications take to become visible on each read path."""
+    if not perf_enabled:
+        pytest.skip("Perf tests disabled - set PERF_TESTS=true")
+
+    token, client = get_client()
+    mdms, svc = load_json(MDMS_FILE), load_json(SERVICE_FILE)
+
+    print(f"\n{'='*60}")
+    print(f"👁️ VISIBILITY LAG: rates {VISIBILITY_RATES}/s x {VISIBILITY_APPS_PER_RATE} applications")
+    print(f"{'='*60}")
+
+    by_rate = []
+    for rate in VISIBILITY_RATES:
+        run = _run_rate(token, client, mdms, svc, rate, VISIBILITY_APPS_PER_RATE)
+        by_rate.append({"write_rate": rate, **run})
+        print(f"\n📈 {rate}/s (achieved {run['achieved_write_rate']}/s, {run['failed_writes']} failed writes)")
+        for name, stats in run["read_paths"].items():
+            print(f"   {name}: p50={stats['p50']}s p95={stats['p95']}s max={stats['max']}s not visible={stats['not_visible']}")
+
+    report = {
+        "service_code": svc["service_code"],
+        "apps_per_rate": VISIBILITY_APPS_PER_RATE,
+        "timeout": VISIBILITY_TIMEOUT,
+        "by_rate": by_rate
+    }
+    save_json(report, VISIBILITY_OUTPUT_FILE)
+
+    if request:
+        result = {
+            "Write Rates": str(VISIBILITY_RATES),
+            "Achieved Rates": str([r["achieved_write_rate"] for r in by_rate]),
+            "Failed Writes": sum(r["failed_writes"] for r in by_rate),
+            "Apps per Rate": VISIBILITY_APPS_PER_RATE
+        }
+        for name in READ_PATHS:
+            result[f"{name} p95 by rate"] = " → ".join(f"{r['read_paths'][name]['p95']}s" for r in by_rate)
+        request.node._test_result = result
+
+    return report
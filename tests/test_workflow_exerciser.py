@@ -0,0 +1,107 @@
+"""
+Workflow Path-Cover Exerciser
+Builds the state graph from the live businessservice definition, computes a
+small set of action paths that together take every transition (REJECT,
+REASSIGN, REOPEN, ... as well as the happy path) and runs each path on a fresh
+application concurrently.
+"""
+import json
+from utils.api_client import APIClient
+from utils.auth import get_auth_token
+from utils.config import tenantId, perf_concurrency
+from utils.perf import run_concurrently
+from utils.workflow_graph import build_state_graph, transition_path_cover
+from tests.test_application import _create_application, _put_application_action
+from tests.test_workflow_search import _fetch_business_service
+
+MDMS_FILE = "output/mdms_response.json"
+SERVICE_FILE = "output/public_service_response.json"
+
+def load_json(path):
+    return json.load(open(path))
+
+def get_client():
+    token = get_auth_token("user")
+    client = APIClient(token=token)
+    client.headers["x-tenant-id"] = tenantId
+    return token, client
+
+
+def _run_path(token, client, module, service, service_code, path):
+    """Create a fresh application with the path's first action and apply the rest in order."""
+    _, first_action, first_state = path[0]
+    app_data = _create_application(token, client, module, service, service_code, action=first_action)
+    steps = [{"action": first_action, "expected": first_state, "actual": app_data["workflow_status"]}]
+
+    for _, action, to_state in path[1:]:
+        if steps[-1]["actual"] != steps[-1]["expected"]:
+            break
+        app = _put_application_action(token, client, module, service, app_data, action)
+        steps.append({"action": action, "expected": to_state, "actual": app.get("workflowStatus")})
+
+    return {
+        "application_number": app_data["application_number"],
+        "actions": [e[1] for e in path],
+        "steps": steps,
+        "api_calls": len(steps),
+        "success": len(steps) == len(path) and all(s["actual"] == s["expected"] for s in steps)
+    }
+
+
+def test_workflow_path_cover(request):
+    """Take every workflow transition with the fewest application writes."""
+    token, client = get_client()
+    mdms, svc = load_json(MDMS_FILE), load_json(SERVICE_FILE)
+    module, service, service_code = mdms["module"], mdms["service"], svc["service_code"]
+
+    wf = _fetch_business_service(token, f"{module}.{service}")
+    graph = build_state_graph(wf.get("states", []))
+    paths, unreachable = transition_path_cover(graph)
+
+    print(f"\n🔀 {len(graph['edges'])} transitions → {len(paths)} paths")
+    for path in paths:
+        print(f"   - {' → '.join(e[1] for e in path)}")
+    for e in unreachable:
+        print(f"   ⚠️ Unreachable from start: {e[0]} --{e[1]}--> {e[2]}")
+
+    results, wall = run_concurrently(
+        lambda path: _run_path(token, client, module, service, service_code, path),
+        paths,
+        perf_concurrency
+    )
+
+    covered = set()
+    for path, r in zip(paths, results):
+        if r.get("success"):
+            covered.update(path)
+        else:
+            print(f"   ❌ Path failed: {r.get('actions') or r.get('error')}")
+            for s in r.get("steps", []):
+                if s["actual"] != s["expected"]:
+                    print(f"      {s['action']}: expected {s['expected']}, got {s['actual']}")
+
+    result = {
+        "business_service": f"{module}.{service}",
+        "total_transitions": len(graph["edges"]),
+        "covered_transitions": len(covered),
+        "paths": [[e[1] for e in p] for p in paths],
+        "unreachable": [list(e) for e in unreachable],
+        "api_calls": sum(r.get("api_calls", 0) for r in results),
+        "duration": round(wall, 2),
+        "results": results
+    }
+
+    print(f"\n📊 Covered {len(covered)}/{len(graph['edges'])} transitions with {result['api_calls']} calls in {wall:.2f}s")
+
+    if request:
+        request.node._test_result = {
+            "Business Service": result["business_service"],
+            "Transitions": result["total_transitions"],
+            "Paths": len(paths),
+            "API Calls": result["api_calls"],
+            "Covered": f"{len(covered)}/{len(graph['edges'])}",
+            "Status": "✅ Full Coverage" if len(covered) == len(graph["edges"]) else "❌ Incomplete"
+        }
+
+    assert all(r.get("success") for r in results), "One or more workflow paths failed"
+    return result
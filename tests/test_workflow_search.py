@@ -13,15 +13,8 @@ def get_token():
     return get_auth_token("user")
 
 
-def test_workflow_validate():
-    """Validate workflow states are correctly created"""
-    token = get_token()
-    mdms = load_json(MDMS_FILE)
-    
-    module = mdms["module"]
-    service = mdms["service"]
-    business_service = f"{module}.{service}"
-    
+def _fetch_business_service(token, business_service):
+    """Helper: Fetch the live businessservice definition"""
     url = f"{BASE_URL}/egov-workflow-v2/egov-wf/businessservice/_search?tenantId={tenantId}&businessServices={business_service}"
     
     headers = {
@@ -42,7 +35,19 @@ def test_workflow_validate():
     
     assert len(business_services) > 0, f"Workflow not found for: {business_service}"
     
-    wf = business_services[0]
+    return business_services[0]
+
+
+def test_workflow_validate():
+    """Validate workflow states are correctly created"""
+    token = get_token()
+    mdms = load_json(MDMS_FILE)
+    
+    module = mdms["module"]
+    service = mdms["service"]
+    business_service = f"{module}.{service}"
+    
+    wf = _fetch_business_service(token, business_service)
     states = wf.get("states", [])
     
     # Extract state names
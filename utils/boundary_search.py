@@ -0,0 +1,48 @@
+def find_limit(accepts, low=1, cap=1024 * 1024):
+    """
+    Find the largest size the server accepts, assuming acceptance is monotone
+    (everything up to the limit passes, everything above it is rejected).
+
+    Grows the probe size exponentially from `low` until a rejection or `cap`,
+    then binary-searches the gap, so a limit n is found in O(log n) requests.
+
+    Args:
+        accepts (callable): accepts(n) -> True when a request of size n is accepted
+        low (int): Smallest size to probe; expected to be accepted
+        cap (int): Largest size worth probing
+
+    Returns:
+        dict: {
+            "max_accepted": int or None (None when even `low` is rejected),
+            "min_rejected": int or None (None when `cap` is accepted),
+            "probes": [[size, accepted], ...] in probe order
+        }
+    """
+    probes = []
+
+    def probe(n):
+        ok = bool(accepts(n))
+        probes.append([n, ok])
+        return ok
+
+    if not probe(low):
+        return {"max_accepted": None, "min_rejected": low, "probes": probes}
+
+    good, bad = low, None
+    while bad is None:
+        if good >= cap:
+            return {"max_accepted": good, "min_rejected": None, "probes": probes}
+        n = min(good * 2, cap)
+        if probe(n):
+            good = n
+        else:
+            bad = n
+
+    while bad - good > 1:
+        mid = (good + bad) // 2
+        if probe(mid):
+            good = mid
+        else:
+            bad = mid
+
+    return {"max_accepted": good, "min_rejected": bad, "probes": probes}
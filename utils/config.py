@@ -17,4 +17,16 @@ search_params = {
 
 individual=os.getenv("SERVICE_INDIVIDUAL")
 project=os.getenv("SERVICE_PROJECT")
-mdms=os.getenv("SERVICE_MDMS")
\ No newline at end of file
+mdms=os.getenv("SERVICE_MDMS")
+
+# Performance / load-test parameters (perf tests are skipped unless PERF_TESTS=true)
+perf_enabled = os.getenv("PERF_TESTS", "false").lower() == "true"
+perf_concurrency = int(os.getenv("PERF_CONCURRENCY", "8"))
+
+# Bounded wait for workflow state propagation (seconds)
+workflow_wait_timeout = float(os.getenv("WORKFLOW_WAIT_TIMEOUT", "30"))
+workflow_poll_interval = float(os.getenv("WORKFLOW_POLL_INTERVAL", "1"))
+
+# Bounded wait for a newly provisioned service's artifacts to become visible (seconds)
+provision_ready_timeout = float(os.getenv("PROVISION_READY_TIMEOUT", "300"))
+provision_poll_interval = float(os.getenv("PROVISION_POLL_INTERVAL", "2"))
@@ -1,160 +1,198 @@
 import json
 import os
+import shutil
+import tempfile
 from datetime import datetime
-import re
+from functools import lru_cache
+from html import escape
+from utils.entity_registry import get_registry, ENTITY_REGISTRY_FILE
 
 def parse_ids_file():
-    """Parse the ids.txt file to extract created entities"""
+    """Entities created by the latest run, grouped by type, from the entity registry"""
     base_path = os.path.dirname(__file__)
-    ids_file_path = os.path.join(base_path, "..", "output", "ids.txt")
-
-    entities = {
-        "Facility": [],
-        "Household": [],
-        "Individual": [],
-        "Product": [],
-        "Product Variant": [],
-        "Project": [],
-        "Project Resource": []
-    }
+    registry = get_registry(os.path.abspath(os.path.join(base_path, "..", ENTITY_REGISTRY_FILE)))
 
     try:
-        with open(os.path.abspath(ids_file_path), 'r', encoding='utf-8') as f:
-            content = f.read()
-
-            # Extract Facility IDs
-            facilities = re.findall(r'Facility ID: (F-[\d-]+)', content)
-            entities["Facility"] = facilities
-
-            # Extract Household IDs
-            households = re.findall(r'Household ID: (H-[\d-]+)', content)
-            entities["Household"] = households
-
-            # Extract Individual IDs
-            individuals = re.findall(r'Individual Ind ID: (IND-[\d-]+)', content)
-            entities["Individual"] = individuals
-
-            # Extract Product IDs
-            products = re.findall(r'Product ID: (P-[\d-]+)', content)
-            entities["Product"] = products
-
-            # Extract Variant IDs
-            variants = re.findall(r'Variant ID: (PVAR-[\d-]+)', content)
-            entities["Product Variant"] = variants
-
-            # Extract Project IDs (UUID format)
-            projects = re.findall(r'Project ID: ([a-f0-9-]{36})', content)
-            entities["Project"] = projects
-
-            # Extract Project Resource IDs
-            project_resources = re.findall(r'Project Resource ID: (PR-[\d-]+)', content)
-            entities["Project Resource"] = project_resources
-
+        return registry.entities_by_type(registry.latest_run_id())
     except Exception as e:
-        print(f"Warning: Could not parse ids.txt: {e}")
-
-    return entities
-
-def parse_test_results():
-    """Parse test results from JSON file"""
+        print(f"Warning: Could not read entity registry: {e}")
+        return {}
+
+# Results are read in chunks of this many characters, never as one document
+RESULTS_READ_CHUNK = 1 << 16
+# Tests per embedded JSON chunk of the dashboard's test table
+TEST_CHUNK_ROWS = 5000
+
+
+class _JsonStream:
+    """Minimal incremental reader over a JSON text file, one value at a time"""
+
+    def __init__(self, f):
+        self.f = f
+        self.buf = ""
+        self.pos = 0
+        self.decoder = json.JSONDecoder()
+
+    def _more(self):
+        chunk = self.f.read(RESULTS_READ_CHUNK)
+        if not chunk:
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Next non-whitespace character, '' at end of file"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._more():
+                return ""
+
+    def skip(self, char):
+        """Consume char if it is next"""
+        if self.peek() == char:
+            self.pos += 1
+            return True
+        return False
+
+    def expect(self, char):
+        assert self.skip(char), f"Expected '{char}' in test results at offset {self.pos}"
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._more():
+                    raise
+                continue
+            # A number cut by the chunk boundary decodes fine; read on until it is complete
+            if end == len(self.buf) and self._more():
+                continue
+            self.pos = end
+            return value
+
+
+def stream_test_results(header):
+    """
+    Yield the entries of "tests" in output/test_results.json one at a time.
+    The other top-level fields (total, passed, start_time, ...) are stored in
+    header as they are read, so memory does not grow with the number of tests.
+    """
     base_path = os.path.dirname(__file__)
-    results_file = os.path.join(base_path, "..", "output", "test_results.json")
-
-    default_results = {
-        "total": 0,
-        "passed": 0,
-        "failed": 0,
-        "skipped": 0,
-        "tests": [],
-        "start_time": None,
-        "end_time": None
-    }
+    results_file = os.path.abspath(os.path.join(base_path, "..", "output", "test_results.json"))
+    if not os.path.exists(results_file):
+        return
 
     try:
-        if os.path.exists(os.path.abspath(results_file)):
-            with open(os.path.abspath(results_file), 'r', encoding='utf-8') as f:
-                return json.load(f)
-    except Exception as e:
+        with open(results_file, 'r', encoding='utf-8') as f:
+            stream = _JsonStream(f)
+            stream.expect("{")
+            while not stream.skip("}"):
+                key = stream.value()
+                stream.expect(":")
+                if key == "tests":
+                    stream.expect("[")
+                    while not stream.skip("]"):
+                        yield stream.value()
+                        stream.skip(",")
+                else:
+                    header[key] = stream.value()
+                stream.skip(",")
+    except (AssertionError, ValueError) as e:
         print(f"Warning: Could not parse test results: {e}")
 
-    return default_results
+# Test module prefix -> dashboard service; the longest matching prefix wins
+SERVICE_PREFIXES = {
+    "test_studio_services": "Studio",
+    "test_application": "Application",
+    "test_application_search": "Application Search",
+    "test_checklist_": "Checklist",
+    "test_workflow_": "Workflow",
+    "test_process_instance_search": "Workflow",
+    "test_inbox_search": "Inbox",
+    "test_individual_search": "Individual",
+    "test_roles_search": "Access Control",
+    "test_actions_roleactions_search": "Access Control",
+    "test_idgen_search": "IDGen",
+    "test_localization_search": "Localization",
+    "test_data_driven": "Data Driven",
+    "test_service_pool": "Service Pool",
+    "test_teardown": "Teardown",
+    "test_e2e_flow": "E2E",
+    # Perf modes
+    "test_application_search_benchmark": "Performance",
+    "test_checklist_stress": "Performance",
+    "test_visibility_benchmark": "Performance",
+    "test_boundary_finder": "Performance",
+    "test_config_scaling": "Performance",
+    "test_provisioning_curve": "Performance",
+    "test_multi_provisioning": "Performance",
+    "test_fuzzer": "Performance",
+    # Older suites
+    "test_household_service": "Household",
+    "test_individual_service": "Individual",
+    "test_facility_service": "Facility",
+    "test_product_service": "Product",
+    "test_project_service": "Project",
+    "test_boundary_service": "Boundary",
+    "test_mdms_service": "MDMS"
+}
+_PREFIXES_LONGEST_FIRST = sorted(SERVICE_PREFIXES, key=len, reverse=True)
+
+
+@lru_cache(maxsize=None)
+def _module_service(module_path):
+    module = os.path.basename(module_path).lower()
+    if module.endswith(".py"):
+        module = module[:-3]
+    return next((SERVICE_PREFIXES[p] for p in _PREFIXES_LONGEST_FIRST if module.startswith(p)), "Other")
 
-def count_operations(test_results):
-    """Count create and search operations from test names"""
-    operations = {
-        "create": 0,
-        "search": 0,
-        "other": 0
-    }
-
-    for test in test_results.get("tests", []):
-        test_name = test.get("name", "").lower()
-        if "create" in test_name:
-            operations["create"] += 1
-        elif "search" in test_name:
-            operations["search"] += 1
-        else:
-            operations["other"] += 1
-
-    return operations
 
 def get_service_name(test_name):
-    """Extract service name from test file path (e.g., tests/test_household_service.py::test_name)"""
-    test_name_lower = test_name.lower()
-
-    # Extract service from test file name (more accurate than test function name)
-    if "test_household_service" in test_name_lower:
-        return "Household"
-    elif "test_individual_service" in test_name_lower:
-        return "Individual"
-    elif "test_facility_service" in test_name_lower:
-        return "Facility"
-    elif "test_product_service" in test_name_lower:
-        return "Product"
-    elif "test_project_service" in test_name_lower:
-        return "Project"
-    elif "test_boundary_service" in test_name_lower:
-        return "Boundary"
-    elif "test_mdms_service" in test_name_lower:
-        return "MDMS"
-    else:
-        return "Other"
-
-
-def get_service_breakdown(test_results):
-    """Get test breakdown by service"""
-    services = {}
-
-    for test in test_results.get("tests", []):
-        test_name = test.get("name", "")
-        service = get_service_name(test_name)
-
-        if service not in services:
-            services[service] = {"passed": 0, "failed": 0, "total": 0}
-
-        services[service]["total"] += 1
-        if test.get("outcome") == "passed":
-            services[service]["passed"] += 1
-        elif test.get("outcome") == "failed":
-            services[service]["failed"] += 1
-
-    return services
-
-
-def get_tests_by_service(test_results):
-    """Group tests by service"""
+    """Service of a test node id (e.g., tests/test_application.py::test_name), memoized per module"""
+    return _module_service(test_name.split("::", 1)[0])
+
+
+def aggregate_results(tests, on_test=None):
+    """
+    Compute every dashboard aggregate in one pass over the test results:
+    outcome counts, create/search operation counts and the per-service
+    breakdown. on_test(service, test) is called for each test during the
+    same pass.
+    """
+    outcomes = {"passed": 0, "failed": 0, "skipped": 0}
+    operations = {"create": 0, "search": 0, "other": 0}
     services = {}
 
-    for test in test_results.get("tests", []):
-        test_name = test.get("name", "")
-        service = get_service_name(test_name)
-
-        if service not in services:
-            services[service] = []
-
-        services[service].append(test)
-
-    return services
+    for test in tests:
+        name = test.get("name", "")
+        outcome = test.get("outcome")
+        service = get_service_name(name)
+
+        lowered = name.lower()
+        operations["create" if "create" in lowered else "search" if "search" in lowered else "other"] += 1
+
+        stats = services.get(service)
+        if stats is None:
+            stats = services[service] = {"passed": 0, "failed": 0, "total": 0}
+        if on_test:
+            on_test(service, test)
+        stats["total"] += 1
+        if outcome in stats:
+            stats[outcome] += 1
+        if outcome in outcomes:
+            outcomes[outcome] += 1
+
+    return {
+        "outcomes": outcomes,
+        "operations": operations,
+        "services": services
+    }
 
 def calculate_duration(start_time, end_time):
     """Calculate test execution duration"""
@@ -169,29 +207,8 @@ def calculate_duration(start_time, end_time):
     except:
         return "N/A"
 
-def generate_dashboard():
-    """Generate an interactive HTML dashboard"""
-    entities = parse_ids_file()
-    test_results = parse_test_results()
-    operations = count_operations(test_results)
-    service_breakdown = get_service_breakdown(test_results)
-    tests_by_service = get_tests_by_service(test_results)
-
-    # Count entities
-    entity_counts = {k: len(v) for k, v in entities.items()}
-    total_entities = sum(entity_counts.values())
-
-    # Calculate pass rate
-    total_tests = test_results.get("total", 0)
-    passed_tests = test_results.get("passed", 0)
-    pass_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
-
-    # Get timestamp
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    duration = calculate_duration(test_results.get("start_time"), test_results.get("end_time"))
-
-    # Generate HTML
-    html_content = f"""<!DOCTYPE html>
+# Static page pieces; everything that varies is written between them
+DASHBOARD_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -199,173 +216,173 @@ def generate_dashboard():
     <title>Test Execution Dashboard</title>
     <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             padding: 20px;
             min-height: 100vh;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 1600px;
             margin: 0 auto;
-        }}
+        }
 
-        .header {{
+        .header {
             background: white;
             padding: 30px;
             border-radius: 15px;
             box-shadow: 0 10px 30px rgba(0,0,0,0.2);
             margin-bottom: 30px;
             text-align: center;
-        }}
+        }
 
-        .header h1 {{
+        .header h1 {
             color: #667eea;
             font-size: 2.5em;
             margin-bottom: 10px;
-        }}
+        }
 
-        .header .timestamp {{
+        .header .timestamp {
             color: #666;
             font-size: 1em;
-        }}
+        }
 
-        .stats-grid {{
+        .stats-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 20px;
             margin-bottom: 30px;
-        }}
+        }
 
-        .stat-card {{
+        .stat-card {
             background: white;
             padding: 25px;
             border-radius: 15px;
             box-shadow: 0 5px 15px rgba(0,0,0,0.1);
             transition: transform 0.3s ease, box-shadow 0.3s ease;
             text-align: center;
-        }}
+        }
 
-        .stat-card:hover {{
+        .stat-card:hover {
             transform: translateY(-5px);
             box-shadow: 0 10px 25px rgba(0,0,0,0.2);
-        }}
+        }
 
-        .stat-card .stat-number {{
+        .stat-card .stat-number {
             font-size: 2.5em;
             font-weight: bold;
             margin-bottom: 10px;
-        }}
+        }
 
-        .stat-card .stat-label {{
+        .stat-card .stat-label {
             font-size: 0.9em;
             color: #666;
             text-transform: uppercase;
             letter-spacing: 1px;
-        }}
+        }
 
-        .stat-card.success .stat-number {{ color: #28a745; }}
-        .stat-card.danger .stat-number {{ color: #dc3545; }}
-        .stat-card.info .stat-number {{ color: #667eea; }}
-        .stat-card.warning .stat-number {{ color: #ffc107; }}
+        .stat-card.success .stat-number { color: #28a745; }
+        .stat-card.danger .stat-number { color: #dc3545; }
+        .stat-card.info .stat-number { color: #667eea; }
+        .stat-card.warning .stat-number { color: #ffc107; }
 
-        .charts-container {{
+        .charts-container {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(450px, 1fr));
             gap: 30px;
             margin-bottom: 30px;
-        }}
+        }
 
-        .chart-card {{
+        .chart-card {
             background: white;
             padding: 25px;
             border-radius: 15px;
             box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-        }}
+        }
 
-        .chart-card h2 {{
+        .chart-card h2 {
             color: #667eea;
             margin-bottom: 20px;
             font-size: 1.3em;
-        }}
+        }
 
-        .data-table {{
+        .data-table {
             background: white;
             padding: 25px;
             border-radius: 15px;
             box-shadow: 0 5px 15px rgba(0,0,0,0.1);
             overflow-x: auto;
             margin-bottom: 30px;
-        }}
+        }
 
-        .data-table h2 {{
+        .data-table h2 {
             color: #667eea;
             margin-bottom: 20px;
             font-size: 1.3em;
-        }}
+        }
 
-        table {{
+        table {
             width: 100%;
             border-collapse: collapse;
-        }}
+        }
 
-        th, td {{
+        th, td {
             padding: 12px;
             text-align: left;
             border-bottom: 1px solid #eee;
-        }}
+        }
 
-        th {{
+        th {
             background: #f8f9fa;
             color: #667eea;
             font-weight: 600;
             text-transform: uppercase;
             font-size: 0.85em;
             letter-spacing: 1px;
-        }}
+        }
 
-        tr:hover {{
+        tr:hover {
             background: #f8f9fa;
-        }}
+        }
 
-        .badge {{
+        .badge {
             display: inline-block;
             padding: 5px 12px;
             border-radius: 20px;
             font-size: 0.85em;
             font-weight: 600;
-        }}
+        }
 
-        .badge-success {{ background: #d4edda; color: #155724; }}
-        .badge-danger {{ background: #f8d7da; color: #721c24; }}
-        .badge-info {{ background: #d1ecf1; color: #0c5460; }}
-        .badge-warning {{ background: #fff3cd; color: #856404; }}
+        .badge-success { background: #d4edda; color: #155724; }
+        .badge-danger { background: #f8d7da; color: #721c24; }
+        .badge-info { background: #d1ecf1; color: #0c5460; }
+        .badge-warning { background: #fff3cd; color: #856404; }
 
-        .entity-id {{
+        .entity-id {
             font-family: 'Courier New', monospace;
             background: #f0f0f0;
             padding: 4px 8px;
             border-radius: 4px;
             font-size: 0.9em;
-        }}
+        }
 
-        .progress-bar {{
+        .progress-bar {
             width: 100%;
             height: 25px;
             background: #e9ecef;
             border-radius: 10px;
             overflow: hidden;
             margin: 10px 0;
-        }}
+        }
 
-        .progress-fill {{
+        .progress-fill {
             height: 100%;
             background: linear-gradient(90deg, #28a745, #20c997);
             display: flex;
@@ -374,141 +391,136 @@ def generate_dashboard():
             color: white;
             font-weight: bold;
             font-size: 0.85em;
-        }}
+        }
 
-        .collapsible-header {{
+        .collapsible-header {
             cursor: pointer;
             display: flex;
             justify-content: space-between;
             align-items: center;
             user-select: none;
             transition: color 0.3s ease;
-        }}
+        }
 
-        .collapsible-header:hover {{
+        .collapsible-header:hover {
             color: #4c5fd5;
-        }}
+        }
 
-        .collapsible-header .toggle-icon {{
+        .collapsible-header .toggle-icon {
             font-size: 1.2em;
             transition: transform 0.3s ease;
-        }}
+        }
 
-        .collapsible-header.collapsed .toggle-icon {{
+        .collapsible-header.collapsed .toggle-icon {
             transform: rotate(-90deg);
-        }}
+        }
 
-        .collapsible-content {{
+        .collapsible-content {
             max-height: 2000px;
             overflow: hidden;
             transition: max-height 0.3s ease-out;
-        }}
+        }
 
-        .collapsible-content.collapsed {{
+        .collapsible-content.collapsed {
             max-height: 0;
-        }}
+        }
 
-        .service-section {{
-            margin-bottom: 15px;
-            border: 1px solid #e9ecef;
-            border-radius: 10px;
-            overflow: hidden;
-        }}
-
-        .service-header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 15px 20px;
-            cursor: pointer;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            user-select: none;
-            transition: opacity 0.3s ease;
-        }}
-
-        .service-header:hover {{
-            opacity: 0.9;
-        }}
-
-        .service-header h3 {{
-            margin: 0;
-            font-size: 1.1em;
+        .test-toolbar {
             display: flex;
-            align-items: center;
+            flex-wrap: wrap;
             gap: 10px;
-        }}
-
-        .service-header .service-stats {{
-            display: flex;
-            gap: 15px;
             align-items: center;
-        }}
+            margin: 15px 0;
+        }
 
-        .service-header .service-stats span {{
-            font-size: 0.9em;
-            padding: 4px 10px;
-            border-radius: 15px;
-            background: rgba(255,255,255,0.2);
-        }}
+        .test-toolbar input,
+        .test-toolbar select {
+            padding: 8px 12px;
+            border: 1px solid #dee2e6;
+            border-radius: 8px;
+            font-size: 0.95em;
+        }
 
-        .service-header .toggle-icon {{
-            font-size: 1em;
-            transition: transform 0.3s ease;
-        }}
+        .test-toolbar input {
+            flex: 1;
+            min-width: 220px;
+        }
 
-        .service-header.collapsed .toggle-icon {{
-            transform: rotate(-90deg);
-        }}
+        .test-count {
+            color: #6c757d;
+            font-size: 0.9em;
+        }
 
-        .service-tests {{
-            max-height: 1000px;
+        /* Fixed row height: the table only renders the rows in view (ROW_HEIGHT in the script) */
+        .test-grid-row {
+            display: grid;
+            grid-template-columns: 180px 1fr 130px 100px;
+            gap: 10px;
+            align-items: center;
+            height: 40px;
+            padding: 0 15px;
+            border-bottom: 1px solid #e9ecef;
             overflow: hidden;
-            transition: max-height 0.3s ease-out;
-        }}
+        }
 
-        .service-tests.collapsed {{
-            max-height: 0;
-        }}
+        .entity-grid-row {
+            grid-template-columns: 200px 1fr 130px;
+        }
 
-        .service-tests table {{
-            margin: 0;
-        }}
+        .test-grid-head {
+            background: #667eea;
+            color: white;
+            font-weight: 600;
+            border-radius: 8px 8px 0 0;
+        }
 
-        .service-tests th {{
-            background: #f0f0f0;
-        }}
+        .test-viewport {
+            position: relative;
+            height: 480px;
+            overflow-y: auto;
+            border: 1px solid #e9ecef;
+            border-top: none;
+        }
 
-        .test-row {{
+        .test-window {
+            position: absolute;
+            top: 0;
+            left: 0;
+            right: 0;
+        }
+
+        .test-row {
             cursor: pointer;
-        }}
+        }
 
-        .test-row:hover {{
+        .test-row:hover,
+        .test-row.selected {
             background: #e8f4fc !important;
-        }}
+        }
 
-        .test-name {{
+        .test-name {
             font-family: monospace;
             font-size: 0.9em;
             color: #667eea;
             text-decoration: underline;
-        }}
+            white-space: nowrap;
+            overflow: hidden;
+            text-overflow: ellipsis;
+        }
 
-        .test-details {{
+        .test-details {
             display: none;
             background: #f8f9fa;
-            border-top: 1px dashed #dee2e6;
-        }}
-
-        .test-details.show {{
-            display: table-row;
-        }}
-
-        .test-details td {{
+            border: 1px dashed #dee2e6;
+            border-radius: 0 0 8px 8px;
             padding: 15px 20px;
-        }}
+        }
 
-        .test-output {{
+        .test-details.show {
+            display: block;
+        }
+
+        .test-output {
             background: linear-gradient(135deg, #f0f3ff 0%, #e8ecf8 100%);
             color: #4a5568;
             padding: 15px;
@@ -521,39 +533,393 @@ def generate_dashboard():
             max-height: 300px;
             overflow-y: auto;
             margin: 0;
-        }}
+        }
 
-        .test-output-label {{
+        .test-output-label {
             font-weight: 600;
             color: #667eea;
             margin-bottom: 8px;
             display: block;
-        }}
+        }
 
-        .test-error {{
+        .test-error {
             background: #fff5f5;
             border-left: 4px solid #dc3545;
             padding: 10px 15px;
             margin-top: 10px;
             border-radius: 0 8px 8px 0;
-        }}
+        }
 
-        .test-error pre {{
+        .test-error pre {
             color: #dc3545;
             margin: 0;
             white-space: pre-wrap;
             font-size: 0.85em;
-        }}
+        }
 
-        .no-output {{
+        .no-output {
             color: #6c757d;
             font-style: italic;
-        }}
+        }
     </style>
 </head>
 <body>
     <div class="container">
-        <div class="header">
+"""
+
+DASHBOARD_SCRIPT = """    <script>
+        const DASHBOARD = JSON.parse(document.getElementById('dashboardData').textContent);
+
+        // Test Results Chart
+        const testResultsCtx = document.getElementById('testResultsChart').getContext('2d');
+        new Chart(testResultsCtx, {
+            type: 'doughnut',
+            data: {
+                labels: ['Passed', 'Failed', 'Skipped'],
+                datasets: [{
+                    data: [DASHBOARD.outcomes.passed, DASHBOARD.outcomes.failed, DASHBOARD.outcomes.skipped],
+                    backgroundColor: [
+                        'rgba(40, 167, 69, 0.8)',
+                        'rgba(220, 53, 69, 0.8)',
+                        'rgba(255, 193, 7, 0.8)'
+                    ],
+                    borderWidth: 2
+                }]
+            },
+            options: {
+                responsive: true,
+                plugins: {
+                    legend: {
+                        position: 'bottom'
+                    }
+                }
+            }
+        });
+
+        // Entities Chart
+        const entitiesCtx = document.getElementById('entitiesChart').getContext('2d');
+        new Chart(entitiesCtx, {
+            type: 'bar',
+            data: {
+                labels: Object.keys(DASHBOARD.entities),
+                datasets: [{
+                    label: 'Entities Created',
+                    data: Object.values(DASHBOARD.entities),
+                    backgroundColor: 'rgba(102, 126, 234, 0.8)',
+                    borderColor: 'rgba(102, 126, 234, 1)',
+                    borderWidth: 2
+                }]
+            },
+            options: {
+                responsive: true,
+                plugins: {
+                    legend: {
+                        display: false
+                    }
+                },
+                scales: {
+                    y: {
+                        beginAtZero: true,
+                        ticks: {
+                            stepSize: 1
+                        }
+                    }
+                }
+            }
+        });
+
+        // Service Breakdown Chart
+        const serviceBreakdownCtx = document.getElementById('serviceBreakdownChart').getContext('2d');
+        new Chart(serviceBreakdownCtx, {
+            type: 'bar',
+            data: {
+                labels: DASHBOARD.services.map(s => s.name),
+                datasets: [{
+                    label: 'Tests Executed',
+                    data: DASHBOARD.services.map(s => s.total),
+                    backgroundColor: 'rgba(118, 75, 162, 0.8)',
+                    borderColor: 'rgba(118, 75, 162, 1)',
+                    borderWidth: 2
+                }]
+            },
+            options: {
+                responsive: true,
+                plugins: {
+                    legend: {
+                        display: false
+                    }
+                },
+                scales: {
+                    y: {
+                        beginAtZero: true,
+                        ticks: {
+                            stepSize: 1
+                        }
+                    }
+                }
+            }
+        });
+
+        // Toggle collapsible section
+        function toggleSection(sectionId) {
+            const content = document.getElementById(sectionId);
+            const header = content.previousElementSibling;
+
+            content.classList.toggle('collapsed');
+            header.classList.toggle('collapsed');
+            if (sectionId === 'testDetails') {
+                renderTests();
+            }
+            if (sectionId === 'entityDetails') {
+                initEntityTable();
+            }
+        }
+
+        // Test table: rows come from the testRows-N JSON chunks and only the rows in view are in the DOM
+        const ROW_HEIGHT = 40;
+        const OVERSCAN = 10;
+        const STATUS = {passed: ['badge-success', '✓'], failed: ['badge-danger', '✗']};
+        const tests = {service: [], name: [], lowerName: [], outcome: [], duration: [], hasDetails: []};
+        const detailChunks = {};
+        let visible = [];
+        let selected = -1;
+
+        function escapeHtml(value) {
+            return String(value).replace(/[&<>"']/g, c => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'})[c]);
+        }
+
+        function loadTests() {
+            for (let n = 0; n < DASHBOARD.tests.rowChunks; n++) {
+                const chunk = document.getElementById('testRows-' + n);
+                for (const [service, name, outcome, duration, hasDetails] of JSON.parse(chunk.textContent)) {
+                    tests.service.push(service);
+                    tests.name.push(name);
+                    tests.lowerName.push(name.toLowerCase());
+                    tests.outcome.push(outcome);
+                    tests.duration.push(duration);
+                    tests.hasDetails.push(hasDetails);
+                }
+                // The parsed rows are all that is needed from here on
+                chunk.remove();
+            }
+        }
+
+        function applyFilters() {
+            const query = document.getElementById('testSearch').value.trim().toLowerCase();
+            const service = document.getElementById('serviceFilter').value;
+            const outcome = document.getElementById('outcomeFilter').value;
+            const serviceIdx = service === '' ? -1 : Number(service);
+            const outcomeIdx = outcome === '' ? -1 : Number(outcome);
+
+            visible = [];
+            for (let i = 0; i < tests.name.length; i++) {
+                if (serviceIdx !== -1 && tests.service[i] !== serviceIdx) continue;
+                if (outcomeIdx !== -1 && tests.outcome[i] !== outcomeIdx) continue;
+                if (query && !tests.lowerName[i].includes(query)) continue;
+                visible.push(i);
+            }
+            document.getElementById('testCount').textContent = `${visible.length} of ${tests.name.length} tests`;
+            document.getElementById('testSpacer').style.height = (visible.length * ROW_HEIGHT) + 'px';
+            document.getElementById('testViewport').scrollTop = 0;
+            renderTests();
+        }
+
+        function renderTests() {
+            const viewport = document.getElementById('testViewport');
+            const first = Math.max(0, Math.floor(viewport.scrollTop / ROW_HEIGHT) - OVERSCAN);
+            const last = Math.min(visible.length, first + Math.ceil(viewport.clientHeight / ROW_HEIGHT) + 2 * OVERSCAN);
+            const rows = [];
+            for (let v = first; v < last; v++) {
+                const i = visible[v];
+                const service = DASHBOARD.tests.services[tests.service[i]];
+                const outcome = DASHBOARD.tests.outcomes[tests.outcome[i]];
+                const [badge, icon] = STATUS[outcome] || ['badge-warning', '⊘'];
+                rows.push(`<div class="test-grid-row test-row${i === selected ? ' selected' : ''}" onclick="showTestDetails(${i})">` +
+                    `<span><span class="badge badge-info">${escapeHtml(service.icon)} ${escapeHtml(service.name)}</span></span>` +
+                    `<span class="test-name" title="${escapeHtml(tests.name[i])}">${escapeHtml(tests.name[i])}</span>` +
+                    `<span><span class="badge ${badge}">${icon} ${escapeHtml(outcome.toUpperCase())}</span></span>` +
+                    `<span>${tests.duration[i]}s</span></div>`);
+            }
+            const win = document.getElementById('testWindow');
+            win.style.transform = `translateY(${first * ROW_HEIGHT}px)`;
+            win.innerHTML = rows.join('');
+        }
+
+        // Details are parsed one chunk at a time, the first time a test in that chunk is opened
+        function testDetails(i) {
+            const n = Math.floor(i / DASHBOARD.tests.chunkSize);
+            if (!(n in detailChunks)) {
+                detailChunks[n] = JSON.parse(document.getElementById('testDetails-' + n).textContent);
+            }
+            return detailChunks[n][i % DASHBOARD.tests.chunkSize];
+        }
+
+        function showTestDetails(i) {
+            const pane = document.getElementById('testDetailPane');
+            if (selected === i) {
+                selected = -1;
+                pane.classList.remove('show');
+                renderTests();
+                return;
+            }
+            selected = i;
+            const [stdout, stderr, error] = tests.hasDetails[i] ? testDetails(i) : ['', '', ''];
+            let html = `<span class="test-output-label">${escapeHtml(tests.name[i])}</span>`;
+            if (stdout) {
+                html += `<span class="test-output-label">📤 Output:</span><pre class="test-output">${escapeHtml(stdout)}</pre>`;
+            }
+            if (stderr) {
+                html += `<span class="test-output-label">⚠️ Stderr:</span><pre class="test-output" style="border-left: 3px solid #ffc107;">${escapeHtml(stderr)}</pre>`;
+            }
+            if (error) {
+                html += `<div class="test-error"><span class="test-output-label">❌ Error:</span><pre>${escapeHtml(error)}</pre></div>`;
+            }
+            if (!stdout && !stderr && !error) {
+                html += '<span class="no-output">No output captured for this test.</span>';
+            }
+            pane.innerHTML = html;
+            pane.classList.add('show');
+            renderTests();
+        }
+
+        function initTestTable() {
+            DASHBOARD.tests.services.forEach((s, idx) => {
+                document.getElementById('serviceFilter').add(new Option(`${s.icon} ${s.name}`, idx));
+            });
+            DASHBOARD.tests.outcomes.forEach((o, idx) => {
+                document.getElementById('outcomeFilter').add(new Option(o.toUpperCase(), idx));
+            });
+            loadTests();
+
+            let searchTimer = null;
+            document.getElementById('testSearch').addEventListener('input', () => {
+                clearTimeout(searchTimer);
+                searchTimer = setTimeout(applyFilters, 150);
+            });
+            document.getElementById('serviceFilter').addEventListener('change', applyFilters);
+            document.getElementById('outcomeFilter').addEventListener('change', applyFilters);
+
+            let frame = null;
+            document.getElementById('testViewport').addEventListener('scroll', () => {
+                if (frame === null) {
+                    frame = requestAnimationFrame(() => { frame = null; renderTests(); });
+                }
+            });
+            applyFilters();
+        }
+
+        // Entity table: the entityRows-N chunks are parsed the first time the section is opened,
+        // then rendered through a viewport like the test table
+        const entities = {type: [], id: [], lowerId: []};
+        let visibleEntities = null;
+
+        function initEntityTable() {
+            if (visibleEntities !== null) {
+                renderEntities();
+                return;
+            }
+            for (let n = 0; n < DASHBOARD.entityTable.rowChunks; n++) {
+                const chunk = document.getElementById('entityRows-' + n);
+                for (const [type, id] of JSON.parse(chunk.textContent)) {
+                    entities.type.push(type);
+                    entities.id.push(id);
+                    entities.lowerId.push(String(id).toLowerCase());
+                }
+                chunk.remove();
+            }
+            DASHBOARD.entityTable.types.forEach((t, idx) => {
+                document.getElementById('entityTypeFilter').add(new Option(`${t.icon} ${t.name} (${t.count})`, idx));
+            });
+            let searchTimer = null;
+            document.getElementById('entitySearch').addEventListener('input', () => {
+                clearTimeout(searchTimer);
+                searchTimer = setTimeout(applyEntityFilters, 150);
+            });
+            document.getElementById('entityTypeFilter').addEventListener('change', applyEntityFilters);
+            let frame = null;
+            document.getElementById('entityViewport').addEventListener('scroll', () => {
+                if (frame === null) {
+                    frame = requestAnimationFrame(() => { frame = null; renderEntities(); });
+                }
+            });
+            applyEntityFilters();
+        }
+
+        function applyEntityFilters() {
+            const query = document.getElementById('entitySearch').value.trim().toLowerCase();
+            const type = document.getElementById('entityTypeFilter').value;
+            const typeIdx = type === '' ? -1 : Number(type);
+
+            visibleEntities = [];
+            for (let i = 0; i < entities.id.length; i++) {
+                if (typeIdx !== -1 && entities.type[i] !== typeIdx) continue;
+                if (query && !entities.lowerId[i].includes(query)) continue;
+                visibleEntities.push(i);
+            }
+            document.getElementById('entityCount').textContent = `${visibleEntities.length} of ${entities.id.length} entities`;
+            document.getElementById('entitySpacer').style.height = (visibleEntities.length * ROW_HEIGHT) + 'px';
+            document.getElementById('entityViewport').scrollTop = 0;
+            renderEntities();
+        }
+
+        function renderEntities() {
+            const viewport = document.getElementById('entityViewport');
+            const first = Math.max(0, Math.floor(viewport.scrollTop / ROW_HEIGHT) - OVERSCAN);
+            const last = Math.min(visibleEntities.length, first + Math.ceil(viewport.clientHeight / ROW_HEIGHT) + 2 * OVERSCAN);
+            const rows = [];
+            for (let v = first; v < last; v++) {
+                const i = visibleEntities[v];
+                const type = DASHBOARD.entityTable.types[entities.type[i]];
+                rows.push('<div class="test-grid-row entity-grid-row">' +
+                    `<span><span class="badge badge-info">${escapeHtml(type.icon)} ${escapeHtml(type.name)}</span></span>` +
+                    `<span><span class="entity-id">${escapeHtml(entities.id[i])}</span></span>` +
+                    '<span><span class="badge badge-success">✓ Created</span></span></div>');
+            }
+            const win = document.getElementById('entityWindow');
+            win.style.transform = `translateY(${first * ROW_HEIGHT}px)`;
+            win.innerHTML = rows.join('');
+        }
+
+        initTestTable();
+    </script>
+</body>
+</html>
+"""
+
+SERVICE_ICONS = {
+    "Individual": "👤",
+    "Household": "🏠",
+    "Facility": "🏢",
+    "Product": "📦",
+    "Project": "📋",
+    "Boundary": "🗺️",
+    "MDMS": "📊",
+    "Studio": "🛠️",
+    "Application": "📝",
+    "Application Search": "🔍",
+    "Checklist": "✅",
+    "Workflow": "🔄",
+    "Inbox": "📥",
+    "Access Control": "🔐",
+    "IDGen": "🔢",
+    "Localization": "🌐",
+    "Data Driven": "🧪",
+    "Service Pool": "♻️",
+    "Teardown": "🧹",
+    "E2E": "🚀",
+    "Performance": "⚡",
+    "Other": "📁"
+}
+
+
+def _json_script(element_id, data):
+    """Embed data as a JSON block that cannot close the surrounding script tag"""
+    payload = json.dumps(data, separators=(",", ":")).replace("</", "<\\/")
+    return f'    <script type="application/json" id="{element_id}">{payload}</script>\n'
+
+
+def _summary_html(timestamp, duration, outcomes, total_tests, pass_rate, operations, total_entities, entity_types):
+    return f"""        <div class="header">
             <h1>🚀 Test Execution Dashboard</h1>
             <p class="timestamp">Generated: {timestamp}</p>
             <p class="timestamp">Duration: {duration}</p>
@@ -566,11 +932,11 @@ def generate_dashboard():
                 <div class="stat-label">Total Tests</div>
             </div>
             <div class="stat-card success">
-                <div class="stat-number">{test_results.get('passed', 0)}</div>
+                <div class="stat-number">{outcomes['passed']}</div>
                 <div class="stat-label">Passed</div>
             </div>
             <div class="stat-card danger">
-                <div class="stat-number">{test_results.get('failed', 0)}</div>
+                <div class="stat-number">{outcomes['failed']}</div>
                 <div class="stat-label">Failed</div>
             </div>
             <div class="stat-card warning">
@@ -594,7 +960,7 @@ def generate_dashboard():
                 <div class="stat-label">Entities Created</div>
             </div>
             <div class="stat-card info">
-                <div class="stat-number">{len(entity_counts)}</div>
+                <div class="stat-number">{entity_types}</div>
                 <div class="stat-label">Service Types</div>
             </div>
         </div>
@@ -614,332 +980,251 @@ def generate_dashboard():
                 <canvas id="serviceBreakdownChart"></canvas>
             </div>
         </div>
+"""
 
-        <!-- Service Breakdown Table -->
+
+def _table_html(title, headers, rows):
+    """Yield a data table piece by piece, one row at a time"""
+    yield f"""
         <div class="data-table">
-            <h2>🏢 Service-wise Test Breakdown</h2>
+            <h2>{title}</h2>
             <table>
                 <thead>
                     <tr>
-                        <th>Service</th>
-                        <th>Total Tests</th>
-                        <th>Passed</th>
-                        <th>Failed</th>
-                        <th>Success Rate</th>
-                    </tr>
+"""
+    for header in headers:
+        yield f"                        <th>{header}</th>\n"
+    yield """                    </tr>
                 </thead>
                 <tbody>
 """
+    for cells in rows:
+        yield "                    <tr>\n" + "".join(f"                        <td>{c}</td>\n" for c in cells) + "                    </tr>\n"
+    yield """                </tbody>
+            </table>
+        </div>
+"""
 
-    # Add service breakdown rows
-    for service, stats in service_breakdown.items():
-        total = stats["total"]
-        passed = stats["passed"]
-        success_rate = (passed / total * 100) if total > 0 else 0
 
-        html_content += f"""
-                    <tr>
-                        <td><span class="badge badge-info">{service}</span></td>
-                        <td>{stats['total']}</td>
-                        <td>{stats['passed']}</td>
-                        <td>{stats['failed']}</td>
-                        <td>{success_rate:.1f}%</td>
-                    </tr>
-"""
+def _service_rows(service_breakdown):
+    for service, stats in service_breakdown.items():
+        success_rate = (stats["passed"] / stats["total"] * 100) if stats["total"] > 0 else 0
+        yield (f'<span class="badge badge-info">{escape(service)}</span>', stats["total"], stats["passed"],
+               stats["failed"], f"{success_rate:.1f}%")
+
+
+class _ChunkSpool:
+    """
+    JSON array items spooled to a temporary file and later copied into the
+    page as <script type="application/json" id="<prefix>-N"> blocks of at
+    most TEST_CHUNK_ROWS items each.
+    """
+
+    def __init__(self, prefix):
+        self.prefix = prefix
+        self.count = 0
+        self.file = tempfile.TemporaryFile("w+", encoding="utf-8")
+
+    def add(self, item):
+        if self.count % TEST_CHUNK_ROWS:
+            self.file.write(",")
+        else:
+            if self.count:
+                self.file.write("]</script>\n")
+            self.file.write(f'    <script type="application/json" id="{self.prefix}-{self.count // TEST_CHUNK_ROWS}">[')
+        self.file.write(json.dumps(item, separators=(",", ":")).replace("</", "<\\/"))
+        self.count += 1
 
-    html_content += """
-                </tbody>
-            </table>
-        </div>
+    @property
+    def chunks(self):
+        return -(-self.count // TEST_CHUNK_ROWS)
 
-        <!-- Entities Table -->
-        <div class="data-table">
-            <h2>🔖 Created Entities</h2>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Service</th>
-                        <th>Entity ID</th>
-                        <th>Status</th>
-                    </tr>
-                </thead>
-                <tbody>
-"""
+    def copy_to(self, out):
+        if self.count:
+            self.file.write("]</script>\n")
+        self.file.seek(0)
+        shutil.copyfileobj(self.file, out)
 
-    # Add entity rows
-    for service, ids in entities.items():
-        for entity_id in ids:
-            html_content += f"""
-                    <tr>
-                        <td><span class="badge badge-info">{service}</span></td>
-                        <td><span class="entity-id">{entity_id}</span></td>
-                        <td><span class="badge badge-success">✓ Created</span></td>
-                    </tr>
-"""
+    def close(self):
+        self.file.close()
 
-    html_content += """
-                </tbody>
-            </table>
-        </div>
 
-        <!-- Test Details Table (Grouped by Service) -->
+# The test table is virtualized in the browser; this is its static markup
+TEST_TABLE_HTML = """
+        <!-- Test Details: rows are rendered in the browser from the testRows-N chunks, only the ones in view -->
         <div class="data-table">
             <div class="collapsible-header collapsed" onclick="toggleSection('testDetails')">
-                <h2>📝 Test Execution Details (by Service)</h2>
+                <h2>📝 Test Execution Details</h2>
                 <span class="toggle-icon">▼</span>
             </div>
             <div id="testDetails" class="collapsible-content collapsed">
-"""
-
-    # Add service-wise test sections
-    service_icons = {
-        "Individual": "👤",
-        "Household": "🏠",
-        "Facility": "🏢",
-        "Product": "📦",
-        "Project": "📋",
-        "Boundary": "🗺️",
-        "MDMS": "📊",
-        "Other": "📁"
-    }
-
-    for service, tests in tests_by_service.items():
-        service_id = service.lower().replace(" ", "_")
-        passed_count = sum(1 for t in tests if t.get("outcome") == "passed")
-        failed_count = sum(1 for t in tests if t.get("outcome") == "failed")
-        total_count = len(tests)
-        icon = service_icons.get(service, "📁")
-
-        html_content += f"""
-            <div class="service-section">
-                <div class="service-header collapsed" onclick="toggleService('{service_id}')">
-                    <h3>{icon} {service} Service</h3>
-                    <div class="service-stats">
-                        <span>Total: {total_count}</span>
-                        <span style="background: rgba(40,167,69,0.3);">✓ {passed_count}</span>
-                        <span style="background: rgba(220,53,69,0.3);">✗ {failed_count}</span>
-                        <span class="toggle-icon">▼</span>
-                    </div>
+                <div class="test-toolbar">
+                    <input id="testSearch" type="search" placeholder="🔍 Search tests...">
+                    <select id="serviceFilter"><option value="">All services</option></select>
+                    <select id="outcomeFilter"><option value="">All outcomes</option></select>
+                    <span id="testCount" class="test-count"></span>
                 </div>
-                <div id="{service_id}" class="service-tests collapsed">
-                    <table>
-                        <thead>
-                            <tr>
-                                <th>Test Name</th>
-                                <th>Status</th>
-                                <th>Duration</th>
-                            </tr>
-                        </thead>
-                        <tbody>
-"""
-        for idx, test in enumerate(tests):
-            test_name = test.get("name", "Unknown").split("::")[-1]
-            outcome = test.get("outcome", "unknown")
-            duration = test.get("duration", 0)
-            stdout = test.get("stdout", "")
-            stderr = test.get("stderr", "")
-            error = test.get("error", "")
-
-            badge_class = "badge-success" if outcome == "passed" else "badge-danger" if outcome == "failed" else "badge-warning"
-            status_icon = "✓" if outcome == "passed" else "✗" if outcome == "failed" else "⊘"
-
-            # Unique ID for this test's details row
-            test_id = f"{service_id}_test_{idx}"
-
-            # Escape HTML characters in output
-            stdout_escaped = stdout.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;") if stdout else ""
-            stderr_escaped = stderr.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;") if stderr else ""
-            error_escaped = error.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;") if error else ""
-
-            html_content += f"""
-                            <tr class="test-row" onclick="toggleTestDetails('{test_id}')">
-                                <td class="test-name">{test_name}</td>
-                                <td><span class="badge {badge_class}">{status_icon} {outcome.upper()}</span></td>
-                                <td>{duration}s</td>
-                            </tr>
-                            <tr class="test-details" id="{test_id}">
-                                <td colspan="3">
-"""
-            # Add stdout if available
-            if stdout_escaped:
-                html_content += f"""
-                                    <span class="test-output-label">📤 Output:</span>
-                                    <pre class="test-output">{stdout_escaped}</pre>
-"""
-            # Add stderr if available
-            if stderr_escaped:
-                html_content += f"""
-                                    <span class="test-output-label">⚠️ Stderr:</span>
-                                    <pre class="test-output" style="border-left: 3px solid #ffc107;">{stderr_escaped}</pre>
-"""
-            # Add error if available (for failed tests)
-            if error_escaped:
-                html_content += f"""
-                                    <div class="test-error">
-                                        <span class="test-output-label">❌ Error:</span>
-                                        <pre>{error_escaped}</pre>
-                                    </div>
-"""
-            # If no output at all
-            if not stdout_escaped and not stderr_escaped and not error_escaped:
-                html_content += """
-                                    <span class="no-output">No output captured for this test.</span>
-"""
-
-            html_content += """
-                                </td>
-                            </tr>
-"""
-
-        html_content += """
-                        </tbody>
-                    </table>
+                <div class="test-grid-row test-grid-head">
+                    <span>Service</span>
+                    <span>Test Name</span>
+                    <span>Status</span>
+                    <span>Duration</span>
                 </div>
-            </div>
-"""
-
-    html_content += """
+                <div id="testViewport" class="test-viewport">
+                    <div id="testSpacer"></div>
+                    <div id="testWindow" class="test-window"></div>
+                </div>
+                <div id="testDetailPane" class="test-details"></div>
             </div>
         </div>
     </div>
 """
 
-    # Prepare chart data
-    service_names = list(service_breakdown.keys())
-    service_totals = [service_breakdown[s]["total"] for s in service_names]
-
-    html_content += f"""
 
-    <script>
-        // Test Results Chart
-        const testResultsCtx = document.getElementById('testResultsChart').getContext('2d');
-        new Chart(testResultsCtx, {{
-            type: 'doughnut',
-            data: {{
-                labels: ['Passed', 'Failed', 'Skipped'],
-                datasets: [{{
-                    data: [{test_results.get('passed', 0)}, {test_results.get('failed', 0)}, {test_results.get('skipped', 0)}],
-                    backgroundColor: [
-                        'rgba(40, 167, 69, 0.8)',
-                        'rgba(220, 53, 69, 0.8)',
-                        'rgba(255, 193, 7, 0.8)'
-                    ],
-                    borderWidth: 2
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                plugins: {{
-                    legend: {{
-                        position: 'bottom'
-                    }}
-                }}
-            }}
-        }});
-
-        // Entities Chart
-        const entitiesCtx = document.getElementById('entitiesChart').getContext('2d');
-        new Chart(entitiesCtx, {{
-            type: 'bar',
-            data: {{
-                labels: {json.dumps(list(entity_counts.keys()))},
-                datasets: [{{
-                    label: 'Entities Created',
-                    data: {json.dumps(list(entity_counts.values()))},
-                    backgroundColor: 'rgba(102, 126, 234, 0.8)',
-                    borderColor: 'rgba(102, 126, 234, 1)',
-                    borderWidth: 2
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                plugins: {{
-                    legend: {{
-                        display: false
-                    }}
-                }},
-                scales: {{
-                    y: {{
-                        beginAtZero: true,
-                        ticks: {{
-                            stepSize: 1
-                        }}
-                    }}
-                }}
-            }}
-        }});
-
-        // Service Breakdown Chart
-        const serviceBreakdownCtx = document.getElementById('serviceBreakdownChart').getContext('2d');
-        new Chart(serviceBreakdownCtx, {{
-            type: 'bar',
-            data: {{
-                labels: {json.dumps(service_names)},
-                datasets: [{{
-                    label: 'Tests Executed',
-                    data: {json.dumps(service_totals)},
-                    backgroundColor: 'rgba(118, 75, 162, 0.8)',
-                    borderColor: 'rgba(118, 75, 162, 1)',
-                    borderWidth: 2
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                plugins: {{
-                    legend: {{
-                        display: false
-                    }}
-                }},
-                scales: {{
-                    y: {{
-                        beginAtZero: true,
-                        ticks: {{
-                            stepSize: 1
-                        }}
-                    }}
-                }}
-            }}
-        }});
-
-        // Toggle collapsible section
-        function toggleSection(sectionId) {{
-            const content = document.getElementById(sectionId);
-            const header = content.previousElementSibling;
-
-            content.classList.toggle('collapsed');
-            header.classList.toggle('collapsed');
-        }}
-
-        // Toggle service section
-        function toggleService(serviceId) {{
-            const content = document.getElementById(serviceId);
-            const header = content.previousElementSibling;
-
-            content.classList.toggle('collapsed');
-            header.classList.toggle('collapsed');
-        }}
-
-        // Toggle test details
-        function toggleTestDetails(testId) {{
-            const detailsRow = document.getElementById(testId);
-            detailsRow.classList.toggle('show');
-        }}
-    </script>
-</body>
-</html>
+# Created entities are rendered in the browser like the test table; this is their static markup
+ENTITY_TABLE_HTML = """
+        <!-- Created Entities: rows are rendered in the browser from the entityRows-N chunks, only the ones in view -->
+        <div class="data-table">
+            <div class="collapsible-header collapsed" onclick="toggleSection('entityDetails')">
+                <h2>🔖 Created Entities</h2>
+                <span class="toggle-icon">▼</span>
+            </div>
+            <div id="entityDetails" class="collapsible-content collapsed">
+                <div class="test-toolbar">
+                    <input id="entitySearch" type="search" placeholder="🔍 Search entity ids...">
+                    <select id="entityTypeFilter"><option value="">All types</option></select>
+                    <span id="entityCount" class="test-count"></span>
+                </div>
+                <div class="test-grid-row entity-grid-row test-grid-head">
+                    <span>Type</span>
+                    <span>Entity ID</span>
+                    <span>Status</span>
+                </div>
+                <div id="entityViewport" class="test-viewport">
+                    <div id="entitySpacer"></div>
+                    <div id="entityWindow" class="test-window"></div>
+                </div>
+            </div>
+        </div>
 """
 
-    # Write dashboard file
-    base_path = os.path.dirname(__file__)
-    dashboard_path = os.path.join(base_path, "..", "reports", "dashboard.html")
 
-    os.makedirs(os.path.dirname(os.path.abspath(dashboard_path)), exist_ok=True)
+def _entity_spool(entities):
+    """Compact [type, id] rows for the virtualized entity table, and the type list they index"""
+    spool = _ChunkSpool("entityRows")
+    types = []
+    for idx, (entity_type, ids) in enumerate(entities.items()):
+        types.append({"name": entity_type, "icon": SERVICE_ICONS.get(entity_type, "📁"), "count": len(ids)})
+        for entity_id in ids:
+            spool.add([idx, str(entity_id)])
+    return spool, types
+
+
+class _TestTableSpool:
+    """
+    Compact rows [service, name, outcome, duration, has details] for the
+    virtualized table, plus a parallel details chunk per row chunk holding
+    [stdout, stderr, error] (0 when there is nothing), parsed on first expand.
+    """
+
+    def __init__(self):
+        self.rows = _ChunkSpool("testRows")
+        self.details = _ChunkSpool("testDetails")
+        self.services = {}
+        self.outcomes = {}
+
+    def add(self, service, test):
+        outputs = [test.get(k) or "" for k in ("stdout", "stderr", "error")]
+        outcome = test.get("outcome", "unknown")
+        self.rows.add([
+            self.services.setdefault(service, len(self.services)),
+            test.get("name", "Unknown").split("::")[-1],
+            self.outcomes.setdefault(outcome, len(self.outcomes)),
+            test.get("duration", 0),
+            int(any(outputs))
+        ])
+        self.details.add(outputs if any(outputs) else 0)
+
+    def data(self):
+        return {
+            "chunkSize": TEST_CHUNK_ROWS,
+            "rowChunks": self.rows.chunks,
+            "services": [{"name": s, "icon": SERVICE_ICONS.get(s, "📁")} for s in self.services],
+            "outcomes": list(self.outcomes)
+        }
+
+    def copy_to(self, out):
+        self.rows.copy_to(out)
+        self.details.copy_to(out)
+
+    def close(self):
+        self.rows.close()
+        self.details.close()
 
-    with open(os.path.abspath(dashboard_path), 'w', encoding='utf-8') as f:
-        f.write(html_content)
 
-    print(f"✓ Dashboard generated: {os.path.abspath(dashboard_path)}")
-    return os.path.abspath(dashboard_path)
+def generate_dashboard():
+    """
+    Generate an interactive HTML dashboard.
+
+    Test results are streamed from output/test_results.json and aggregated in
+    one pass, which also spools each test as a compact JSON row (and its
+    output as a separate details entry). The page is written section by
+    section and the spools are copied in as JSON chunks; the browser renders
+    only the table rows in view, so neither generating nor opening the page
+    grows with the DOM size of every test.
+    """
+    header = {}
+    table = _TestTableSpool()
+    entity_rows = None
+
+    try:
+        aggregates = aggregate_results(stream_test_results(header), on_test=table.add)
+        service_breakdown = aggregates["services"]
+        # Header counts written with the results win; the aggregated ones fill in when they are missing
+        outcomes = {k: header.get(k, v) for k, v in aggregates["outcomes"].items()}
+        total_tests = header.get("total", sum(stats["total"] for stats in service_breakdown.values()))
+        pass_rate = (outcomes["passed"] / total_tests * 100) if total_tests > 0 else 0
+
+        entities = parse_ids_file()
+        entity_counts = {k: len(v) for k, v in entities.items()}
+        entity_rows, entity_types = _entity_spool(entities)
+
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        duration = calculate_duration(header.get("start_time"), header.get("end_time"))
+
+        base_path = os.path.dirname(__file__)
+        dashboard_path = os.path.abspath(os.path.join(base_path, "..", "reports", "dashboard.html"))
+        os.makedirs(os.path.dirname(dashboard_path), exist_ok=True)
+
+        # Write next to the target and swap it in, so a half-written page is never served
+        tmp_path = f"{dashboard_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as out:
+            out.write(DASHBOARD_HEAD)
+            out.write(_summary_html(timestamp, duration, outcomes, total_tests, pass_rate, aggregates["operations"],
+                                    sum(entity_counts.values()), len(entity_counts)))
+            out.writelines(_table_html("🏢 Service-wise Test Breakdown",
+                                       ("Service", "Total Tests", "Passed", "Failed", "Success Rate"),
+                                       _service_rows(service_breakdown)))
+            out.write(ENTITY_TABLE_HTML)
+            out.write(TEST_TABLE_HTML)
+            entity_rows.copy_to(out)
+            table.copy_to(out)
+            out.write(_json_script("dashboardData", {
+                "outcomes": outcomes,
+                "entities": entity_counts,
+                "services": [{"name": s, "total": stats["total"]} for s, stats in service_breakdown.items()],
+                "tests": table.data(),
+                "entityTable": {"rowChunks": entity_rows.chunks, "types": entity_types}
+            }))
+            out.write(DASHBOARD_SCRIPT)
+        os.replace(tmp_path, dashboard_path)
+    finally:
+        table.close()
+        if entity_rows:
+            entity_rows.close()
+
+    print(f"✓ Dashboard generated: {dashboard_path}")
+    return dashboard_path
 
 if __name__ == "__main__":
     dashboard_path = generate_dashboard()
@@ -1,5 +1,6 @@
 import json
 import os
+from utils.entity_registry import get_registry, ENTITY_REGISTRY_FILE
 
 def load_payload(service_name, filename):
     """
@@ -21,7 +22,7 @@ def load_payload(service_name, filename):
 def clear_ids_file():
     """
     Clear the ids.txt file to start fresh test execution.
-    This function removes all content from output/ids.txt file.
+    This function removes all content from output/ids.txt and the entity registry.
     """
     base_path = os.path.dirname(__file__)  # current directory: utils/
     ids_file_path = os.path.join(base_path, "..", "output", "ids.txt")
@@ -32,3 +33,5 @@ def clear_ids_file():
         print("✓ Cleared ids.txt file for fresh test execution")
     except Exception as e:
         print(f"Warning: Could not clear ids.txt file: {e}")
+
+    get_registry(os.path.abspath(os.path.join(base_path, "..", ENTITY_REGISTRY_FILE))).clear()
@@ -0,0 +1,233 @@
+import fcntl
+import json
+import os
+import threading
+import time
+
+ENTITY_REGISTRY_FILE = "output/entities.jsonl"
+# Written by the older suites as "<label>: <id>" lines next to the registry; still
+# read so their lookups keep working
+LEGACY_IDS_FILE = "ids.txt"
+
+# Legacy ids.txt label -> entity type
+LEGACY_LABELS = {
+    "Facility ID": "Facility",
+    "Household ID": "Household",
+    "Individual Ind ID": "Individual",
+    "Product ID": "Product",
+    "Variant ID": "Product Variant",
+    "Project ID": "Project",
+    "Project Resource ID": "Project Resource"
+}
+
+# Every process of one pytest run (xdist workers inherit the environment) records under the same run id
+RUN_ID_ENV = "ENTITY_RUN_ID"
+
+_registries = {}
+
+
+def current_run_id():
+    """Run id of this test run, created on first use and shared with child processes."""
+    if not os.getenv(RUN_ID_ENV):
+        os.environ[RUN_ID_ENV] = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+    return os.environ[RUN_ID_ENV]
+
+
+class EntityRegistry:
+    """
+    Append-only JSON Lines record of the entities a run created.
+
+    Each line is {"type", "label", "id", "run_id", "timestamp", ...}. A record
+    is appended with one write() on an O_APPEND descriptor while holding an
+    exclusive flock, so parallel workers never interleave lines. The in-memory
+    index is built in one pass and afterwards only reads the bytes appended
+    since the last refresh; lookups by label are dict hits. The legacy ids.txt
+    is followed the same way, so lines older suites append later are seen too.
+    """
+
+    def __init__(self, path=ENTITY_REGISTRY_FILE):
+        self.path = path
+        self.legacy_path = os.path.join(os.path.dirname(path), LEGACY_IDS_FILE)
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._offsets = {self.path: 0, self.legacy_path: 0}
+        self._by_label = {}
+        self._records = []
+        # Raw legacy lines in file order, plus an unterminated last line (ids.txt writers may omit the newline)
+        self._legacy_lines = []
+        self._legacy_tail = ""
+        # Value of the first complete legacy line per exact label, so lookups skip the prefix scan
+        self._legacy_first = {}
+
+    def _add(self, record):
+        self._records.append(record)
+        self._by_label[record["label"]] = record
+
+    def _add_legacy(self, line):
+        self._legacy_lines.append(line)
+        label, sep, value = line.partition(":")
+        if sep:
+            self._legacy_first.setdefault(label, value.strip())
+        if sep and value.strip():
+            label = label.strip()
+            self._add({"type": LEGACY_LABELS.get(label, label), "label": label, "id": value.strip(),
+                       "run_id": None, "timestamp": None})
+
+    def _appended(self, path):
+        """
+        Bytes appended to path since the last refresh, split into complete lines
+        and the unterminated rest; None when the file shrank (truncated or replaced).
+        """
+        try:
+            size = os.path.getsize(path)
+        except FileNotFoundError:
+            size = 0
+        offset = self._offsets[path]
+        if size < offset:
+            return None
+        if size == offset:
+            return [], b""
+        with open(path, "rb") as f:
+            f.seek(offset)
+            chunk = f.read(size - offset)
+        complete = chunk[:chunk.rfind(b"\n") + 1]
+        self._offsets[path] += len(complete)
+        return complete.splitlines(), chunk[len(complete):]
+
+    # -------------------------------------------------------------------------
+    # Writing
+    # -------------------------------------------------------------------------
+    def record(self, entity_type, entity_id, label=None, **details):
+        """
+        Append one created entity.
+
+        Args:
+            entity_type (str): e.g. "Application"
+            entity_id (str): The id the service returned
+            label (str): Lookup key, defaults to "<entity_type> ID"
+            details: Extra JSON-serializable fields stored with the record
+
+        Returns:
+            dict: The record written
+        """
+        record = {"type": entity_type, "label": label or f"{entity_type} ID", "id": entity_id,
+                  "run_id": current_run_id(), "timestamp": time.time(), **details}
+        line = (json.dumps(record) + "\n").encode("utf-8")
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+        return record
+
+    def clear(self):
+        """Truncate the registry (the legacy ids.txt is left alone)."""
+        with self._lock:
+            if os.path.exists(self.path):
+                with open(self.path, "r+") as f:
+                    fcntl.flock(f, fcntl.LOCK_EX)
+                    f.truncate(0)
+            self._reset()
+
+    # -------------------------------------------------------------------------
+    # Index
+    # -------------------------------------------------------------------------
+    def refresh(self):
+        """
+        Index lines appended to the registry and to the legacy ids.txt since the
+        last refresh; rebuilds when either file was truncated.
+        """
+        with self._lock:
+            registry, legacy = self._appended(self.path), self._appended(self.legacy_path)
+            if registry is None or legacy is None:
+                self._reset()
+                registry, legacy = self._appended(self.path), self._appended(self.legacy_path)
+            legacy_lines, self._legacy_tail = legacy
+            for line in legacy_lines:
+                self._add_legacy(line.decode("utf-8", "replace"))
+            self._legacy_tail = self._legacy_tail.decode("utf-8", "replace")
+            # A registry line still being written has no newline yet; pick it up next time
+            for line in registry[0]:
+                try:
+                    self._add(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+
+    def lookup(self, label):
+        """Id most recently recorded under exactly `label`, or None."""
+        self.refresh()
+        record = self._by_label.get(label)
+        return record["id"] if record else None
+
+    def lookup_legacy(self, label):
+        """Id on the first ids.txt line starting with `label` (how the older suites look ids up), or None."""
+        self.refresh()
+        if label in self._legacy_first:
+            return self._legacy_first[label]
+        for line in self._legacy_lines + [self._legacy_tail]:
+            _, sep, value = line.partition(":")
+            if line.startswith(label) and sep:
+                return value.strip()
+        return None
+
+    def records(self, run_id=None):
+        """All records in append order, optionally only one run's (legacy records are always included)."""
+        self.refresh()
+        return [r for r in self._records if run_id is None or r["run_id"] in (run_id, None)]
+
+    def latest_run_id(self):
+        self.refresh()
+        return next((r["run_id"] for r in reversed(self._records) if r["run_id"]), None)
+
+    def entities_by_type(self, run_id=None):
+        """{entity type: [ids]} in one pass over the records."""
+        entities = {}
+        for r in self.records(run_id):
+            entities.setdefault(r["type"], []).append(r["id"])
+        return entities
+
+
+def get_registry(path=ENTITY_REGISTRY_FILE):
+    """Shared registry for a file, so each process keeps one incremental index (relative and absolute paths share it)."""
+    path = os.path.abspath(path)
+    if path not in _registries:
+        _registries[path] = EntityRegistry(path)
+    return _registries[path]
+
+
+def record_entity(entity_type, entity_id, label=None, **details):
+    """Append an entity to the default registry; ids the service did not return are skipped."""
+    if entity_id is None:
+        return None
+    return get_registry().record(entity_type, entity_id, label, **details)
+
+
+def record_response(entity_type, res, keys, id_field, label=None, **details):
+    """
+    Record the entity a successful create response returned.
+
+    Args:
+        res: requests.Response
+        keys (tuple): Top-level response keys that may hold the entity (object or list)
+        id_field (str): Field of the entity holding its id
+    """
+    try:
+        body = res.json()
+    except ValueError:
+        body = {}
+    created = next((body[k] for k in keys if isinstance(body, dict) and body.get(k)), None)
+    created = created[0] if isinstance(created, list) and created else created
+    entity_id = created.get(id_field) if isinstance(created, dict) else None
+    return record_entity(entity_type, entity_id or f"unknown-{res.status_code}", label, **details)
+
+
+def lookup_entity(label):
+    return get_registry().lookup(label)
+
+
+def lookup_legacy_entity(label):
+    return get_registry().lookup_legacy(label)
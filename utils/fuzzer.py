@@ -0,0 +1,154 @@
+import copy
+import random
+from utils.payload_stream import NestedValue, expand_placeholder
+
+# Strings that tend to break parsers, collations and encoders
+UNICODE_SAMPLES = [
+    "\u0000",
+    "‮مرحبا",
+    "\U0001f4a9\U0001f525" * 8,
+    "é́́́",
+    "﻿​‍",
+    "\ud800",
+    "'; DROP TABLE eg_pt;--",
+    "${jndi:ldap://x}",
+    "%s%s%n",
+    "\\\"\\\\"
+]
+
+NUMBER_EDGES = [0, -1, 2 ** 31, 2 ** 63, -2 ** 63, 1e308, -1e-308, 0.1]
+TYPE_SWAPS = ["", "0", 0, 1.5, True, [], {}, ["x"], {"x": 1}]
+OVERSIZE_LENGTHS = [4096, 65536, 1024 * 1024, 16 * 1024 * 1024]
+NESTING_DEPTHS = [64, 512, 5000]
+
+# Paths under these top-level keys are never mutated (auth noise, not input validation)
+SKIP_KEYS = {"RequestInfo"}
+
+
+def json_paths(obj, path=()):
+    """Every path (tuple of keys/indexes) in a JSON document, parents before children."""
+    paths = [path] if path else []
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if not path and key in SKIP_KEYS:
+                continue
+            paths.extend(json_paths(value, path + (key,)))
+    elif isinstance(obj, list):
+        for idx, value in enumerate(obj):
+            paths.extend(json_paths(value, path + (idx,)))
+    return paths
+
+
+def _resolve(obj, path):
+    for step in path:
+        obj = obj[step]
+    return obj
+
+
+def random_mutation(doc, rng):
+    """
+    Pick a mutation for a random path of doc.
+
+    Returns:
+        dict: {"path": [...], "op": name, "arg": value} - replayable with apply_mutations
+    """
+    path = rng.choice(json_paths(doc))
+    current = _resolve(doc, path)
+    ops = ["null", "type_swap", "drop", "unicode", "deep_nesting", "oversize"]
+    if isinstance(current, (int, float)) and not isinstance(current, bool):
+        ops.append("number_edge")
+    op = rng.choice(ops)
+
+    if op == "type_swap":
+        arg = rng.choice([v for v in TYPE_SWAPS if type(v) is not type(current)])
+    elif op == "unicode":
+        arg = rng.choice(UNICODE_SAMPLES)
+    elif op == "deep_nesting":
+        arg = rng.choice(NESTING_DEPTHS)
+    elif op == "oversize":
+        arg = rng.choice(OVERSIZE_LENGTHS)
+    elif op == "number_edge":
+        arg = rng.choice(NUMBER_EDGES)
+    else:
+        arg = None
+    return {"path": list(path), "op": op, "arg": arg}
+
+
+def apply_mutations(seed, mutations):
+    """Apply mutation records to a deep copy of seed; records whose path no longer exists are ignored."""
+    doc = copy.deepcopy(seed)
+    for m in mutations:
+        try:
+            parent = _resolve(doc, m["path"][:-1])
+            key = m["path"][-1]
+            if not isinstance(parent, (dict, list)):
+                continue
+            current = parent[key]
+        except (KeyError, IndexError, TypeError):
+            continue
+
+        if m["op"] == "drop":
+            del parent[key]
+            continue
+
+        if m["op"] == "null":
+            value = None
+        elif m["op"] == "deep_nesting":
+            value = NestedValue(current, m["arg"])
+        elif m["op"] == "oversize":
+            value = expand_placeholder(f"{{{{REPEAT_A_{m['arg']}}}}}")
+        else:
+            value = copy.deepcopy(m["arg"])
+        parent[key] = value
+    return doc
+
+
+def generate_mutations(seed, rng, max_mutations=3):
+    """1..max_mutations mutation records for one fuzz case."""
+    return [random_mutation(seed, rng) for _ in range(rng.randint(1, max_mutations))]
+
+
+def case_rng(run_seed, target, idx):
+    """Deterministic RNG per fuzz case, so any case can be regenerated from (seed, target, idx)."""
+    return random.Random(f"{run_seed}:{target}:{idx}")
+
+
+def minimize(seed, mutations, crashes):
+    """
+    Shrink a crashing case: drop mutations one at a time, then halve oversize
+    lengths and nesting depths, keeping every change that still crashes.
+
+    Args:
+        crashes (callable): crashes(mutations) -> True when the case still crashes
+
+    Returns:
+        tuple: (minimal mutations, requests spent)
+    """
+    spent = 0
+    current = list(mutations)
+
+    idx = 0
+    while idx < len(current) and len(current) > 1:
+        candidate = current[:idx] + current[idx + 1:]
+        spent += 1
+        if crashes(candidate):
+            current = candidate
+        else:
+            idx += 1
+
+    for i, m in enumerate(current):
+        floor = 1 if m["op"] == "deep_nesting" else 16
+        while m["op"] in ("oversize", "deep_nesting") and m["arg"] // 2 >= floor:
+            smaller = {**m, "arg": m["arg"] // 2}
+            candidate = current[:i] + [smaller] + current[i + 1:]
+            spent += 1
+            if not crashes(candidate):
+                break
+            current, m = candidate, smaller
+
+    return current, spent
+
+
+def crash_signature(target, mutations):
+    """Identity of a minimized crash: same target and same (path, op) set is the same bug."""
+    return f"{target}|" + "|".join(sorted(f"{'/'.join(map(str, m['path']))}:{m['op']}" for m in mutations))
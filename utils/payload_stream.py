@@ -0,0 +1,158 @@
+import json
+import os
+import random
+import re
+import string
+
+# Values at least this long stay lazy and are streamed instead of built in memory
+STREAM_THRESHOLD = int(os.getenv("PAYLOAD_STREAM_THRESHOLD", str(1024 * 1024)))
+
+# Size of each chunk written to the socket for streamed bodies
+STREAM_CHUNK_SIZE = int(os.getenv("PAYLOAD_STREAM_CHUNK_SIZE", str(64 * 1024)))
+
+REPEAT_PATTERN = re.compile(r"^\{\{REPEAT_(.+)_(\d+)\}\}$")
+RANDOM_PATTERN = re.compile(r"^\{\{RANDOM_(\d+)\}\}$")
+RANDOM_ALPHABET = string.ascii_letters + string.digits
+
+
+class LargeValue:
+    """
+    A string field generated on demand, chunk by chunk.
+
+    Produced by expand_placeholder for values above STREAM_THRESHOLD; str()
+    gives back the placeholder so hashing or logging a payload stays cheap.
+    """
+
+    def __init__(self, placeholder, length, unit=None, seed=None):
+        self.placeholder = placeholder
+        self.length = length
+        self.unit = unit
+        self.seed = seed
+
+    def __str__(self):
+        return self.placeholder
+
+    __repr__ = __str__
+
+    def __len__(self):
+        return self.length
+
+    def chunks(self, chunk_size=STREAM_CHUNK_SIZE):
+        """Yield the value in pieces of at most chunk_size characters."""
+        if self.unit:
+            block = self.unit * max(1, chunk_size // len(self.unit))
+            remaining = self.length
+            while remaining > 0:
+                piece = block[:remaining]
+                remaining -= len(piece)
+                yield piece
+        else:
+            # Seeded so the same placeholder always streams the same bytes
+            rng = random.Random(self.seed)
+            remaining = self.length
+            while remaining > 0:
+                size = min(chunk_size, remaining)
+                remaining -= size
+                yield "".join(rng.choices(RANDOM_ALPHABET, k=size))
+
+
+class NestedValue:
+    """
+    `value` wrapped in `depth` single-element arrays. Encoded by stream_json
+    without recursion, so depths beyond Python's recursion limit still serialize.
+    """
+
+    def __init__(self, value, depth):
+        self.value = value
+        self.depth = depth
+
+    def __str__(self):
+        return f"{{{{NEST_{self.depth}}}}}"
+
+    __repr__ = __str__
+
+
+def expand_placeholder(value, threshold=STREAM_THRESHOLD):
+    """
+    Expand size placeholders in a scenario value.
+
+        {{REPEAT_<chars>_<n>}}  <chars> repeated n times, e.g. {{REPEAT_A_1000}}
+        {{RANDOM_<n>}}          n random alphanumeric characters
+
+    Values shorter than `threshold` come back as plain strings; longer ones as a
+    LargeValue that is only materialized while the request body is streamed.
+    Anything else is returned unchanged.
+    """
+    if not isinstance(value, str):
+        return value
+
+    match = REPEAT_PATTERN.match(value)
+    if match:
+        unit, count = match.group(1), int(match.group(2))
+        if len(unit) * count < threshold:
+            return unit * count
+        return LargeValue(value, len(unit) * count, unit=unit)
+
+    match = RANDOM_PATTERN.match(value)
+    if match:
+        length = int(match.group(1))
+        large = LargeValue(value, length, seed=value)
+        return "".join(large.chunks(length)) if length < threshold else large
+
+    return value
+
+
+def has_large_values(obj):
+    """True when a payload holds any LargeValue/NestedValue and must be streamed."""
+    if isinstance(obj, (LargeValue, NestedValue)):
+        return True
+    if isinstance(obj, dict):
+        return any(has_large_values(v) for v in obj.values())
+    if isinstance(obj, list):
+        return any(has_large_values(v) for v in obj)
+    return False
+
+
+def _iter_json(obj):
+    if isinstance(obj, LargeValue):
+        yield '"'
+        for chunk in obj.chunks():
+            yield json.dumps(chunk)[1:-1]
+        yield '"'
+    elif isinstance(obj, NestedValue):
+        yield "[" * obj.depth
+        yield from _iter_json(obj.value)
+        yield "]" * obj.depth
+    elif isinstance(obj, dict):
+        yield "{"
+        for idx, (key, value) in enumerate(obj.items()):
+            yield ("," if idx else "") + json.dumps(str(key)) + ":"
+            yield from _iter_json(value)
+        yield "}"
+    elif isinstance(obj, list):
+        yield "["
+        for idx, value in enumerate(obj):
+            if idx:
+                yield ","
+            yield from _iter_json(value)
+        yield "]"
+    else:
+        yield json.dumps(obj)
+
+
+def stream_json(obj, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Encode a payload as JSON incrementally, yielding bytes chunks of about
+    chunk_size. Passing the generator as a request body makes requests send
+    it with chunked transfer encoding, so memory stays flat at any size.
+    """
+    buffer = []
+    buffered = 0
+    for fragment in _iter_json(obj):
+        buffer.append(fragment)
+        buffered += len(fragment)
+        if buffered >= chunk_size:
+            yield "".join(buffer).encode()
+            buffer, buffered = [], 0
+    if buffer:
+        yield "".join(buffer).encode()
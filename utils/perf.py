@@ -0,0 +1,142 @@
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+def percentile(values, pct):
+    """
+    Return the pct-th percentile of values using the nearest-rank method.
+
+    Args:
+        values (list): Numeric samples (need not be sorted)
+        pct (float): Percentile between 0 and 100
+
+    Returns:
+        float: The percentile value, or 0.0 when there are no samples.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize_latencies(values):
+    """Summarize latency samples (seconds) as count/min/avg/p50/p95/p99/max."""
+    if not values:
+        return {"count": 0, "min": 0.0, "avg": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+
+    return {
+        "count": len(values),
+        "min": round(min(values), 4),
+        "avg": round(sum(values) / len(values), 4),
+        "p50": round(percentile(values, 50), 4),
+        "p95": round(percentile(values, 95), 4),
+        "p99": round(percentile(values, 99), 4),
+        "max": round(max(values), 4)
+    }
+
+
+def histogram(values, bounds):
+    """
+    Bucket samples by upper bound.
+
+    Args:
+        values (list): Numeric samples
+        bounds (list): Ascending upper bounds; a final "+Inf" bucket is added
+
+    Returns:
+        dict: {"<=b": count, ..., "+Inf": count}
+    """
+    buckets = {f"<={b}": 0 for b in bounds}
+    buckets["+Inf"] = 0
+    for v in values:
+        for b in bounds:
+            if v <= b:
+                buckets[f"<={b}"] += 1
+                break
+        else:
+            buckets["+Inf"] += 1
+    return buckets
+
+
+def timed(func, *args, **kwargs):
+    """Call func and return (result, elapsed_seconds)."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def run_concurrently(func, items, concurrency):
+    """
+    Run func(item) for every item on a thread pool.
+
+    Returns:
+        tuple: (results, wall_seconds) where results keep the order of items.
+               An item whose call raised gets {"success": False, "error": str(e)}.
+    """
+    items = list(items)
+    results = [None] * len(items)
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        futures = {pool.submit(func, item): idx for idx, item in enumerate(items)}
+        for future in as_completed(futures):
+            idx = futures[future]
+            try:
+                results[idx] = future.result()
+            except Exception as e:
+                results[idx] = {"success": False, "error": str(e)}
+
+    return results, time.perf_counter() - start
+
+
+def throughput(count, wall_seconds):
+    """Operations per second, rounded for reporting."""
+    return round(count / wall_seconds, 2) if wall_seconds > 0 else 0.0
+
+
+class RateLimiter:
+    """
+    Spaces out calls so that at most `rate` start per second, across threads.
+    A rate of 0 or less disables the cap.
+    """
+
+    def __init__(self, rate):
+        self.interval = 1 / rate if rate > 0 else 0
+        self._next_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Block until the caller may start its call."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_at)
+            self._next_at = start_at + self.interval
+        time.sleep(max(0, start_at - now))
+
+
+def growth_exponents(xs, ys):
+    """
+    Local growth exponent between consecutive points of a curve:
+    log(y2/y1) / log(x2/x1). About 1 means linear, 2 quadratic; None where a
+    value is missing or not positive.
+    """
+    exponents = []
+    for (x1, y1), (x2, y2) in zip(zip(xs, ys), zip(xs[1:], ys[1:])):
+        if not (y1 and y2 and y1 > 0 and y2 > 0 and x2 > x1 > 0):
+            exponents.append(None)
+            continue
+        exponents.append(round(math.log(y2 / y1) / math.log(x2 / x1), 2))
+    return exponents
+
+
+def nonlinear_from(xs, ys, threshold=1.3):
+    """First x after which the curve grows faster than x**threshold, or None if it never does."""
+    for x, exponent in zip(xs, growth_exponents(xs, ys)):
+        if exponent is not None and exponent > threshold:
+            return x
+    return None
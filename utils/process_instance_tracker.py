@@ -0,0 +1,124 @@
+import time
+import requests
+from utils.auth import get_auth_token
+from utils.request_info import get_request_info
+from utils.config import tenantId, BASE_URL
+
+PROCESS_SEARCH_URL = "/egov-workflow-v2/egov-wf/process/_search"
+
+# One tracker per application, shared by every workflow check in the session
+_trackers = {}
+
+
+def get_tracker(application_number, business_service):
+    """Return the shared tracker for an application, creating it on first use."""
+    key = (application_number, business_service)
+    if key not in _trackers:
+        _trackers[key] = ProcessInstanceTracker(application_number, business_service)
+    return _trackers[key]
+
+
+def _created_time(instance):
+    return (instance.get("auditDetails") or {}).get("createdTime") or 0
+
+
+class ProcessInstanceTracker:
+    """
+    Incremental view of an application's workflow history.
+
+    The first refresh() downloads the full history; later calls only ask for
+    process instances created after the newest one already seen (fromDate) and
+    de-duplicate by id, so a check after ASSIGN or RESOLVE fetches one or two
+    records instead of the whole list. Actions and states are kept in sets so
+    has_action()/has_state() are O(1).
+    """
+
+    def __init__(self, application_number, business_service, token=None):
+        self.application_number = application_number
+        self.business_service = business_service
+        self._token = token
+        self._seen_ids = set()
+        self._actions = set()
+        self._states = set()
+        self._last_created_time = None
+        self.history = []  # chronological: oldest first
+        self.fetch_count = 0
+
+    def _get_token(self):
+        if not self._token:
+            self._token = get_auth_token("user")
+        return self._token
+
+    def _search(self, from_date=None):
+        token = self._get_token()
+        url = (
+            f"{BASE_URL}{PROCESS_SEARCH_URL}?tenantId={tenantId}"
+            f"&businessIds={self.application_number}&businessService={self.business_service}&history=true"
+        )
+        if from_date:
+            url += f"&fromDate={from_date}"
+
+        headers = {
+            "Content-Type": "application/json",
+            "auth-token": token,
+            "x-tenant-id": tenantId
+        }
+
+        res = requests.post(url, json={"RequestInfo": get_request_info(token)}, headers=headers)
+        assert res.status_code == 200, f"Process instance search failed: {res.text}"
+        self.fetch_count += 1
+
+        data = res.json()
+        return data.get("ProcessInstances") or data.get("processInstances") or []
+
+    def refresh(self):
+        """Fetch process instances not seen yet and return them (oldest first)."""
+        instances = self._search(self._last_created_time)
+
+        # API returns latest first; reverse so the stable sort keeps that order for equal timestamps
+        new = [pi for pi in reversed(instances) if pi.get("id") not in self._seen_ids]
+        new.sort(key=_created_time)
+
+        for pi in new:
+            state = (pi.get("state") or {}).get("state")
+            action = pi.get("action")
+            self._seen_ids.add(pi.get("id"))
+            self._states.add(state)
+            self._actions.add(action)
+            self.history.append({"state": state, "action": action})
+            self._last_created_time = max(self._last_created_time or 0, _created_time(pi)) or None
+
+        return new
+
+    def wait_for_state(self, state, timeout, interval):
+        """
+        Refresh until the current state equals `state` or `timeout` seconds pass.
+
+        Returns:
+            bool: True if the state became visible within the timeout.
+        """
+        deadline = time.monotonic() + timeout
+        self.refresh()
+        while self.current_state != state and time.monotonic() < deadline:
+            time.sleep(interval)
+            self.refresh()
+        return self.current_state == state
+
+    def has_action(self, action):
+        return action in self._actions
+
+    def has_state(self, state):
+        return state in self._states
+
+    @property
+    def current_state(self):
+        return self.history[-1]["state"] if self.history else None
+
+    @property
+    def total_transitions(self):
+        return len(self.history)
+
+    @property
+    def state_history(self):
+        """History latest first, matching the order the process search returns."""
+        return list(reversed(self.history))
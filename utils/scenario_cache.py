@@ -0,0 +1,155 @@
+import fcntl
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from utils.config import BASE_URL, tenantId
+
+SCENARIO_CACHE_FILE = "output/negative_scenario_cache.json"
+# Per-scenario verdicts are appended here and folded into the cache file on the next save
+SCENARIO_JOURNAL_FILE = "output/negative_scenario_cache.jsonl"
+
+# Entries older than this are re-run even when they passed
+SCENARIO_CACHE_TTL = float(os.getenv("NEGATIVE_CACHE_TTL_HOURS", "24")) * 3600
+
+# Identifies the server build the verdicts were observed on; set it per deployment
+# (e.g. the release tag) so an upgrade invalidates every cached verdict. Nothing
+# derivable from the config changes on a redeploy, so incremental runs require it.
+BUILD_FINGERPRINT = os.getenv("NEGATIVE_BUILD_FINGERPRINT")
+
+
+def incremental_enabled(requested):
+    """Cached passes are only trusted when the run names the server build they were observed on."""
+    if requested and not BUILD_FINGERPRINT:
+        print("⚠️ NEGATIVE_INCREMENTAL ignored: set NEGATIVE_BUILD_FINGERPRINT to the deployed build "
+              "(e.g. the release tag) so a redeploy invalidates cached verdicts")
+        return False
+    return requested
+
+
+def scenario_key(scenario, req, token):
+    """
+    Content address of a rendered scenario request.
+
+    Hashes the endpoint, headers and canonical JSON body with the live auth token
+    masked, plus the scenario's type/expectation and the build fingerprint, so
+    the key changes whenever anything that decides the verdict changes.
+    """
+    def mask(value):
+        if isinstance(value, dict):
+            return {k: mask(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [mask(v) for v in value]
+        if isinstance(value, str) and token and token in value:
+            return value.replace(token, "<token>")
+        return value
+
+    material = {
+        "endpoint": f"{req['method']} {req['url']}",
+        "headers": mask(req["headers"]),
+        "body": mask(req["payload"]),
+        "type": scenario.get("type", "negative"),
+        "expected": scenario.get("expected", {}),
+        "build": BUILD_FINGERPRINT or f"{BASE_URL}|{tenantId}"
+    }
+    canonical = json.dumps(material, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _merge(target, entries):
+    """Keep the newer verdict per key, so a stale batch snapshot cannot undo a concurrent write."""
+    for key, entry in entries.items():
+        if key not in target or entry.get("at", 0) >= target[key].get("at", 0):
+            target[key] = entry
+
+
+def _journal():
+    """Verdicts appended since the last save: {key: entry}, newest per key."""
+    entries = {}
+    try:
+        with open(SCENARIO_JOURNAL_FILE) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                _merge(entries, {record.pop("key"): record})
+    except FileNotFoundError:
+        pass
+    return entries
+
+
+def load_cache():
+    """Load cached verdicts, including journaled ones: {key: {name, passed, status, message, at}}."""
+    try:
+        cache = json.load(open(SCENARIO_CACHE_FILE))
+    except (FileNotFoundError, json.JSONDecodeError):
+        cache = {}
+    _merge(cache, _journal())
+    return cache
+
+
+@contextmanager
+def _cache_lock():
+    """Exclusive lock on <file>.lock, shared by journal appends and cache rewrites."""
+    os.makedirs(os.path.dirname(SCENARIO_CACHE_FILE) or ".", exist_ok=True)
+    with open(f"{SCENARIO_CACHE_FILE}.lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        yield
+
+
+@contextmanager
+def _locked_cache():
+    """
+    Yield the on-disk cache (journal folded in) under the cache lock, write it
+    back atomically (temp file + os.replace) on exit and empty the journal.
+    Readers never see a half-written file.
+    """
+    with _cache_lock():
+        cache = load_cache()
+        yield cache
+        tmp = f"{SCENARIO_CACHE_FILE}.tmp"
+        json.dump(cache, open(tmp, "w"), indent=2)
+        os.replace(tmp, SCENARIO_CACHE_FILE)
+        if os.path.exists(SCENARIO_JOURNAL_FILE):
+            os.remove(SCENARIO_JOURNAL_FILE)
+
+
+def save_cache(cache):
+    """Merge a batch of verdicts (and any journaled ones) into the on-disk cache."""
+    with _locked_cache() as stored:
+        _merge(stored, cache)
+
+
+def compact_cache():
+    """Fold the journal into the cache file; a no-op when nothing was journaled."""
+    if os.path.exists(SCENARIO_JOURNAL_FILE):
+        save_cache({})
+
+
+def cached_pass(cache, key):
+    """Return the cached entry when it passed and has not expired, else None."""
+    entry = cache.get(key)
+    if entry and entry.get("passed") and time.time() - entry.get("at", 0) < SCENARIO_CACHE_TTL:
+        return entry
+    return None
+
+
+def record_verdict(key, name, passed, status, message, cache=None):
+    """
+    Store one verdict; pass `cache` to batch several writes and save once.
+    Without it the verdict is appended to the journal as one line, so per-item
+    runs do not rewrite the whole cache file for every scenario.
+    """
+    entry = {"name": name, "passed": passed, "status": status, "message": message, "at": time.time()}
+    if cache is not None:
+        cache[key] = entry
+        return
+    line = (json.dumps({"key": key, **entry}, default=str) + "\n").encode()
+    with _cache_lock():
+        fd = os.open(SCENARIO_JOURNAL_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
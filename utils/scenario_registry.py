@@ -0,0 +1,109 @@
+import json
+import time
+
+SCENARIO_TYPES = {"negative", "security", "boundary"}
+
+# Scenario list -> {field: (JSON type, required)} beyond name/type/expected
+SCENARIO_SCHEMA = {
+    "mdms_draft_scenarios": {"data": (dict, False)},
+    "mdms_draft_large_payload_scenarios": {"data": (dict, False)},
+    "mdms_service_create_scenarios": {"data": (dict, False)},
+    "public_service_init_scenarios": {"data": (dict, False)},
+    "public_service_init_large_payload_scenarios": {"data": (dict, False)},
+    "authentication_scenarios": {"data": (dict, False)},
+    "application_scenarios": {"data": (dict, False)},
+    "workflow_scenarios": {"action": (str, True), "application_number": (str, False)},
+    "checklist_scenarios": {"attributes": (list, True), "service_def_id": (str, False), "account_id": (str, False)},
+    "search_scenarios": {"criteria": (dict, True)}
+}
+
+# One registry per scenarios file for the whole session
+_registries = {}
+
+
+def validate_scenarios(config):
+    """
+    Check scenario lists against SCENARIO_SCHEMA.
+
+    Returns:
+        list: Human-readable problems, empty when the config is valid
+    """
+    errors = []
+    for key, scenarios in config.items():
+        if not isinstance(scenarios, list):
+            continue
+        names = set()
+        for idx, scenario in enumerate(scenarios):
+            where = f"{key}[{idx}]"
+            if not isinstance(scenario, dict):
+                errors.append(f"{where}: scenario must be an object")
+                continue
+            name = scenario.get("name")
+            if not isinstance(name, str) or not name:
+                errors.append(f"{where}: missing name")
+            elif name in names:
+                errors.append(f"{where}: duplicate name '{name}'")
+            names.add(name)
+            if scenario.get("type", "negative") not in SCENARIO_TYPES:
+                errors.append(f"{where}: unknown type '{scenario.get('type')}'")
+            if not isinstance(scenario.get("expected", {}), dict):
+                errors.append(f"{where}: expected must be an object")
+            for field, (field_type, required) in SCENARIO_SCHEMA.get(key, {}).items():
+                if field not in scenario:
+                    if required:
+                        errors.append(f"{where}: missing {field}")
+                elif not isinstance(scenario[field], field_type):
+                    errors.append(f"{where}: {field} must be {field_type.__name__}")
+    return errors
+
+
+class ScenarioRegistry:
+    """
+    Scenarios parsed and validated once per session, with each suite's
+    requests rendered once on first use and reused by every test item.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        try:
+            self.config = json.load(open(path))
+        except FileNotFoundError:
+            self.config = {}
+        self.errors = validate_scenarios(self.config)
+        self.render_seconds = {}
+        self._rendered = {}
+
+    def scenarios(self, key):
+        return self.config.get(key, [])
+
+    def counts(self):
+        """{scenario list: count} for every list in the config."""
+        return {key: len(value) for key, value in self.config.items() if isinstance(value, list)}
+
+    def render(self, key, build, token):
+        """
+        Render every request of a scenario list through its builder once.
+
+        Returns:
+            list: Requests in scenario order
+        """
+        if key not in self._rendered:
+            start = time.perf_counter()
+            self._rendered[key] = [build(scenario, token) for scenario in self.scenarios(key)]
+            self.render_seconds[key] = time.perf_counter() - start
+        return self._rendered[key]
+
+    def rendered_request(self, key, scenario, build, token):
+        """Pre-rendered request for one scenario of a list."""
+        reqs = self.render(key, build, token)
+        idx = next(i for i, s in enumerate(self.scenarios(key)) if s is scenario)
+        return reqs[idx]
+
+
+def get_registry(path):
+    """Return the session registry for a scenarios file, failing on schema errors."""
+    if path not in _registries:
+        registry = ScenarioRegistry(path)
+        assert not registry.errors, f"Invalid scenarios in {path}:\n" + "\n".join(registry.errors)
+        _registries[path] = registry
+    return _registries[path]
@@ -2,6 +2,7 @@ from utils.api_client import APIClient
 from utils.data_loader import load_payload
 from utils.request_info import get_request_info
 from utils.config import search_params
+from utils.entity_registry import lookup_entity, lookup_legacy_entity
 
 def search_entity(entity_type, token, client, entity_id, payload_file, endpoint, response_key):
     payload = load_payload(entity_type, payload_file)
@@ -31,6 +32,9 @@ def search_entity(entity_type, token, client, entity_id, payload_file, endpoint,
 
 
 def extract_id_from_file(label):
-    with open("output/ids.txt", "r") as f:
-        lines = f.readlines()
-    return next((line.split(":", 1)[1].strip() for line in lines if line.startswith(label)), None)
+    """
+    Id of the first output/ids.txt line starting with label, as before; labels
+    only the entity registry knows fall back to its latest exact-label record.
+    """
+    legacy = lookup_legacy_entity(label)
+    return legacy if legacy is not None else lookup_entity(label)
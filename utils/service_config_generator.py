@@ -0,0 +1,160 @@
+import json
+from functools import lru_cache
+from utils.data_loader import load_payload
+
+# Generated text fields are grouped into sections of this many properties
+FIELDS_PER_SECTION = 10
+
+EVALUATOR_ROLE = "{{module}}_{{service}}_COMPLAINT_EVALUATOR"
+
+# Fragments below are cached and shared between generated configurations.
+# Treat a generated payload as read-only: run it through replace_placeholders
+# (which round-trips JSON) or copy.deepcopy before editing it in place.
+
+
+@lru_cache(maxsize=None)
+def _base(draft):
+    filename = "mdms_draft_create.json" if draft else "mdms_service_create.json"
+    return load_payload("mdms", filename)
+
+
+@lru_cache(maxsize=None)
+def _field_template():
+    return load_payload("mdms/templates/fields", "simple_text.json")
+
+
+@lru_cache(maxsize=None)
+def _field(idx, order):
+    """Text field `idx` (global) at position `order` within its section, built from simple_text.json."""
+    properties = _field_template()["properties"]
+    prop = properties[idx % len(properties)]
+    return {**prop, "name": f"field{idx}", "label": f"Field {idx}", "orderNumber": order,
+            "required": False, "errorMessage": ""}
+
+
+@lru_cache(maxsize=None)
+def _section(number, size):
+    """Generated section `number` holding `size` text fields."""
+    first = number * FIELDS_PER_SECTION
+    return {
+        **_field_template(),
+        "name": f"Generated{number}",
+        "label": f"Generated {number}",
+        "properties": [_field(first + i, i + 1) for i in range(size)]
+    }
+
+
+def _state(name, actions, sla=86400000, start=False, terminal=False):
+    return {
+        "sla": None if start or terminal else sla,
+        "state": name,
+        "actions": actions,
+        "isStartState": start,
+        "isStateUpdatable": True,
+        "isTerminateState": terminal,
+        "applicationStatus": None,
+        "docUploadRequired": False
+    }
+
+
+def _action(action, next_state, citizen=False):
+    roles = ["STUDIO_CITIZEN", "STUDIO_ADMIN"] if citizen else [EVALUATOR_ROLE, "STUDIO_ADMIN"]
+    return {"roles": roles, "action": action, "nextState": next_state}
+
+
+def stage_names(count):
+    """Names of the `count` intermediate states of a generated workflow."""
+    return tuple(f"STAGE_{i}" for i in range(1, count + 1))
+
+
+@lru_cache(maxsize=None)
+def _workflow_states(count):
+    """
+    Linear workflow with `count` states in total: start -> STAGE_1 .. STAGE_n ->
+    RESOLVED, every stage can REJECT. Keeps the APPLIED/ASSIGN/RESOLVE actions
+    the base configuration's generateDemandAt/nextActionAfterPayment refer to.
+    """
+    stages = stage_names(count - 3)
+    states = [_state(None, [_action("APPLIED", stages[0], citizen=True)], start=True)]
+    for i, stage in enumerate(stages):
+        forward = _action("ASSIGN", stages[i + 1]) if i + 1 < len(stages) else _action("RESOLVE", "RESOLVED")
+        states.append(_state(stage, [forward, _action("REJECT", "REJECTED")]))
+    states.append(_state("REJECTED", [], terminal=True))
+    states.append(_state("RESOLVED", [], terminal=True))
+    return tuple(states)
+
+
+@lru_cache(maxsize=None)
+def _checklist(idx, state):
+    base = _base(False)["Mdms"]["data"]["checklist"][0]
+    name = f"checklist {idx}"
+    return {**base, "name": name, "state": state, "checklistData": {**base["checklistData"], "name": name}}
+
+
+@lru_cache(maxsize=None)
+def _message(idx, locale):
+    return {"code": f"{{{{module}}}}_{{{{service}}}}_SCALE_MSG_{idx}", "message": f"Message {idx}", "locale": locale}
+
+
+def generate_service_config(fields=0, checklists=None, states=None, messages=0, draft=False, locale="en_IN"):
+    """
+    Compose an MDMS service configuration payload of a given size.
+
+    Args:
+        fields (int): Generated text fields, appended to the base sections in
+                      sections of FIELDS_PER_SECTION (simple_text.json template)
+        checklists (int): Checklists, spread over the workflow's intermediate
+                          states; None keeps the base checklists
+        states (int): Total workflow states (>= 4: start, stages, REJECTED,
+                      RESOLVED); None keeps the base workflow
+        messages (int): Localization entries added under localization.messages
+        draft (bool): Start from mdms_draft_create.json instead of mdms_service_create.json
+        locale (str): Locale of the generated localization entries
+
+    Returns:
+        dict: Payload with {{module}}/{{service}}/{{tenantId}} placeholders left
+              in place, ready for replace_placeholders
+    """
+    base = _base(draft)
+    data = dict(base["Mdms"]["data"])
+
+    if fields:
+        sections = [_section(n, min(FIELDS_PER_SECTION, fields - n * FIELDS_PER_SECTION))
+                    for n in range((fields + FIELDS_PER_SECTION - 1) // FIELDS_PER_SECTION)]
+        data["fields"] = list(base["Mdms"]["data"]["fields"]) + sections
+
+    if states is not None:
+        assert states >= 4, f"A generated workflow needs at least 4 states, got {states}"
+        data["workflow"] = {**data["workflow"], "states": list(_workflow_states(states))}
+
+    if checklists is not None:
+        if states is not None:
+            targets = stage_names(states - 3)
+        else:
+            targets = tuple(s["state"] for s in data["workflow"]["states"]
+                            if s.get("state") and not s.get("isTerminateState"))
+        data["checklist"] = [_checklist(i, targets[i % len(targets)]) for i in range(checklists)]
+
+    if messages:
+        data["localization"] = {**data["localization"], "messages": [_message(i, locale) for i in range(messages)]}
+
+    return {**base, "Mdms": {**base["Mdms"], "data": data}}
+
+
+def config_size(payload):
+    """Size of a service configuration payload: counts per dimension plus encoded bytes."""
+    data = payload["Mdms"]["data"]
+    return {
+        "fields": sum(len(section.get("properties") or []) for section in data.get("fields") or []),
+        "checklists": len(data.get("checklist") or []),
+        "states": len((data.get("workflow") or {}).get("states") or []),
+        "messages": len((data.get("localization") or {}).get("messages") or []),
+        "bytes": len(json.dumps(payload))
+    }
+
+
+def fragment_cache_info():
+    """Hit/miss counts of the fragment caches, for reporting how much generation was reused."""
+    caches = {"field": _field, "section": _section, "workflow": _workflow_states,
+              "checklist": _checklist, "message": _message}
+    return {name: {"hits": fn.cache_info().hits, "misses": fn.cache_info().misses} for name, fn in caches.items()}
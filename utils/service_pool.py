@@ -0,0 +1,226 @@
+import fcntl
+import json
+import os
+import socket
+import threading
+import time
+from contextlib import contextmanager
+
+SERVICE_POOL_FILE = "output/service_pool.json"
+
+# Routine runs lease from the pool when SERVICE_POOL=true
+SERVICE_POOL_ENABLED = os.getenv("SERVICE_POOL", "false").lower() == "true"
+SERVICE_POOL_SIZE = int(os.getenv("SERVICE_POOL_SIZE", "3"))
+SERVICE_POOL_LEASE_MINUTES = float(os.getenv("SERVICE_POOL_LEASE_MINUTES", "60"))
+# A service is retired after this many leases so its application count stays small
+SERVICE_POOL_MAX_USES = int(os.getenv("SERVICE_POOL_MAX_USES", "20"))
+# Warming services that are still not healthy after this long are dropped
+SERVICE_POOL_WARM_HOURS = float(os.getenv("SERVICE_POOL_WARM_HOURS", "2"))
+# A health check that has not reported back after this long (crashed process) is abandoned
+SERVICE_POOL_CHECK_MINUTES = float(os.getenv("SERVICE_POOL_CHECK_MINUTES", "10"))
+
+
+class ServicePool:
+    """
+    Pre-provisioned services recorded in a local JSON store.
+
+    Entries move warming -> ready -> leased -> ready ... and leave the pool as
+    retired (max uses reached), unhealthy or stale (never became healthy).
+    Entries that left are kept under "retired" until teardown claims them.
+    Every read-modify-write holds an exclusive lock on <path>.lock, so several
+    pytest processes on one machine can share the pool. Health checks are slow,
+    so they run outside the lock: the entry is marked "checking" first, which
+    keeps other processes off it until the result is written back.
+
+    Args:
+        provision (callable): provision() -> {"module", "service", "service_code", ...}
+        is_healthy (callable): is_healthy(entry) -> True when every artifact is visible
+    """
+
+    def __init__(self, provision, is_healthy, path=SERVICE_POOL_FILE, size=SERVICE_POOL_SIZE):
+        self.provision = provision
+        self.is_healthy = is_healthy
+        self.path = path
+        self.size = size
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        self._top_up_thread = None
+
+    # -------------------------------------------------------------------------
+    # Store
+    # -------------------------------------------------------------------------
+    @contextmanager
+    def _locked(self):
+        """Yield the store ({"services": [...], "retired": [...]}) under the pool lock and write it back on exit."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(f"{self.path}.lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                store = json.load(open(self.path))
+            except (FileNotFoundError, json.JSONDecodeError):
+                store = {}
+            store = {"services": store.get("services", []), "retired": store.get("retired", [])}
+            yield store
+            tmp = f"{self.path}.tmp"
+            json.dump(store, open(tmp, "w"), indent=2)
+            os.replace(tmp, self.path)
+
+    def _expire(self, store, now):
+        """Release expired leases and move entries that left the pool to "retired"."""
+        stale = now - SERVICE_POOL_WARM_HOURS * 3600
+        active = []
+        for e in store["services"]:
+            if e["status"] == "leased" and e["lease_expires"] < now:
+                e.update(status="ready", leased_by=None, lease_expires=None)
+            if e["status"] == "checking" and e["check_expires"] < now:
+                e.update(status=e["checked_from"], checked_by=None, check_expires=None)
+            if e["status"] == "warming" and e["created_at"] < stale:
+                e["status"] = "stale"
+            (store["retired"] if e["status"] in ("retired", "unhealthy", "stale") else active).append(e)
+        store["services"] = active
+
+    def entries(self):
+        """Snapshot of the pool after expiring leases."""
+        with self._locked() as store:
+            self._expire(store, time.time())
+            return [dict(e) for e in store["services"]]
+
+    def retired(self, claim=True):
+        """Services that left the pool, for teardown; claiming them removes them from the store."""
+        with self._locked() as store:
+            self._expire(store, time.time())
+            retired = store["retired"]
+            if claim:
+                store["retired"] = []
+            return retired
+
+    def claim(self, services):
+        """Drop retired services from the store once teardown has cleaned them up."""
+        claimed = {(s["module"], s["service"]) for s in services}
+        with self._locked() as store:
+            store["retired"] = [e for e in store["retired"] if (e["module"], e["service"]) not in claimed]
+
+    # -------------------------------------------------------------------------
+    # Leasing
+    # -------------------------------------------------------------------------
+    def _start_check(self, store, statuses, skip, now):
+        """Mark the oldest entry in `statuses` (ready before warming) as checking; None when there is none."""
+        candidates = sorted((e for e in store["services"] if e["status"] in statuses and e["service"] not in skip),
+                            key=lambda e: (e["status"] != "ready", e["created_at"]))
+        if not candidates:
+            return None
+        entry = candidates[0]
+        entry.update(status="checking", checked_from=entry["status"], checked_by=self.owner,
+                     check_expires=now + SERVICE_POOL_CHECK_MINUTES * 60)
+        return dict(entry)
+
+    def _finish_check(self, store, entry):
+        """The stored entry this process is still checking, back in its previous status; None if it was abandoned."""
+        for e in store["services"]:
+            if e["service"] == entry["service"] and e["status"] == "checking" and e.get("checked_by") == self.owner:
+                e.update(status=e["checked_from"], checked_by=None, check_expires=None, last_checked=time.time())
+                return e
+        return None
+
+    def lease(self):
+        """
+        Lease the oldest healthy service, health-checking candidates first.
+
+        Returns:
+            dict or None: The leased entry, or None when no service is healthy yet
+        """
+        checked = set()
+        while True:
+            with self._locked() as store:
+                self._expire(store, time.time())
+                candidate = self._start_check(store, ("ready", "warming"), checked, time.time())
+            if not candidate:
+                return None
+            checked.add(candidate["service"])
+            healthy = self.is_healthy(candidate)
+            with self._locked() as store:
+                entry = self._finish_check(store, candidate)
+                if not entry:
+                    continue
+                if not healthy:
+                    # Ready services that stop answering are broken; warming ones just need time
+                    if entry["status"] == "ready":
+                        entry["status"] = "unhealthy"
+                    continue
+                now = time.time()
+                entry.update(
+                    status="leased",
+                    leased_by=self.owner,
+                    lease_expires=now + SERVICE_POOL_LEASE_MINUTES * 60,
+                    uses=entry.get("uses", 0) + 1
+                )
+                return dict(entry)
+
+    def refresh(self):
+        """Health-check warming services and mark the healthy ones ready."""
+        checked = set()
+        while True:
+            with self._locked() as store:
+                self._expire(store, time.time())
+                candidate = self._start_check(store, ("warming",), checked, time.time())
+                if not candidate:
+                    return [dict(e) for e in store["services"]]
+            checked.add(candidate["service"])
+            healthy = self.is_healthy(candidate)
+            with self._locked() as store:
+                entry = self._finish_check(store, candidate)
+                if entry and healthy:
+                    entry["status"] = "ready"
+
+    def release(self, entry):
+        """Return a leased service; it is retired once it reaches SERVICE_POOL_MAX_USES."""
+        with self._locked() as store:
+            for e in store["services"]:
+                if e["service"] == entry["service"] and e.get("leased_by") == self.owner:
+                    retired = e.get("uses", 0) >= SERVICE_POOL_MAX_USES
+                    e.update(status="retired" if retired else "ready", leased_by=None, lease_expires=None)
+            self._expire(store, time.time())
+
+    def add(self, service, status="warming"):
+        """Record a newly provisioned service."""
+        with self._locked() as store:
+            store["services"].append({**service, "status": status, "created_at": time.time(), "uses": 0,
+                                      "leased_by": None, "lease_expires": None, "last_checked": None,
+                                      "checked_by": None, "check_expires": None})
+
+    # -------------------------------------------------------------------------
+    # Top-up
+    # -------------------------------------------------------------------------
+    def deficit(self):
+        """How many services must be provisioned to bring the pool back to `size`."""
+        return max(0, self.size - len(self.entries()))
+
+    def top_up(self, background=True):
+        """
+        Provision services until the pool holds `size` entries. New services start
+        as warming and become leasable once their health check passes.
+
+        Returns:
+            int: Number of services being provisioned
+        """
+        missing = self.deficit()
+        if not missing or (self._top_up_thread and self._top_up_thread.is_alive()):
+            return 0
+
+        def fill():
+            for _ in range(missing):
+                try:
+                    self.add(self.provision())
+                except AssertionError as e:
+                    print(f"   ⚠️ Pool top-up provisioning failed: {e}")
+
+        if background:
+            self._top_up_thread = threading.Thread(target=fill, name="service-pool-top-up", daemon=True)
+            self._top_up_thread.start()
+        else:
+            fill()
+        return missing
+
+    def wait_for_top_up(self, timeout=None):
+        """Block until a background top-up has finished provisioning."""
+        if self._top_up_thread:
+            self._top_up_thread.join(timeout)
@@ -0,0 +1,178 @@
+import threading
+import time
+import requests
+from utils.config import BASE_URL, tenantId, provision_poll_interval
+from utils.request_info import get_request_info
+
+# Downstream artifacts public-service-init provisions for a service, in the
+# order a new service needs them
+ARTIFACTS = ("roles", "actions", "idgen", "workflow", "checklists", "localization")
+
+CHECKLIST_SEARCH_URL = "/health-service-request/service/definition/v1/_search"
+
+
+def _headers(token):
+    return {"Content-Type": "application/json", "auth-token": token, "x-tenant-id": tenantId}
+
+
+def mdms_records(token, schema_code):
+    """Every active record of an MDMS v2 schema (id, uniqueIdentifier, data, ...); empty when the search fails."""
+    payload = {
+        "RequestInfo": get_request_info(token),
+        "MdmsCriteria": {"tenantId": tenantId, "schemaCode": schema_code, "isActive": True, "limit": 10000000}
+    }
+    res = requests.post(f"{BASE_URL}/egov-mdms-service/v2/_search", json=payload, headers={"Content-Type": "application/json"})
+    if res.status_code != 200:
+        return []
+    data = res.json()
+    return data.get("mdms") or data.get("Mdms") or []
+
+
+def mdms_search(token, schema_code):
+    """Every active record of an MDMS v2 schema (the `data` part); empty when the search fails."""
+    return [item.get("data", {}) for item in mdms_records(token, schema_code)]
+
+
+# Full-schema downloads shared by every check in one poll round: {schema_code: (taken_at, records)}
+_snapshots = {}
+_snapshot_locks = {}
+_snapshot_guard = threading.Lock()
+
+
+def schema_snapshot(token, schema_code, max_age=provision_poll_interval):
+    """
+    mdms_search shared across artifacts, services and threads.
+
+    The role/action/idgen schemas are large, so each is downloaded at most
+    once per `max_age` seconds (one poll round) however many services are
+    being polled; concurrent callers wait for the one download in flight.
+    """
+    with _snapshot_guard:
+        lock = _snapshot_locks.setdefault(schema_code, threading.Lock())
+    with lock:
+        taken, records = _snapshots.get(schema_code, (0, None))
+        if records is None or time.time() - taken >= max_age:
+            records = mdms_search(token, schema_code)
+            _snapshots[schema_code] = (time.time(), records)
+    return records
+
+
+def expected_artifacts(payload, module, service):
+    """
+    What a service provisioned from `payload` should expose once it is ready.
+
+    Args:
+        payload (dict): The MDMS service configuration that was published
+                        (placeholders already replaced)
+
+    Returns:
+        dict: {"states": [...], "checklists": [definition codes], "idgen": [idnames], "messages": [codes]}
+    """
+    data = payload["Mdms"]["data"]
+    states = [s["state"] for s in (data.get("workflow") or {}).get("states") or [] if s.get("state")]
+    checklists = [f"{service}.{c['state']}.{c['name']}" for c in data.get("checklist") or [] if c.get("state") and c.get("name")]
+    idgen = [i["idname"] for i in data.get("idgen") or [] if i.get("idname")]
+    messages = [m["code"] for m in (data.get("localization") or {}).get("messages") or [] if isinstance(m, dict) and m.get("code")]
+    return {"states": states, "checklists": checklists, "idgen": idgen, "messages": messages}
+
+
+# =============================================================================
+# Visibility checks: check(token, module, service, expected) -> True once visible
+# =============================================================================
+def _roles_visible(token, module, service, expected):
+    return any(
+        module.upper() in (r.get("code") or r.get("rolecode") or "").upper()
+        and service.upper() in (r.get("code") or r.get("rolecode") or "").upper()
+        for r in schema_snapshot(token, "ACCESSCONTROL-ROLES.roles")
+    )
+
+
+def _actions_visible(token, module, service, expected):
+    names = (module.lower(), service.lower())
+    return any(
+        any(n in (a.get("url") or "").lower() or n in (a.get("sidebarURL") or "").lower() for n in names)
+        for a in schema_snapshot(token, "ACCESSCONTROL-ACTIONS-TEST.actions-test")
+    )
+
+
+def _idgen_visible(token, module, service, expected):
+    found = {i.get("idname") or i.get("idName") for i in schema_snapshot(token, "common-masters.IdFormat")}
+    return bool(expected["idgen"]) and set(expected["idgen"]) <= found
+
+
+def _workflow_visible(token, module, service, expected):
+    url = (f"{BASE_URL}/egov-workflow-v2/egov-wf/businessservice/_search"
+           f"?tenantId={tenantId}&businessServices={module}.{service}")
+    res = requests.post(url, json={"RequestInfo": get_request_info(token)}, headers=_headers(token))
+    if res.status_code != 200:
+        return False
+    business_services = res.json().get("BusinessServices") or res.json().get("businessServices") or []
+    if not business_services:
+        return False
+    live = {s.get("state") for s in business_services[0].get("states") or []}
+    return set(expected["states"]) <= live
+
+
+def _checklists_visible(token, module, service, expected):
+    if not expected["checklists"]:
+        return True
+    payload = {
+        "ServiceDefinitionCriteria": {"code": expected["checklists"], "tenantId": tenantId},
+        "includeDeleted": True,
+        "RequestInfo": get_request_info(token)
+    }
+    res = requests.post(f"{BASE_URL}{CHECKLIST_SEARCH_URL}", json=payload, headers=_headers(token))
+    if res.status_code != 200:
+        return False
+    data = res.json()
+    definitions = data.get("ServiceDefinitions") or data.get("serviceDefinitions") or []
+    return set(expected["checklists"]) <= {d.get("code") for d in definitions}
+
+
+def _localization_visible(token, module, service, expected):
+    loc_module = f"rainmaker-studio-{module.lower()}"
+    url = f"{BASE_URL}/localization/messages/v1/_search?locale=en_IN&tenantId={tenantId}&module={loc_module}"
+    res = requests.post(url, json={"RequestInfo": get_request_info(token)}, headers=_headers(token))
+    if res.status_code != 200:
+        return False
+    codes = {m.get("code") for m in res.json().get("messages") or []}
+    return set(expected["messages"]) <= codes if expected["messages"] else bool(codes)
+
+
+ARTIFACT_CHECKS = {
+    "roles": _roles_visible,
+    "actions": _actions_visible,
+    "idgen": _idgen_visible,
+    "workflow": _workflow_visible,
+    "checklists": _checklists_visible,
+    "localization": _localization_visible
+}
+
+
+def check_artifacts(token, module, service, expected, artifacts=ARTIFACTS):
+    """One visibility check per artifact: {artifact: bool}."""
+    return {name: ARTIFACT_CHECKS[name](token, module, service, expected) for name in artifacts}
+
+
+def wait_until_ready(token, module, service, expected, since, timeout, interval, artifacts=ARTIFACTS):
+    """
+    Poll every artifact until it is visible or `timeout` runs out.
+
+    Args:
+        since (float): time.time() the provisioning call returned; ready times are measured from it
+
+    Returns:
+        dict: {artifact: seconds until first seen, or None if never seen}
+    """
+    ready = {}
+    pending = list(artifacts)
+    deadline = time.time() + timeout
+    while pending:
+        for name, visible in check_artifacts(token, module, service, expected, pending).items():
+            if visible:
+                ready[name] = round(time.time() - since, 3)
+                pending.remove(name)
+        if not pending or time.time() >= deadline:
+            break
+        time.sleep(interval)
+    return {name: ready.get(name) for name in artifacts}
@@ -0,0 +1,240 @@
+import os
+import re
+import time
+import requests
+from utils.config import BASE_URL, tenantId
+from utils.perf import RateLimiter, run_concurrently
+from utils.request_info import get_request_info
+from utils.service_readiness import mdms_records, expected_artifacts, CHECKLIST_SEARCH_URL
+
+CHECKLIST_DEF_UPDATE_URL = "/health-service-request/service/definition/v1/_update"
+LOCALIZATION_SEARCH_URL = "/localization/messages/v1/_search"
+LOCALIZATION_DELETE_URL = "/localization/messages/v1/_delete"
+# Same variable test_localization_search.py checks coverage for
+DEFAULT_LOCALES = tuple(l.strip() for l in os.getenv("LOCALIZATION_LOCALES", "en_IN").split(",") if l.strip())
+
+# Names produced by random_name("Module") / random_name("Service")
+MODULE_PATTERN = re.compile(r"^MODULE[A-Z0-9]{6}$")
+SERVICE_PATTERN = re.compile(r"^SERVICE[A-Z0-9]{6}$")
+
+ACTION_URL_PATTERN = re.compile(r"^/?([A-Za-z0-9]+)-services/")
+
+
+def _config_owner(data):
+    return (str(data.get("module") or "").upper(), str(data.get("service") or "").upper())
+
+
+def _role_owner(code):
+    parts = (code or "").upper().split("_")
+    return (parts[0], parts[1]) if len(parts) >= 3 else None
+
+
+def _idgen_owner(data):
+    prefix = (data.get("idname") or data.get("idName") or "").split(".")[0].upper()
+    module, _, service = prefix.partition("-")
+    return (module, service) if service else None
+
+
+def _action_owner(data):
+    match = ACTION_URL_PATTERN.match(data.get("url") or "")
+    return (None, match.group(1).upper()) if match else None
+
+
+# MDMS schemas holding per-service records, and how to read the upper-cased
+# (module, service) out of a record's data by naming convention; None when it
+# is not per-service. Only sweep mode relies on these conventions.
+MDMS_SCHEMAS = {
+    "Studio.ServiceConfigurationDrafts": _config_owner,
+    "Studio.ServiceConfiguration": _config_owner,
+    "ACCESSCONTROL-ROLES.roles": lambda data: _role_owner(data.get("code") or data.get("rolecode")),
+    "ACCESSCONTROL-ROLEACTIONS.roleactions": lambda data: _role_owner(data.get("rolecode") or data.get("roleCode")),
+    "ACCESSCONTROL-ACTIONS-TEST.actions-test": _action_owner,
+    "common-masters.IdFormat": _idgen_owner
+}
+
+# Recorded services are matched the way the verifiers (test_roles_search.py,
+# test_actions_roleactions_search.py, service_readiness) find their artifacts:
+# schema -> (data fields to search, True when both module and service must be
+# substrings, False when either is enough). Configurations carry exact names.
+SUBSTRING_MATCH = {
+    "ACCESSCONTROL-ROLES.roles": (("code", "rolecode"), True),
+    "ACCESSCONTROL-ROLEACTIONS.roleactions": (("rolecode", "roleCode"), True),
+    "ACCESSCONTROL-ACTIONS-TEST.actions-test": (("url", "sidebarURL"), False),
+    "common-masters.IdFormat": (("idname", "idName"), True)
+}
+
+
+def _substring_owner(schema_code, data, targets):
+    """First recorded (module, service) whose names appear in the record the way the verifiers match them."""
+    fields, both = SUBSTRING_MATCH[schema_code]
+    text = " ".join(str(data.get(f) or "") for f in fields).upper()
+    if not text.strip():
+        return None
+    for module, service in targets:
+        if (module in text and service in text) if both else (module in text or service in text):
+            return module, service
+    return None
+
+
+def _headers(token):
+    return {"Content-Type": "application/json", "auth-token": token, "x-tenant-id": tenantId}
+
+
+def _created_time(record):
+    return ((record.get("auditDetails") or {}).get("createdTime") or 0) / 1000
+
+
+# =============================================================================
+# Planning: which records belong to which service
+# =============================================================================
+def plan_teardown(token, services=None, sweep=False, min_age_hours=24, keep=()):
+    """
+    Build the list of teardown tasks.
+
+    Each per-service MDMS schema is downloaded once. Recorded services are
+    matched by name substrings like the verifiers do; sweep mode additionally
+    parses orphan owners from the naming conventions in MDMS_SCHEMAS.
+
+    Args:
+        services (list): [{"module", "service"}, ...] recorded by runs
+        sweep (bool): Also tear down any Module??????/Service?????? orphans
+        min_age_hours (float): Sweep only records at least this old (skips in-flight runs)
+        keep (iterable): (module, service) pairs never to touch, e.g. the warm pool
+
+    Returns:
+        tuple: (tasks, unmatched) - task dicts {"kind", "module", "service", ...}
+               for execute_teardown, and the schemas where no record matched a
+               recorded service
+    """
+    keep = {(m.upper(), s.upper()) for m, s in keep}
+    targets = {(s["module"].upper(), s["service"].upper()) for s in services or []} - keep
+    by_service = {service: module for module, service in targets}
+    oldest = time.time() - min_age_hours * 3600
+
+    def swept(owner, record):
+        """(module, service) of an orphan matching the sweep conventions, else None."""
+        if not sweep or not owner:
+            return None
+        module, service = owner
+        if module is None:
+            # Actions only carry the service name; configurations seen so far give the module
+            module = by_service.get(service)
+        if (module is None or MODULE_PATTERN.match(module)) and SERVICE_PATTERN.match(service) \
+                and (module, service) not in keep and _created_time(record) < oldest:
+            return module, service
+        return None
+
+    tasks, configs, matched = [], {}, {}
+    for schema_code, read_owner in MDMS_SCHEMAS.items():
+        matched[schema_code] = 0
+        for record in mdms_records(token, schema_code):
+            data = record.get("data") or {}
+            if schema_code in SUBSTRING_MATCH:
+                owner = _substring_owner(schema_code, data, targets)
+            else:
+                owner = _config_owner(data) if _config_owner(data) in targets else None
+            if owner:
+                matched[schema_code] += 1
+            else:
+                owner = swept(read_owner(data), record)
+            if not owner:
+                continue
+            tasks.append({"kind": "mdms", "schema_code": schema_code, "module": owner[0], "service": owner[1],
+                          "record": record})
+            by_service.setdefault(owner[1], owner[0])
+            if schema_code == "Studio.ServiceConfiguration":
+                configs[owner] = record
+
+    # Checklist definitions and localization are found through the published configuration
+    for (module, service), record in configs.items():
+        data = record.get("data") or {}
+        expected = expected_artifacts({"Mdms": {"data": data}}, data.get("module"), data.get("service"))
+        if expected["checklists"]:
+            tasks.append({"kind": "checklists", "module": module, "service": service, "codes": expected["checklists"]})
+        tasks.append({"kind": "localization", "module": module, "service": service,
+                      "loc_module": f"rainmaker-studio-{str(data.get('module')).lower()}"})
+
+    unmatched = [schema for schema, count in matched.items() if targets and not count]
+    return tasks, unmatched
+
+
+# =============================================================================
+# Execution
+# =============================================================================
+def _deactivate_mdms(token, task):
+    record = task["record"]
+    payload = {"Mdms": {**record, "isActive": False}, "RequestInfo": get_request_info(token)}
+    res = requests.post(f"{BASE_URL}/egov-mdms-service/v2/_update/{task['schema_code']}", json=payload,
+                        headers={"Content-Type": "application/json"})
+    return res.status_code in (200, 201, 202), res.status_code
+
+
+def _deactivate_checklists(token, task):
+    search = {
+        "ServiceDefinitionCriteria": {"code": task["codes"], "tenantId": tenantId},
+        "RequestInfo": get_request_info(token)
+    }
+    res = requests.post(f"{BASE_URL}{CHECKLIST_SEARCH_URL}", json=search, headers=_headers(token))
+    if res.status_code != 200:
+        return False, res.status_code
+    definitions = res.json().get("ServiceDefinitions") or res.json().get("serviceDefinitions") or []
+    statuses = []
+    for definition in definitions:
+        if definition.get("isActive") is False:
+            continue
+        payload = {"ServiceDefinition": {**definition, "isActive": False}, "RequestInfo": get_request_info(token)}
+        statuses.append(requests.post(f"{BASE_URL}{CHECKLIST_DEF_UPDATE_URL}", json=payload, headers=_headers(token)).status_code)
+    return all(s in (200, 201, 202) for s in statuses), statuses
+
+
+def _delete_localization(token, task, locales=DEFAULT_LOCALES):
+    messages = []
+    for locale in locales:
+        url = f"{BASE_URL}{LOCALIZATION_SEARCH_URL}?locale={locale}&tenantId={tenantId}&module={task['loc_module']}"
+        res = requests.post(url, json={"RequestInfo": get_request_info(token)}, headers=_headers(token))
+        if res.status_code == 200:
+            messages.extend({"code": m["code"], "module": task["loc_module"], "locale": m.get("locale", locale)}
+                            for m in res.json().get("messages") or [])
+    if not messages:
+        return True, "none"
+    payload = {"RequestInfo": get_request_info(token), "tenantId": tenantId, "messages": messages}
+    res = requests.post(f"{BASE_URL}{LOCALIZATION_DELETE_URL}", json=payload, headers=_headers(token))
+    return res.status_code in (200, 201, 202), res.status_code
+
+
+def default_handlers(token, locales=DEFAULT_LOCALES):
+    """
+    kind -> handler(task) -> (ok, detail) for the task kinds plan_teardown produces.
+
+    Args:
+        locales (iterable): Locales whose localization messages are deleted
+    """
+    return {
+        "mdms": lambda task: _deactivate_mdms(token, task),
+        "checklists": lambda task: _deactivate_checklists(token, task),
+        "localization": lambda task: _delete_localization(token, task, locales)
+    }
+
+
+def execute_teardown(tasks, handlers, concurrency, rate=0):
+    """
+    Run every task on a thread pool, at most `rate` task starts per second.
+
+    Returns:
+        tuple: (results, wall_seconds) - one {"kind", "module", "service", "ok", "detail"} per task
+    """
+    limiter = RateLimiter(rate)
+
+    def run(task):
+        limiter.wait()
+        ok, detail = handlers[task["kind"]](task)
+        return {"ok": ok, "detail": detail}
+
+    outcomes, wall = run_concurrently(run, tasks, concurrency)
+    results = []
+    for task, outcome in zip(tasks, outcomes):
+        if outcome.get("success") is False:
+            outcome = {"ok": False, "detail": outcome["error"]}
+        label = task.get("schema_code") or task["kind"]
+        results.append({"kind": label, "module": task.get("module"), "service": task.get("service"), **outcome})
+    return results, wall
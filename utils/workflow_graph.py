@@ -0,0 +1,115 @@
+from collections import deque
+
+START = "START"
+
+
+def build_state_graph(states):
+    """
+    Build a transition graph from businessservice states.
+
+    Live workflow definitions reference nextState by state uuid while the MDMS
+    configuration uses state names, so both are accepted. The start state
+    (state null / isStartState) is named START.
+
+    Returns:
+        dict: {
+            "start": START,
+            "edges": [(from_state, action, to_state), ...],
+            "terminal": set of terminal state names
+        }
+    """
+    def state_name(s):
+        return START if s.get("isStartState") or not s.get("state") else s.get("state")
+
+    by_uuid = {s.get("uuid"): state_name(s) for s in states if s.get("uuid")}
+
+    edges = []
+    terminal = set()
+    for s in states:
+        name = state_name(s)
+        if s.get("isTerminateState"):
+            terminal.add(name)
+        for a in s.get("actions") or []:
+            next_state = a.get("nextState")
+            edges.append((name, a.get("action"), by_uuid.get(next_state, next_state)))
+
+    return {"start": START, "edges": edges, "terminal": terminal}
+
+
+def _shortest_prefix(edges, start, target):
+    """Shortest list of edges leading from start to target (BFS), or None."""
+    if start == target:
+        return []
+    queue = deque([start])
+    came_from = {start: None}
+    while queue:
+        node = queue.popleft()
+        for edge in edges:
+            if edge[0] == node and edge[2] not in came_from:
+                came_from[edge[2]] = edge
+                if edge[2] == target:
+                    path = []
+                    while came_from[target]:
+                        path.append(came_from[target])
+                        target = came_from[target][0]
+                    return path[::-1]
+                queue.append(edge[2])
+    return None
+
+
+def transition_path_cover(graph):
+    """
+    Compute a small set of action paths from START that together take every
+    transition at least once.
+
+    Greedy: each path walks the shortest way to an untaken transition and then
+    keeps taking untaken transitions, preferring ones that lead to states with
+    more untaken transitions so a single path covers cycles (e.g. ASSIGN →
+    REASSIGN → REJECT) before ending in a terminal state.
+
+    Returns:
+        tuple: (paths, unreachable) where each path is a list of
+               (from_state, action, to_state) and unreachable lists edges that
+               cannot be reached from START.
+    """
+    edges = graph["edges"]
+    start = graph["start"]
+    uncovered = list(edges)
+    paths, unreachable = [], []
+
+    def pending_from(state):
+        return [e for e in uncovered if e[0] == state]
+
+    while uncovered:
+        reachable = []
+        for e in list(uncovered):
+            prefix = _shortest_prefix(edges, start, e[0])
+            if prefix is None:
+                uncovered.remove(e)
+                unreachable.append(e)
+            else:
+                reachable.append((len(prefix), -len(pending_from(e[2])), prefix, e))
+        if not reachable:
+            break
+
+        # Closest untaken transition first; prefer the one opening up more untaken transitions
+        _, _, prefix, target = min(reachable, key=lambda r: (r[0], r[1]))
+
+        path = prefix + [target]
+        for e in path:
+            if e in uncovered:
+                uncovered.remove(e)
+
+        current = target[2]
+        while True:
+            candidates = pending_from(current)
+            if not candidates:
+                break
+            step = max(candidates, key=lambda e: len(pending_from(e[2])))
+            uncovered.remove(step)
+            path.append(step)
+            current = step[2]
+
+        paths.append(path)
+
+    return paths, unreachable
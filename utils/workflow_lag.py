@@ -0,0 +1,80 @@
+import fcntl
+import json
+import os
+import time
+from utils.config import workflow_wait_timeout, workflow_poll_interval
+from utils.perf import summarize_latencies
+from utils.process_instance_tracker import get_tracker
+
+# One JSON line per sample, {"transition", "lag", "timestamp"}, kept across runs
+WORKFLOW_LAG_FILE = "output/workflow_lag.jsonl"
+WORKFLOW_LAG_REPORT_FILE = "output/workflow_lag_distribution.json"
+
+
+def load_lag_samples():
+    """Load recorded lag samples: {transition: [seconds, ...]}."""
+    samples = {}
+    try:
+        lines = open(WORKFLOW_LAG_FILE, encoding="utf-8").read().splitlines()
+    except FileNotFoundError:
+        return samples
+    for line in lines:
+        try:
+            sample = json.loads(line)
+        except json.JSONDecodeError:
+            # A line another process is still writing
+            continue
+        samples.setdefault(sample["transition"], []).append(sample["lag"])
+    return samples
+
+
+def record_lag(transition, seconds):
+    """Append one lag sample for a transition; one locked write, so parallel workers never lose samples."""
+    line = json.dumps({"transition": transition, "lag": round(seconds, 3), "timestamp": time.time()}) + "\n"
+    os.makedirs("output", exist_ok=True)
+    fd = os.open(WORKFLOW_LAG_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        os.write(fd, line.encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
+def lag_distribution():
+    """Lag summary (count/avg/p50/p95/p99/...) per transition."""
+    return {transition: summarize_latencies(values) for transition, values in load_lag_samples().items()}
+
+
+def save_lag_distribution(path=WORKFLOW_LAG_REPORT_FILE):
+    """Write the per-transition lag distribution to a report file and return it."""
+    distribution = lag_distribution()
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.tmp"
+    json.dump(distribution, open(tmp, "w"), indent=2)
+    os.replace(tmp, path)
+    return distribution
+
+
+def probe_transition(application_number, business_service, action, expected_state, completed_at):
+    """
+    Poll the process instance until `expected_state` appears and record the lag
+    since the application write completed.
+
+    Args:
+        completed_at (float): time.time() taken right after the POST/PUT returned
+
+    Returns:
+        dict: transition, reached flag and observed lag in seconds
+    """
+    transition = f"{action} -> {expected_state}"
+    tracker = get_tracker(application_number, business_service)
+    reached = tracker.wait_for_state(expected_state, workflow_wait_timeout, workflow_poll_interval)
+    lag = time.time() - completed_at
+
+    if reached:
+        record_lag(transition, lag)
+        print(f"   ⏱️ {transition} visible in process instance after {lag:.2f}s")
+    else:
+        print(f"   ⚠️ {transition} not visible after {workflow_wait_timeout}s (current: {tracker.current_state})")
+
+    return {"transition": transition, "reached": reached, "lag": round(lag, 3)}